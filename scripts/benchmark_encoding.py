@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Encoding Benchmark
+
+This script compares the per-character punch pattern path against the
+table-driven and NumPy deck encoders in src/core/hollerith.py.
+
+Usage:
+    python scripts/benchmark_encoding.py                      # 20,000 random messages
+    python scripts/benchmark_encoding.py --messages 100000
+    python scripts/benchmark_encoding.py --history message_history.json
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+# Make the project importable when run from any directory
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.hollerith import (CHAR_MAPPING, ROWS, COLUMNS, NUMPY_AVAILABLE,
+                                encode_many, encode_deck)
+from src.core.message_database import MessageDatabase
+
+def per_char_deck(messages):
+    """Build every card grid one character at a time, as char_to_led_pattern did."""
+    deck = []
+    for message in messages:
+        grid = [[0 for _ in range(COLUMNS)] for _ in range(ROWS)]
+        for col, char in enumerate(message.ljust(COLUMNS)[:COLUMNS]):
+            pattern = CHAR_MAPPING.get(char.upper(), [0] * ROWS)
+            for row, is_punched in enumerate(list(pattern)):
+                grid[row][col] = is_punched
+        deck.append(grid)
+    return deck
+
+def table_deck(messages):
+    """Encode every card into packed column codes with the lookup table."""
+    return encode_many(messages, width=COLUMNS)
+
+def numpy_deck(messages):
+    """Encode the whole deck into an (N, 12, 80) tensor in one call."""
+    return encode_deck(messages, COLUMNS)
+
+def load_messages(args):
+    """Load messages from a history file or generate random ones."""
+    if args.history:
+        database = MessageDatabase(args.history)
+        return [record.content for record in database.messages]
+
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .,-+*/=()$@#%&"
+    rng = random.Random(args.seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(10, COLUMNS)))
+            for _ in range(args.messages)]
+
+def run_benchmark(name, func, messages, repeat):
+    """Time a deck encoder and print the best run."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(messages)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    rate = len(messages) / best if best else float('inf')
+    print(f"{name:<24} {best * 1000:10.1f} ms  {rate:12,.0f} cards/s")
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark punch card deck encoding")
+    parser.add_argument("--messages", type=int, default=20000, help="Number of random messages")
+    parser.add_argument("--history", help="Message history JSON file to encode instead")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per encoder (best is reported)")
+    parser.add_argument("--seed", type=int, default=1890, help="Random seed for generated messages")
+    args = parser.parse_args()
+
+    messages = load_messages(args)
+    print(f"Encoding {len(messages):,} cards ({COLUMNS} columns)\n")
+
+    baseline = run_benchmark("per-character", per_char_deck, messages, args.repeat)
+    table = run_benchmark("table (array)", table_deck, messages, args.repeat)
+    print(f"{'':<24} speedup {baseline / table:6.1f}x")
+
+    if NUMPY_AVAILABLE:
+        vectorized = run_benchmark("numpy (N, 12, 80)", numpy_deck, messages, args.repeat)
+        print(f"{'':<24} speedup {baseline / vectorized:6.1f}x")
+    else:
+        print("NumPy not installed - skipping vectorized encoder")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Deck Import
+
+This script streams a legacy deck (80-column card-image text or IBM column
+binary) into a column-binary deck file, the SQLite database, or the JSON
+message history.
+
+The deck file (--deck) and SQLite (--db, batched executemany inserts) are
+written one card or one batch at a time, so they import decks of millions
+of cards in constant memory. The JSON history (--history) is held in memory
+and rewritten as a whole, so it suits smaller decks.
+
+Usage:
+    python scripts/import_deck.py legacy.txt --history message_history.json
+    python scripts/import_deck.py legacy.cbn --binary --deck history.deck
+    python scripts/import_deck.py legacy.cbn --binary --db punch_card.db --deck history.deck
+    python scripts/import_deck.py legacy.txt --deck history.deck --code-page 029
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Make the project importable when run from any directory
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.card_io import (DEFAULT_BATCH_SIZE, RejectedCardsError, read_card_images,
+                              read_column_binary, encode_cards, import_to_database)
+from src.core.code_pages import get_code_page
+from src.core.deck_file import DeckWriter
+from src.core.message_database import MessageDatabase
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream a legacy punch card deck into the project")
+    parser.add_argument("source", help="Card-image text file, or column-binary file with --binary")
+    parser.add_argument("--binary", action="store_true", help="Source is IBM column binary (160 bytes per card)")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--history", help="Message history JSON file to add the cards to (held in memory)")
+    target.add_argument("--db", help="SQLite database file to bulk-insert the cards into")
+    parser.add_argument("--deck", help="Column-binary deck file to append the cards to")
+    parser.add_argument("--code-page", default=None, help="Code page for encoding/decoding (default: legacy)")
+    parser.add_argument("--source-name", default="Imported", help="Source recorded in the message history")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Cards per SQLite transaction with --db (default: {DEFAULT_BATCH_SIZE})")
+    args = parser.parse_args()
+
+    if not args.history and not args.db and not args.deck:
+        parser.error("nothing to do: give --history or --db, and/or --deck")
+
+    code_page = get_code_page(args.code_page)
+    database = MessageDatabase(args.history) if args.history else None
+    deck = DeckWriter(args.deck) if args.deck else None
+    if database:
+        first_number = database.current_message_number + 1
+    elif deck:
+        # Continue the deck's own numbering so its index stays unambiguous
+        first_number = max(deck.last_message_number or 0, deck.count) + 1
+    else:
+        first_number = 1
+
+    # read -> (decode/encode) -> store, one card at a time
+    if args.binary:
+        cards = read_column_binary(args.source)
+    else:
+        cards = encode_cards(read_card_images(args.source), code_page=code_page)
+
+    def stored_texts():
+        for number, codes in enumerate(cards, start=first_number):
+            if deck:
+                deck.append(codes, number)
+            yield code_page.decode_columns(codes).rstrip()
+
+    start = time.perf_counter()
+    rejected = None
+    try:
+        if database:
+            count = len(database.add_messages(stored_texts(), source=args.source_name))
+        elif args.db:
+            from src.core.database import Database
+            sqlite = Database(db_path=args.db)
+            try:
+                count = import_to_database(sqlite, stored_texts(), batch_size=args.batch_size)
+            except RejectedCardsError as e:
+                count, rejected = e.imported, e
+            finally:
+                sqlite.close()
+        else:
+            count = sum(1 for _ in stored_texts())
+    finally:
+        if deck:
+            deck.close()
+    elapsed = time.perf_counter() - start
+
+    rate = count / elapsed if elapsed else float('inf')
+    print(f"Imported {count:,} cards in {elapsed:.2f}s ({rate:,.0f} cards/s)")
+    if rejected:
+        print(f"⚠️ {rejected}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
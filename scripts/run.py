@@ -8,8 +8,10 @@ This script serves as the main entry point for the Punch Card application.
 
 import os
 import sys
+import time
 import argparse
 import logging
+from contextlib import nullcontext
 from datetime import datetime
 
 # Configure logging
@@ -52,6 +54,14 @@ def parse_arguments():
     parser.add_argument('--terminal', action='store_true', help='Run in terminal mode')
     parser.add_argument('--gui', action='store_true', help='Run in GUI mode (default)')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    parser.add_argument('--bench-render', action='store_true',
+                        help='Benchmark terminal rendering headlessly (no sleeps, no tty) and exit')
+    parser.add_argument('--bench-gui', action='store_true',
+                        help='Benchmark GUI painting under the offscreen Qt platform and exit')
+    parser.add_argument('--bench-messages', type=int, default=20,
+                        help='Number of messages for --bench-render/--bench-gui (default: 20)')
+    parser.add_argument('--fast-forward', metavar='FILE',
+                        help='Process messages from FILE (one per line, - for stdin) with no animations or delays, then exit')
     
     return parser.parse_args()
 
@@ -85,6 +95,37 @@ def show_version():
             logger.error("Could not determine version information")
             return False
 
+def run_fast_forward(path: str) -> int:
+    """
+    Push messages through the full pipeline without animations or delays.
+    
+    Args:
+        path: Text file with one message per line, or - for stdin
+        
+    Returns:
+        Number of messages processed
+    """
+    from src.core.punch_card import PunchCard
+    
+    card = PunchCard(skip_splash=True, fast_forward=True)
+    count = 0
+    start = time.perf_counter()
+    try:
+        with (nullcontext(sys.stdin) if path == '-' else open(path, encoding='utf-8')) as source:
+            for line in source:
+                message = line.rstrip('\n')
+                if message.strip():
+                    card.show_message(message, "Imported")
+                    count += 1
+    finally:
+        # Save what was processed even if the backfill is interrupted
+        card.flush()
+    elapsed = time.perf_counter() - start
+    
+    rate = count / elapsed if elapsed else float('inf')
+    print(f"Processed {count:,} messages in {elapsed:.2f}s ({rate:,.0f} messages/s)")
+    return count
+
 def main():
     """
     Main entry point for the application.
@@ -107,6 +148,26 @@ def main():
         else:
             return 1
     
+    # Run the headless render benchmark if requested
+    if args.bench_render:
+        from src.utils.render_benchmark import run_render_benchmark, random_messages, format_report
+        print(f"Rendering {args.bench_messages} messages headlessly...\n")
+        print(format_report(run_render_benchmark(random_messages(args.bench_messages))))
+        return 0
+    
+    # Run the offscreen GUI paint benchmark if requested
+    if args.bench_gui:
+        from src.utils.gui_benchmark import run_gui_benchmark, format_gui_report
+        from src.utils.render_benchmark import random_messages
+        print(f"Painting {args.bench_messages} messages offscreen...\n")
+        print(format_gui_report(run_gui_benchmark(random_messages(args.bench_messages))))
+        return 0
+    
+    # Backfill messages without animations if requested
+    if args.fast_forward:
+        run_fast_forward(args.fast_forward)
+        return 0
+    
     # Import the main module and start the application
     try:
         if args.terminal:
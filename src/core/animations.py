@@ -0,0 +1,138 @@
+"""
+Precompiled Animations for the Punch Card Project.
+
+The splash, wave and slide effects used to be recomputed cell by cell on
+every tick. This module compiles each effect once per card size into
+compact keyframes and caches them, so playing one back is just a lookup:
+
+- Mask steps: for each step, the columns it touches and the bits it punches
+  and clears. A step is applied on top of whatever the card shows, which is
+  what the GUI splash needs.
+- Wave keyframes: frozen (revealed, punched) CardGrid pairs for the
+  terminal hole-filling wave, along with its text frames.
+- Slide offsets: the column shift for each step of the save transition.
+
+Keyframes are plain CardGrids and column codes, so the same data can drive
+the terminal, the GUI and an LED controller.
+
+Usage:
+    from src.core.animations import splash_steps, apply_step
+
+    for step in splash_steps(12, 80):
+        apply_step(grid, step)
+"""
+
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+from src.core.card_grid import CardGrid, FrozenCardGrid
+
+# Width of the wave in diagonals: holes appear, then are punched this many
+# steps later, then empty again the same number of steps after that
+WAVE_WIDTH = 12
+
+class MaskStep(NamedTuple):
+    """One animation step: for each listed column, bits to punch and to clear."""
+    columns: Tuple[int, ...]
+    punch: Tuple[int, ...]
+    clear: Tuple[int, ...]
+
+class WaveFrame(NamedTuple):
+    """One frame of the hole-filling wave."""
+    revealed: FrozenCardGrid  # Holes drawn at all (empty or punched)
+    punched: FrozenCardGrid   # Holes drawn punched
+
+@lru_cache(maxsize=None)
+def diagonal(rows: int, columns: int, index: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Get the (column, bit) pairs of one anti-diagonal (row + column == index).
+
+    Returns:
+        Column and row bit for each cell on the diagonal, empty if it is off the card
+    """
+    first = max(0, index - rows + 1)
+    last = min(columns - 1, index)
+    return tuple((col, 1 << (index - col)) for col in range(first, last + 1))
+
+def diagonal_count(rows: int, columns: int) -> int:
+    """Number of anti-diagonals on a card."""
+    return rows + columns - 1
+
+def _mask_step(rows: int, columns: int, punch=(), clear=()) -> MaskStep:
+    """Build a MaskStep from the diagonals to punch and to clear."""
+    masks = {}
+    for index in punch:
+        for col, bit in diagonal(rows, columns, index):
+            masks.setdefault(col, [0, 0])[0] |= bit
+    for index in clear:
+        for col, bit in diagonal(rows, columns, index):
+            masks.setdefault(col, [0, 0])[1] |= bit
+    cols = tuple(sorted(masks))
+    return MaskStep(cols, tuple(masks[c][0] for c in cols), tuple(masks[c][1] for c in cols))
+
+def apply_step(grid: CardGrid, step: MaskStep) -> int:
+    """
+    Apply a mask step to a grid.
+
+    Returns:
+        Number of columns that changed
+    """
+    changed = 0
+    for col, punch, clear in zip(step.columns, step.punch, step.clear):
+        changed += grid.set_column(col, (grid.get_column(col) & ~clear) | punch)
+    return changed
+
+@lru_cache(maxsize=None)
+def splash_steps(rows: int, columns: int) -> Tuple[MaskStep, ...]:
+    """
+    Compile the GUI splash animation.
+
+    Phase 1 clears the card one diagonal at a time. Phase 2 sweeps a band of
+    punched holes WAVE_WIDTH diagonals wide across it. Phase 3 clears the
+    end of the band.
+    """
+    total = diagonal_count(rows, columns)
+    steps = [_mask_step(rows, columns, clear=(d,)) for d in range(total)]
+    steps += [_mask_step(rows, columns, punch=(d,), clear=(d - WAVE_WIDTH,) if d >= WAVE_WIDTH else ())
+              for d in range(total)]
+    steps += [_mask_step(rows, columns, clear=(total - WAVE_WIDTH + k,)) for k in range(WAVE_WIDTH)]
+    return tuple(steps)
+
+@lru_cache(maxsize=None)
+def hole_wave(rows: int, columns: int) -> Tuple[WaveFrame, ...]:
+    """
+    Compile the terminal hole-filling wave.
+
+    Each frame reveals one more diagonal of empty holes. The diagonal
+    WAVE_WIDTH steps behind is punched, and the one 2 * WAVE_WIDTH behind is
+    emptied again.
+    """
+    total = diagonal_count(rows, columns)
+    revealed = CardGrid(rows, columns)
+    punched = CardGrid(rows, columns)
+    frames = []
+    for d in range(total + 2 * WAVE_WIDTH):
+        apply_step(revealed, _mask_step(rows, columns, punch=(d,)))
+        apply_step(punched, _mask_step(rows, columns, punch=(d - WAVE_WIDTH,), clear=(d - 2 * WAVE_WIDTH,)))
+        frames.append(WaveFrame(revealed.freeze(), punched.freeze()))
+    return tuple(frames)
+
+@lru_cache(maxsize=None)
+def hole_wave_text(rows: int, columns: int, punched: str = "█", empty: str = "□",
+                   hidden: str = " ") -> Tuple[Tuple[str, ...], ...]:
+    """Get the rows of every hole-wave frame as text, one string per card row."""
+    symbols = (hidden, hidden, empty, punched)  # Indexed by revealed * 2 + punched
+    frames = []
+    for frame in hole_wave(rows, columns):
+        lines = []
+        for row in range(rows):
+            shown = frame.revealed.row_bits(row)
+            hit = frame.punched.row_bits(row)
+            lines.append("".join(symbols[s * 2 + h] for s, h in zip(shown, hit)))
+        frames.append(tuple(lines))
+    return tuple(frames)
+
+@lru_cache(maxsize=None)
+def slide_offsets(columns: int, steps: int) -> Tuple[int, ...]:
+    """Get the column offset for each step of the slide-left transition."""
+    return tuple(int(step / steps * columns) for step in range(steps))
@@ -0,0 +1,296 @@
+"""
+Packed Card Grid for the Punch Card Project.
+
+CardGrid stores a punch card as one uint16 column code per column (80
+columns = 160 bytes) instead of 12 lists of Python ints/bools. Column codes
+use the same bit layout as the Hollerith encoder:
+
+    bit 0 = row 12, bit 1 = row 11, bit 2 = row 0, bit 3 = row 1 ... bit 11 = row 9
+
+so an encoded message can be written a whole column at a time. Snapshots are
+copy-on-write: taking one is O(1) and the 160-byte buffer is only copied when
+either side is next written, which makes grids cheap to keep as the previous
+frame.
+
+Frames handed to another thread should be frozen. freeze() returns a
+read-only FrozenCardGrid sharing the buffer, and it is cached until the grid
+is next written, so freezing an unchanged grid returns the same object. Call
+freeze() from the thread that writes the grid. The consumer can never see a
+later write, and an unchanged frame is recognized by identity.
+
+Usage:
+    from src.core.card_grid import CardGrid
+
+    grid = CardGrid()
+    grid[0, 5] = True             # row 12, column 6
+    grid.set_column(6, code)      # write a whole encoded column
+    previous = grid.snapshot()    # O(1) copy-on-write copy
+    frame = grid.freeze()         # O(1) read-only copy for another thread
+    changes = previous.diff(grid) # [(row, col, state), ...] that changed
+"""
+
+from array import array
+from operator import xor
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from src.core.hollerith import ROWS, COLUMNS, BLANK
+
+def _changed_rows(changed: int, code: int) -> List[Tuple[int, bool]]:
+    """Unpack the set bits of an XOR mask into (row, new state) pairs."""
+    rows = []
+    while changed:
+        low = changed & -changed
+        rows.append((low.bit_length() - 1, bool(code & low)))
+        changed ^= low
+    return rows
+
+class CardGrid:
+    """A rows x columns punch card grid packed into uint16 column codes."""
+
+    __slots__ = ("rows", "columns", "_codes", "_shared", "_frozen")
+
+    def __init__(self, rows: int = ROWS, columns: int = COLUMNS,
+                 codes: Optional[Iterable[int]] = None):
+        """
+        Initialize a blank grid, or one holding the given column codes.
+
+        Args:
+            rows: Number of rows (at most 16; punch cards use 12)
+            columns: Number of columns
+            codes: Optional column codes, one per column
+        """
+        if not 0 < rows <= 16:
+            raise ValueError(f"CardGrid supports 1-16 rows, got {rows}")
+        self.rows = rows
+        self.columns = columns
+        self._shared = False
+        self._frozen = None
+        if codes is None:
+            self._codes = array('H', [BLANK]) * columns
+        else:
+            mask = (1 << rows) - 1
+            self._codes = array('H', (code & mask for code in codes))
+            if len(self._codes) != columns:
+                raise ValueError(f"Expected {columns} column codes, got {len(self._codes)}")
+
+    @classmethod
+    def from_codes(cls, codes: Sequence[int], rows: int = ROWS) -> 'CardGrid':
+        """Create a grid from a sequence of column codes."""
+        return cls(rows, len(codes), codes)
+
+    @classmethod
+    def from_rows(cls, grid: Sequence[Sequence[Any]]) -> 'CardGrid':
+        """Create a grid from a row-major list of lists of punch states."""
+        rows = len(grid)
+        columns = len(grid[0]) if rows else 0
+        card = cls(max(rows, 1), columns)
+        codes = card._codes
+        for row, states in enumerate(grid):
+            bit = 1 << row
+            for col, punched in enumerate(states[:columns]):
+                if punched:
+                    codes[col] |= bit
+        return card
+
+    def _own(self):
+        """Take a private copy of the buffer before writing to a shared one."""
+        if self._shared:
+            self._codes = array('H', self._codes)
+            self._shared = False
+            self._frozen = None
+
+    # ----- Cell access -----
+
+    def get(self, row: int, col: int) -> bool:
+        """Get whether the hole at (row, col) is punched."""
+        return bool((self._codes[col] >> row) & 1) if 0 <= row < self.rows else False
+
+    def set(self, row: int, col: int, state: Any) -> bool:
+        """
+        Set the hole at (row, col).
+
+        Returns:
+            True if the hole changed state
+        """
+        if not 0 <= row < self.rows:
+            raise IndexError(f"Row {row} out of range for {self.rows}-row grid")
+        code = self._codes[col]
+        bit = 1 << row
+        new_code = (code | bit) if state else (code & ~bit)
+        if new_code == code:
+            return False
+        self._own()
+        self._codes[col] = new_code
+        return True
+
+    def __getitem__(self, key: Tuple[int, int]) -> bool:
+        """Get a hole with grid[row, col]."""
+        if not isinstance(key, tuple):
+            raise TypeError("CardGrid is indexed as grid[row, col]")
+        return self.get(*key)
+
+    def __setitem__(self, key: Tuple[int, int], state: Any):
+        """Set a hole with grid[row, col] = state."""
+        if not isinstance(key, tuple):
+            raise TypeError("CardGrid is indexed as grid[row, col]")
+        self.set(key[0], key[1], state)
+
+    # ----- Column access -----
+
+    def get_column(self, col: int) -> int:
+        """Get the column code for a column."""
+        return self._codes[col]
+
+    def set_column(self, col: int, code: int) -> bool:
+        """
+        Write a whole column code at once.
+
+        Returns:
+            True if the column changed
+        """
+        code &= (1 << self.rows) - 1
+        if self._codes[col] == code:
+            return False
+        self._own()
+        self._codes[col] = code
+        return True
+
+    @property
+    def codes(self) -> memoryview:
+        """Read-only uint16 view of the column codes (buffer protocol)."""
+        return memoryview(self._codes).toreadonly()
+
+    def row_bits(self, row: int) -> List[bool]:
+        """Get one row of the grid as a list of punch states."""
+        bit = 1 << row
+        return [bool(code & bit) for code in self._codes]
+
+    # ----- Whole-grid operations -----
+
+    def clear(self):
+        """Clear every hole."""
+        self._codes = array('H', [BLANK]) * self.columns
+        self._shared = False
+        self._frozen = None
+
+    def is_blank(self) -> bool:
+        """True if no hole is punched."""
+        return not any(self._codes)
+
+    def hole_count(self) -> int:
+        """Count the punched holes."""
+        return sum(bin(code).count("1") for code in self._codes)
+
+    def copy(self) -> 'CardGrid':
+        """Get an independent copy of the grid."""
+        card = CardGrid.__new__(CardGrid)
+        card.rows = self.rows
+        card.columns = self.columns
+        card._codes = array('H', self._codes)
+        card._shared = False
+        card._frozen = None
+        return card
+
+    def snapshot(self) -> 'CardGrid':
+        """Get an O(1) copy-on-write copy of the grid."""
+        card = CardGrid.__new__(CardGrid)
+        card.rows = self.rows
+        card.columns = self.columns
+        card._codes = self._codes
+        card._shared = True
+        card._frozen = None
+        self._shared = True
+        return card
+
+    def freeze(self) -> 'FrozenCardGrid':
+        """Get an O(1) read-only copy of the grid, reused until the grid changes."""
+        if self._frozen is None:
+            frozen = FrozenCardGrid.__new__(FrozenCardGrid)
+            frozen.rows = self.rows
+            frozen.columns = self.columns
+            frozen._codes = self._codes
+            frozen._shared = True
+            frozen._frozen = frozen
+            self._shared = True
+            self._frozen = frozen
+        return self._frozen
+
+    def shifted(self, offset: int) -> 'CardGrid':
+        """Get a copy with the content moved left by offset columns."""
+        offset = max(0, min(offset, self.columns))
+        card = CardGrid.__new__(CardGrid)
+        card.rows = self.rows
+        card.columns = self.columns
+        card._codes = self._codes[offset:] + array('H', [BLANK]) * offset
+        card._shared = False
+        card._frozen = None
+        return card
+
+    def xor(self, other: 'CardGrid') -> array:
+        """Get the per-column XOR of two same-sized grids (changed bits)."""
+        if self.columns != other.columns:
+            raise ValueError("Cannot compare grids of different widths")
+        return array('H', map(xor, self._codes, other._codes))
+
+    def diff(self, other: 'CardGrid') -> List[Tuple[int, int, bool]]:
+        """
+        Get the minimal set of cells that differ between two grids.
+
+        Args:
+            other: Target grid of the same width
+
+        Returns:
+            (row, col, state) for every changed cell, with the state from other
+        """
+        changes = []
+        target = other._codes
+        for col, changed in enumerate(self.xor(other)):
+            if changed:
+                changes.extend((row, col, state) for row, state in _changed_rows(changed, target[col]))
+        return changes
+
+    def diff_column(self, col: int, code: int) -> List[Tuple[int, bool]]:
+        """Get (row, state) for the holes that writing code to col would change."""
+        code &= (1 << self.rows) - 1
+        return _changed_rows(self._codes[col] ^ code, code)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CardGrid):
+            return NotImplemented
+        return self.rows == other.rows and self._codes == other._codes
+
+    __hash__ = None
+
+    # ----- Conversions -----
+
+    def to_rows(self) -> List[List[bool]]:
+        """Get the grid as a row-major list of lists, for legacy consumers."""
+        return [self.row_bits(row) for row in range(self.rows)]
+
+    def tobytes(self) -> bytes:
+        """Get the raw column codes (native-endian uint16)."""
+        return self._codes.tobytes()
+
+    def __repr__(self) -> str:
+        return f"CardGrid(rows={self.rows}, columns={self.columns}, holes={self.hole_count()})"
+
+class FrozenCardGrid(CardGrid):
+    """A read-only CardGrid, safe to share between threads."""
+
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("FrozenCardGrid is read-only; copy() it to make changes")
+
+    set = set_column = clear = __setitem__ = _immutable
+
+    def snapshot(self) -> 'FrozenCardGrid':
+        """A frozen grid is its own snapshot."""
+        return self
+
+    def freeze(self) -> 'FrozenCardGrid':
+        """A frozen grid is already frozen."""
+        return self
+
+    def __hash__(self) -> int:
+        return hash((self.rows, self.tobytes()))
@@ -0,0 +1,266 @@
+"""
+Streaming Deck Import/Export for the Punch Card Project.
+
+Two interchange formats are supported, both processed one card at a time
+through generators, so a deck of millions of cards is read, encoded and
+stored in constant memory:
+
+    card-image text - one card per line, up to 80 characters
+    column binary   - 160 bytes per card, two bytes per column; the first
+                      byte holds rows 12, 11, 0, 1, 2, 3 and the second rows
+                      4-9, six bits each, high bit first (IBM 7090 / SIMH
+                      .cbn layout; the SIMH card mark bit 0x80 is ignored
+                      on read)
+
+A typical import is a pipeline:
+
+    texts = read_card_images("legacy.txt")           # read + normalize
+    message_db.add_messages(texts, source="Import")   # bulk store, one save
+
+or, for column-binary decks that may hold codes no character punches:
+
+    for codes in read_column_binary("legacy.cbn"):    # read
+        deck.append(codes)                            # store (DeckWriter)
+"""
+
+from array import array
+from itertools import islice
+from operator import add
+from typing import IO, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from src.core.hollerith import (ROWS, COLUMNS, ENCODE_TABLE, DECODE_TABLE,
+                                encode_text, decode_columns)
+
+# Bytes per card in a column-binary file
+COLUMN_BINARY_CARD = COLUMNS * 2
+
+# Default number of cards per bulk-insert batch
+DEFAULT_BATCH_SIZE = 10000
+
+def _column_binary_tables() -> Tuple[List[bytes], List[int], List[int]]:
+    """Build the code -> byte pair table and the two byte -> partial code tables."""
+    def six_bits(code: int, first_row: int) -> int:
+        # Rows first_row..first_row+5, first row in the high bit
+        value = 0
+        for row in range(first_row, first_row + 6):
+            value = (value << 1) | ((code >> row) & 1)
+        return value
+
+    pairs = [bytes((six_bits(code, 0), six_bits(code, 6))) for code in range(1 << ROWS)]
+    high = [0] * 256
+    low = [0] * 256
+    for byte in range(256):
+        for bit in range(6):
+            if byte & (1 << (5 - bit)):
+                high[byte] |= 1 << bit
+                low[byte] |= 1 << (bit + 6)
+    return pairs, high, low
+
+# Compiled column-binary lookup tables
+_CBN_PAIRS, _CBN_HIGH, _CBN_LOW = _column_binary_tables()
+
+def codes_to_column_binary(codes: Sequence[int], columns: int = COLUMNS) -> bytes:
+    """Pack one card's column codes into column-binary bytes (blank padded)."""
+    card = b"".join(map(_CBN_PAIRS.__getitem__, codes[:columns]))
+    return card.ljust(columns * 2, b"\x00")
+
+def column_binary_to_codes(data: bytes) -> array:
+    """Unpack one card of column-binary bytes into column codes."""
+    return array('H', map(add, map(_CBN_HIGH.__getitem__, data[0::2]), map(_CBN_LOW.__getitem__, data[1::2])))
+
+def normalize_card_image(line: str, columns: int = COLUMNS) -> str:
+    """Strip the line ending and cut a card-image line to the card width."""
+    return line.rstrip("\r\n")[:columns]
+
+def _open(target: Union[str, IO], mode: str, **kwargs):
+    """Open a path, or pass an already open file through (not closed by us)."""
+    if isinstance(target, str):
+        return open(target, mode, **kwargs), True
+    return target, False
+
+def read_card_images(source: Union[str, IO[str]], columns: int = COLUMNS,
+                     encoding: str = "latin-1") -> Iterator[str]:
+    """
+    Stream cards from a card-image text file.
+
+    Args:
+        source: File path or open text file
+        columns: Card width; longer lines are truncated
+        encoding: Text encoding when a path is given
+
+    Yields:
+        One normalized card per line
+    """
+    f, owned = _open(source, "r", encoding=encoding, newline="")
+    try:
+        for line in f:
+            yield normalize_card_image(line, columns)
+    finally:
+        if owned:
+            f.close()
+
+def write_card_images(target: Union[str, IO[str]], texts: Iterable[str], columns: int = COLUMNS,
+                      pad: bool = False, encoding: str = "latin-1") -> int:
+    """
+    Stream cards to a card-image text file.
+
+    Args:
+        target: File path or open text file
+        texts: Cards to write
+        columns: Card width; longer cards are truncated
+        pad: Pad every line with blanks to the full card width
+        encoding: Text encoding when a path is given
+
+    Returns:
+        Number of cards written
+    """
+    f, owned = _open(target, "w", encoding=encoding, newline="\n")
+    count = 0
+    try:
+        for text in texts:
+            text = normalize_card_image(text, columns)
+            f.write((text.ljust(columns) if pad else text) + "\n")
+            count += 1
+    finally:
+        if owned:
+            f.close()
+    return count
+
+def read_column_binary(source: Union[str, IO[bytes]], columns: int = COLUMNS) -> Iterator[array]:
+    """
+    Stream cards from a column-binary file.
+
+    Args:
+        source: File path or open binary file
+        columns: Card width
+
+    Yields:
+        array('H') of column codes for each card
+    """
+    f, owned = _open(source, "rb")
+    size = columns * 2
+    try:
+        while True:
+            data = f.read(size)
+            if len(data) < size:
+                if data:
+                    raise ValueError(f"Truncated column-binary card ({len(data)} of {size} bytes)")
+                return
+            yield column_binary_to_codes(data)
+    finally:
+        if owned:
+            f.close()
+
+def write_column_binary(target: Union[str, IO[bytes]], cards: Iterable[Sequence[int]],
+                        columns: int = COLUMNS, card_marks: bool = False) -> int:
+    """
+    Stream cards of column codes to a column-binary file.
+
+    Args:
+        target: File path or open binary file
+        cards: Column codes for each card
+        columns: Card width
+        card_marks: Set the SIMH card-start bit (0x80) on each card's first byte
+
+    Returns:
+        Number of cards written
+    """
+    f, owned = _open(target, "wb")
+    count = 0
+    try:
+        for codes in cards:
+            data = codes_to_column_binary(codes, columns)
+            if card_marks:
+                data = bytes((data[0] | 0x80,)) + data[1:]
+            f.write(data)
+            count += 1
+    finally:
+        if owned:
+            f.close()
+    return count
+
+def encode_cards(texts: Iterable[str], columns: int = COLUMNS, code_page=None) -> Iterator[array]:
+    """Encode a stream of cards into column codes (optionally with a CodePage)."""
+    table = code_page.encode_table if code_page else ENCODE_TABLE
+    for text in texts:
+        yield encode_text(text, columns, table)
+
+def decode_cards(cards: Iterable[Sequence[int]], code_page=None) -> Iterator[str]:
+    """Decode a stream of column codes back into card text (optionally with a CodePage)."""
+    table = code_page.decode_table if code_page else DECODE_TABLE
+    for codes in cards:
+        yield decode_columns(codes, table)
+
+def batched(items: Iterable, size: int = DEFAULT_BATCH_SIZE) -> Iterator[list]:
+    """Group a stream into lists of at most size items."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def punch_pattern_hex(codes: Sequence[int]) -> str:
+    """Format column codes as three hex digits per column, for Database.punch_pattern."""
+    return "".join(f"{code:03X}" for code in codes)
+
+def import_to_message_database(message_db, texts: Iterable[str], source: str = "Imported") -> int:
+    """
+    Bulk-load a stream of cards into a MessageDatabase with a single save.
+
+    Returns:
+        Number of messages added
+    """
+    return len(message_db.add_messages((text.rstrip() for text in texts), source))
+
+class RejectedCardsError(ValueError):
+    """Raised after a bulk import when some cards could not be stored."""
+
+    def __init__(self, imported: int, rejected: List[tuple]):
+        self.imported = imported
+        self.rejected = rejected
+        super().__init__(f"{len(rejected):,} cards rejected ({imported:,} imported); "
+                         f"first: {rejected[0][0]}: {rejected[0][-1]}")
+
+def import_to_database(database, texts: Iterable[str], serial_prefix: str = "IMPORT-",
+                       message_type: str = "imported", columns: int = COLUMNS,
+                       batch_size: int = DEFAULT_BATCH_SIZE, first_number: Optional[int] = None) -> int:
+    """
+    Bulk-load a stream of cards into the SQLite Database.
+
+    Cards are cut to the card width, encoded on the way through
+    (punch_pattern holds the column codes) and inserted with executemany,
+    one commit per batch. Serial numbers continue after the highest one
+    already stored with the same prefix, so repeated imports never collide.
+
+    Args:
+        database: Database to insert into
+        texts: Cards to import
+        serial_prefix: Prefix of the generated serial numbers
+        message_type: Message type recorded for each card
+        columns: Card width
+        batch_size: Cards per transaction
+        first_number: Number of the first serial (default: after the highest existing)
+
+    Returns:
+        Number of messages inserted
+
+    Raises:
+        RejectedCardsError: if any card was rejected; the others are still stored
+    """
+    if first_number is None:
+        first_number = database.max_serial_number(serial_prefix) + 1
+
+    def rows() -> Iterator[Tuple[str, str, str, str]]:
+        for number, text in enumerate(texts, start=first_number):
+            text = normalize_card_image(text, columns).rstrip()
+            yield (f"{serial_prefix}{number:08d}", text, message_type,
+                   punch_pattern_hex(encode_text(text, columns)))
+
+    total = 0
+    rejected: List[tuple] = []
+    for batch in batched(rows(), batch_size):
+        total += database.save_messages(batch, rejected)
+    if rejected:
+        raise RejectedCardsError(total, rejected)
+    return total
@@ -0,0 +1,227 @@
+"""
+Code Pages for the Punch Card Project.
+
+A code page is one historical assignment of characters to punch
+combinations. Every registered code page is compiled once, when it is
+registered, into the same two lookup tables the Hollerith encoder uses:
+
+    encode_table - array('H') of 256 column codes, indexed by ord(char)
+    decode_table - list of 4096 characters, indexed by column code
+
+so switching code pages at runtime is just swapping a reference; encoding
+never goes back through a dictionary or .upper().
+
+Built-in code pages:
+    legacy         - the project's original CHAR_MAPPING (default)
+    026-commercial - IBM 026 keypunch, commercial (BCD "H") character set
+    026-fortran    - IBM 026 keypunch, FORTRAN (BCD "A") character set
+    029            - IBM 029 keypunch (EBCDIC card code)
+    ebcdic         - 029 plus EBCDIC lowercase letters and extra specials
+
+Usage:
+    from src.core.code_pages import get_code_page
+
+    page = get_code_page("029")
+    codes = page.encode_text("HELLO, WORLD", width=80)
+    text = page.decode_columns(codes)
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from src.core.hollerith import (CHAR_MAPPING, ROWS, ROW_LABELS, BLANK, UNKNOWN_CHAR,
+                                pattern_to_code, code_to_pattern, encode_text, decode_columns)
+
+# Code page used when none is selected
+DEFAULT_CODE_PAGE = "legacy"
+
+def parse_punches(punches: str) -> int:
+    """
+    Convert punch notation into a column code.
+
+    Args:
+        punches: Row labels joined by '-', e.g. "12-8-3"; "" for no punch
+
+    Returns:
+        12-bit column code
+    """
+    code = BLANK
+    for label in filter(None, punches.split("-")):
+        if label not in ROW_LABELS:
+            raise ValueError(f"Unknown punch row '{label}' in '{punches}'")
+        code |= 1 << ROW_LABELS.index(label)
+    return code
+
+class CodePage:
+    """A character set compiled into encode/decode lookup tables."""
+
+    def __init__(self, name: str, codes: Mapping[str, int], description: str = "",
+                 fold_case: bool = True):
+        """
+        Compile a code page.
+
+        Args:
+            name: Registry name
+            codes: Character -> column code; when several characters share a
+                code, the first one listed is the one it decodes to
+            description: Human readable description
+            fold_case: Encode lowercase letters with their uppercase codes
+                unless the lowercase letter has a code of its own
+        """
+        self.name = name
+        self.description = description
+        self.codes = dict(codes)
+        self.encode_table = self._compile_encode_table(fold_case)
+        self.decode_table = self._compile_decode_table()
+
+    @classmethod
+    def from_punches(cls, name: str, punches: Mapping[str, str], description: str = "",
+                     fold_case: bool = True) -> 'CodePage':
+        """Compile a code page written in punch notation, e.g. {'.': '12-8-3'}."""
+        return cls(name, {char: parse_punches(spec) for char, spec in punches.items()},
+                   description, fold_case)
+
+    def _compile_encode_table(self, fold_case: bool) -> array:
+        """Build the 256-entry character -> column code table."""
+        table = array('H', [BLANK]) * 256
+        for char, code in self.codes.items():
+            if ord(char) < 256:
+                table[ord(char)] = code
+        if fold_case:
+            for char, code in self.codes.items():
+                lower = char.lower()
+                if lower != char and len(lower) == 1 and ord(lower) < 256 and lower not in self.codes:
+                    table[ord(lower)] = code
+        return table
+
+    def _compile_decode_table(self) -> List[str]:
+        """Build the 4096-entry column code -> character table."""
+        table = [UNKNOWN_CHAR] * (1 << ROWS)
+        for char, code in reversed(list(self.codes.items())):
+            table[code] = char
+        return table
+
+    def encode_char(self, char: str) -> int:
+        """Get the column code for a single character (blank if unmapped)."""
+        index = ord(char)
+        return self.encode_table[index] if index < 256 else BLANK
+
+    def encode_text(self, text: str, width: Optional[int] = None) -> array:
+        """Encode a message into an array of column codes (see hollerith.encode_text)."""
+        return encode_text(text, width, self.encode_table)
+
+    def encode_many(self, texts: Iterable[str], width: Optional[int] = None) -> List[array]:
+        """Encode a batch of messages."""
+        table = self.encode_table
+        return [encode_text(text, width, table) for text in texts]
+
+    def char_to_pattern(self, char: str) -> List[int]:
+        """Get the 12-element punch pattern for a character."""
+        return code_to_pattern(self.encode_char(char))
+
+    def decode_code(self, code: int) -> str:
+        """Get the character for a single column code."""
+        return self.decode_table[code & 0xFFF]
+
+    def decode_columns(self, codes: Iterable[int]) -> str:
+        """Decode a sequence of column codes back into text."""
+        return decode_columns(codes, self.decode_table)
+
+    def __repr__(self) -> str:
+        return f"CodePage({self.name!r}, {len(self.codes)} characters)"
+
+def _alphanumerics() -> Dict[str, str]:
+    """Letters, digits and space, which every IBM card code shares."""
+    punches = {" ": ""}
+    for index, letter in enumerate("ABCDEFGHI"):
+        punches[letter] = f"12-{index + 1}"
+    for index, letter in enumerate("JKLMNOPQR"):
+        punches[letter] = f"11-{index + 1}"
+    for index, letter in enumerate("STUVWXYZ"):
+        punches[letter] = f"0-{index + 2}"
+    for digit in "0123456789":
+        punches[digit] = digit
+    return punches
+
+# IBM 026, commercial character set
+PUNCHES_026_COMMERCIAL = {
+    **_alphanumerics(),
+    '&': '12', '-': '11', '/': '0-1',
+    '.': '12-8-3', '¤': '12-8-4',
+    '$': '11-8-3', '*': '11-8-4',
+    ',': '0-8-3', '%': '0-8-4',
+    '#': '8-3', '@': '8-4',
+}
+
+# IBM 026, FORTRAN character set
+PUNCHES_026_FORTRAN = {
+    **_alphanumerics(),
+    '+': '12', '-': '11', '/': '0-1',
+    '.': '12-8-3', ')': '12-8-4',
+    '$': '11-8-3', '*': '11-8-4',
+    ',': '0-8-3', '(': '0-8-4',
+    '=': '8-3', "'": '8-4',
+}
+
+# IBM 029 (EBCDIC card code)
+PUNCHES_029 = {
+    **_alphanumerics(),
+    '&': '12', '-': '11', '/': '0-1',
+    '¢': '12-8-2', '.': '12-8-3', '<': '12-8-4', '(': '12-8-5', '+': '12-8-6', '|': '12-8-7',
+    '!': '11-8-2', '$': '11-8-3', '*': '11-8-4', ')': '11-8-5', ';': '11-8-6', '¬': '11-8-7',
+    ',': '0-8-3', '%': '0-8-4', '_': '0-8-5', '>': '0-8-6', '?': '0-8-7',
+    ':': '8-2', '#': '8-3', '@': '8-4', "'": '8-5', '=': '8-6', '"': '8-7',
+}
+
+def _ebcdic_lowercase() -> Dict[str, str]:
+    """EBCDIC lowercase letters: zone punches 12-0, 12-11 and 11-0."""
+    punches = {}
+    for index, letter in enumerate("abcdefghi"):
+        punches[letter] = f"12-0-{index + 1}"
+    for index, letter in enumerate("jklmnopqr"):
+        punches[letter] = f"12-11-{index + 1}"
+    for index, letter in enumerate("stuvwxyz"):
+        punches[letter] = f"11-0-{index + 2}"
+    return punches
+
+# IBM 029 plus the EBCDIC lowercase letters and extra specials
+PUNCHES_EBCDIC = {
+    **PUNCHES_029,
+    **_ebcdic_lowercase(),
+    '{': '12-0', '}': '11-0', '\\': '0-8-2', '~': '11-0-1', '`': '8-1',
+}
+
+# Registered code pages by name
+CODE_PAGES: Dict[str, CodePage] = {}
+
+def register_code_page(page: CodePage) -> CodePage:
+    """Register (or replace) a compiled code page so it can be selected by name."""
+    CODE_PAGES[page.name] = page
+    return page
+
+def get_code_page(name: Optional[str] = None) -> CodePage:
+    """
+    Look up a registered code page.
+
+    Args:
+        name: Code page name; None for the default
+
+    Returns:
+        The compiled CodePage
+    """
+    try:
+        return CODE_PAGES[name or DEFAULT_CODE_PAGE]
+    except KeyError:
+        raise ValueError(f"Unknown code page '{name}' (available: {', '.join(CODE_PAGES)})") from None
+
+def available_code_pages() -> List[str]:
+    """Get the names of all registered code pages."""
+    return list(CODE_PAGES)
+
+register_code_page(CodePage("legacy", {char: pattern_to_code(pattern) for char, pattern in CHAR_MAPPING.items()},
+                            "Original project mapping"))
+register_code_page(CodePage.from_punches("026-commercial", PUNCHES_026_COMMERCIAL, "IBM 026 commercial"))
+register_code_page(CodePage.from_punches("026-fortran", PUNCHES_026_FORTRAN, "IBM 026 FORTRAN"))
+register_code_page(CodePage.from_punches("029", PUNCHES_029, "IBM 029 / EBCDIC card code"))
+register_code_page(CodePage.from_punches("ebcdic", PUNCHES_EBCDIC, "EBCDIC extended, with lowercase",
+                                         fold_case=False))
@@ -2,12 +2,17 @@ import sqlite3
 import os
 from datetime import datetime
 import yaml
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, Iterable, List, Any, Tuple
 
 class Database:
-    def __init__(self, config_path: str = "../config/config.yaml"):
-        """Initialize database connection and create tables if they don't exist"""
-        self.config = self._load_config(config_path)
+    def __init__(self, config_path: str = "../config/config.yaml", db_path: Optional[str] = None):
+        """Initialize database connection and create tables if they don't exist
+        
+        Args:
+            config_path: YAML config naming the database file
+            db_path: SQLite file to use instead of reading the config
+        """
+        self.config = self._load_config(config_path) if db_path is None else {'database': {'path': db_path}}
         self.db_path = self.config['database']['path']
         self._ensure_db_directory()
         self.conn = sqlite3.connect(self.db_path)
@@ -20,7 +25,8 @@ class Database:
             
     def _ensure_db_directory(self):
         """Ensure the database directory exists"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        if os.path.dirname(self.db_path):
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
     def _create_tables(self):
         """Create database tables if they don't exist"""
@@ -82,6 +88,64 @@ class Database:
             print(f"Database error when saving message: {e}")
             return False
             
+    def save_messages(self, messages: Iterable[Tuple[str, str, str, Optional[str]]],
+                      rejected: Optional[List[Tuple]] = None) -> int:
+        """Save many messages in one transaction.
+        
+        Rows are inserted with executemany. If any row is rejected (e.g. a
+        duplicate serial number or an over-long message), the batch is
+        rolled back and retried row by row, so only the bad rows are skipped.
+        
+        Args:
+            messages: (serial_number, message, message_type, punch_pattern) tuples
+            rejected: List that rejected rows are appended to, as
+                (serial_number, message, message_type, punch_pattern, error)
+            
+        Returns:
+            Number of messages saved
+        """
+        insert = '''
+            INSERT INTO messages 
+            (serial_number, message, message_type, punch_pattern, character_count)
+            VALUES (?, ?, ?, ?, ?)
+        '''
+        messages = list(messages)
+        cursor = self.conn.cursor()
+        try:
+            cursor.executemany(insert, ((serial, message, message_type, punch_pattern, len(message))
+                                        for serial, message, message_type, punch_pattern in messages))
+            self.conn.commit()
+            return len(messages)
+        except sqlite3.Error:
+            self.conn.rollback()
+            
+        saved = 0
+        for serial, message, message_type, punch_pattern in messages:
+            try:
+                cursor.execute(insert, (serial, message, message_type, punch_pattern, len(message)))
+                saved += 1
+            except sqlite3.Error as e:
+                print(f"Database error when saving message {serial}: {e}")
+                if rejected is not None:
+                    rejected.append((serial, message, message_type, punch_pattern, str(e)))
+        self.conn.commit()
+        return saved
+            
+    def max_serial_number(self, prefix: str) -> int:
+        """Get the highest number used after a serial number prefix (0 if none)"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                SELECT MAX(CAST(substr(serial_number, ?) AS INTEGER))
+                FROM messages
+                WHERE substr(serial_number, 1, ?) = ?
+            ''', (len(prefix) + 1, len(prefix), prefix))
+            result = cursor.fetchone()
+            return result[0] or 0
+        except sqlite3.Error as e:
+            print(f"Database error when reading serial numbers: {e}")
+            return 0
+            
     def save_diagnostic(self, category: str, key: str, value: str) -> bool:
         """Save diagnostic information"""
         try:
@@ -0,0 +1,346 @@
+"""
+Column-Binary Deck Files for the Punch Card Project.
+
+A deck file stores punched cards in column-binary form: every card is one
+little-endian uint16 column code per column (the Hollerith encoder's bit
+layout), so an 80-column card is a fixed 160 bytes and card N lives at a
+known offset. The file starts with a 16-byte header:
+
+    magic    4s   b"PCDK"
+    version  H    1
+    rows     H    12
+    columns  H    80
+    reserved 6x
+
+An optional sidecar index (<deck>.idx) holds one (message_number, offset)
+pair of uint64s per card, appended in message order, so a message can be
+found without scanning the deck.
+
+DeckReader mmaps both files: opening is instant regardless of deck size,
+and card() returns a zero-copy memoryview of a card's column codes.
+
+Usage:
+    from src.core.deck_file import DeckWriter, DeckReader
+
+    with DeckWriter("history.deck") as deck:
+        deck.append_text("HELLO WORLD", message_number=1)
+
+    with DeckReader("history.deck") as deck:
+        codes = deck.card(0)                 # memoryview of 80 uint16 codes
+        grid = deck.grid_for_message(1)      # CardGrid
+"""
+
+import os
+import sys
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from operator import lt
+from typing import Iterator, Optional, Sequence
+
+from src.core.hollerith import ROWS, COLUMNS, BLANK, encode_text, decode_columns
+from src.core.card_grid import CardGrid
+
+# NumPy is only needed for whole-deck array views
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+DECK_MAGIC = b"PCDK"
+DECK_VERSION = 1
+HEADER = struct.Struct("<4sHHH6x")
+INDEX_ENTRY = struct.Struct("<QQ")
+INDEX_SUFFIX = ".idx"
+
+# Column codes are stored little-endian; native arrays need swapping elsewhere
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+class DeckFormatError(Exception):
+    """Raised when a file is not a readable deck file."""
+
+def card_size(columns: int = COLUMNS) -> int:
+    """Get the size in bytes of one card."""
+    return columns * 2
+
+def index_path(path: str) -> str:
+    """Get the sidecar index path for a deck file."""
+    return path + INDEX_SUFFIX
+
+def _to_bytes(codes: Sequence[int], columns: int) -> bytes:
+    """Pack column codes into one little-endian card, blank padded or truncated."""
+    card = array('H', codes[:columns])
+    if len(card) < columns:
+        card.extend(array('H', [BLANK]) * (columns - len(card)))
+    if not _NATIVE_LITTLE_ENDIAN:
+        card.byteswap()
+    return card.tobytes()
+
+def _read_header(data: bytes, path: str):
+    """Validate a deck header and return (rows, columns)."""
+    if len(data) < HEADER.size:
+        raise DeckFormatError(f"{path}: file too short for a deck header")
+    magic, version, rows, columns = HEADER.unpack_from(data)
+    if magic != DECK_MAGIC:
+        raise DeckFormatError(f"{path}: not a deck file")
+    if version != DECK_VERSION:
+        raise DeckFormatError(f"{path}: unsupported deck version {version}")
+    return rows, columns
+
+def _trim_index(path: str, end: int) -> Optional[int]:
+    """
+    Drop a torn entry and any entries for cards at or past end from a sidecar index.
+
+    Returns:
+        Message number of the last entry kept, or None if the index is empty
+    """
+    if not os.path.exists(path):
+        return None
+    last_number = None
+    with open(path, "r+b") as f:
+        size = os.fstat(f.fileno()).st_size
+        keep = size - size % INDEX_ENTRY.size
+        # Entries are appended in card order, so stale ones are at the tail
+        while keep:
+            f.seek(keep - INDEX_ENTRY.size)
+            number, offset = INDEX_ENTRY.unpack(f.read(INDEX_ENTRY.size))
+            if offset < end:
+                last_number = number
+                break
+            keep -= INDEX_ENTRY.size
+        if keep != size:
+            f.truncate(keep)
+    return last_number
+
+class DeckWriter:
+    """Appends cards to a deck file (and its sidecar index)."""
+
+    def __init__(self, path: str, columns: int = COLUMNS, index: bool = True):
+        """
+        Open a deck for appending, creating it if needed. A partial card
+        left by an interrupted append is dropped, along with its index entry.
+
+        Args:
+            path: Deck file path
+            columns: Card width for a new deck (existing decks keep theirs)
+            index: Maintain the sidecar message_number -> offset index
+        """
+        self.path = path
+        self.rows = ROWS
+        self.columns = columns
+        self._deck = open(path, "ab+")
+        self._index = None
+        self.last_message_number: Optional[int] = None
+        self._deck.seek(0, os.SEEK_END)
+        if self._deck.tell() == 0:
+            self._deck.write(HEADER.pack(DECK_MAGIC, DECK_VERSION, self.rows, self.columns))
+        else:
+            self._deck.seek(0)
+            self.rows, self.columns = _read_header(self._deck.read(HEADER.size), path)
+            self._deck.seek(0, os.SEEK_END)
+        # Drop a partial card left by an interrupted append
+        self.count = (self._deck.tell() - HEADER.size) // card_size(self.columns)
+        end = HEADER.size + self.count * card_size(self.columns)
+        if self._deck.tell() != end:
+            self._deck.truncate(end)
+        if index:
+            self.last_message_number = _trim_index(index_path(path), end)
+            self._index = open(index_path(path), "ab")
+
+    def append(self, codes: Sequence[int], message_number: Optional[int] = None) -> int:
+        """
+        Append one card.
+
+        Args:
+            codes: Column codes (padded or truncated to the card width)
+            message_number: Message number to record in the sidecar index
+
+        Returns:
+            Index of the new card in the deck
+
+        Raises:
+            ValueError: if message_number is not above the last indexed one
+        """
+        if (self._index is not None and message_number is not None
+                and self.last_message_number is not None and message_number <= self.last_message_number):
+            raise ValueError(f"Message number {message_number} must be above the last indexed "
+                             f"message ({self.last_message_number})")
+        offset = HEADER.size + self.count * card_size(self.columns)
+        self._deck.write(_to_bytes(codes, self.columns))
+        if self._index is not None and message_number is not None:
+            self._index.write(INDEX_ENTRY.pack(message_number, offset))
+            self.last_message_number = message_number
+        self.count += 1
+        return self.count - 1
+
+    def append_text(self, text: str, message_number: Optional[int] = None, code_page=None) -> int:
+        """Encode a message (optionally with a CodePage) and append it as a card."""
+        codes = code_page.encode_text(text, self.columns) if code_page else encode_text(text, self.columns)
+        return self.append(codes, message_number)
+
+    def flush(self):
+        """Flush buffered cards to disk."""
+        self._deck.flush()
+        if self._index is not None:
+            self._index.flush()
+
+    def close(self):
+        """Flush and close the deck."""
+        self._deck.close()
+        if self._index is not None:
+            self._index.close()
+
+    def __enter__(self) -> 'DeckWriter':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class DeckReader:
+    """Memory-mapped, random access view of a deck file."""
+
+    def __init__(self, path: str):
+        """
+        Map a deck file (and its sidecar index, if present).
+
+        Args:
+            path: Deck file path
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise DeckFormatError(f"{path}: file too short for a deck header")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.rows, self.columns = _read_header(self._map, path)
+        self.card_size = card_size(self.columns)
+        self.count = (len(self._map) - HEADER.size) // self.card_size
+        self._view = memoryview(self._map)
+        self._index_map = None
+        self._index_view = None
+        self._index_numbers = None
+        self._index_offsets: Optional[dict] = None
+        # Ignore a torn entry at the end of the index
+        entries = 0
+        if os.path.exists(index_path(path)):
+            entries = os.path.getsize(index_path(path)) // INDEX_ENTRY.size
+        if entries:
+            with open(index_path(path), "rb") as f:
+                self._index_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._index_view = memoryview(self._index_map)[:entries * INDEX_ENTRY.size].cast('Q')
+            self._index_numbers = self._index_view[0::2]
+            # DeckWriter keeps numbers increasing; older or hand-made indexes get a dict instead
+            if not all(map(lt, self._index_numbers, self._index_numbers[1:])):
+                self._index_offsets = {}
+                for number, offset in zip(self._index_numbers, self._index_view[1::2]):
+                    self._index_offsets.setdefault(number, offset)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def card(self, index: int) -> memoryview:
+        """
+        Get a card's column codes without copying.
+
+        Returns:
+            Read-only memoryview of uint16 column codes (little-endian; use
+            codes() on big-endian hosts)
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(f"Card {index} out of range for {self.count}-card deck")
+        start = HEADER.size + index * self.card_size
+        return self._view[start:start + self.card_size].cast('H')
+
+    __getitem__ = card
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for index in range(self.count):
+            yield self.card(index)
+
+    def codes(self, index: int) -> array:
+        """Get a copy of a card's column codes in native byte order."""
+        codes = array('H', self.card(index))
+        if not _NATIVE_LITTLE_ENDIAN:
+            codes.byteswap()
+        return codes
+
+    def grid(self, index: int) -> CardGrid:
+        """Get a card as a CardGrid."""
+        return CardGrid(self.rows, self.columns, self.codes(index))
+
+    def text(self, index: int, code_page=None) -> str:
+        """Decode a card back into text (optionally with a CodePage)."""
+        codes = self.codes(index)
+        return code_page.decode_columns(codes) if code_page else decode_columns(codes)
+
+    def find(self, message_number: int) -> Optional[int]:
+        """
+        Look up a card by message number in the sidecar index.
+
+        Returns:
+            Card index, or None if the message is not indexed
+        """
+        if self._index_view is None:
+            return None
+        if self._index_offsets is not None:
+            offset = self._index_offsets.get(message_number)
+            if offset is None:
+                return None
+        else:
+            position = bisect_left(self._index_numbers, message_number)
+            if position == len(self._index_numbers) or self._index_numbers[position] != message_number:
+                return None
+            offset = self._index_view[position * 2 + 1]
+        return (offset - HEADER.size) // self.card_size
+
+    def grid_for_message(self, message_number: int) -> Optional[CardGrid]:
+        """Get the card for a message number as a CardGrid (None if not indexed)."""
+        index = self.find(message_number)
+        return None if index is None else self.grid(index)
+
+    def as_array(self) -> 'np.ndarray':
+        """Get the whole deck as a zero-copy (N, columns) uint16 NumPy array."""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for deck array views")
+        return np.frombuffer(self._map, dtype='<u2', count=self.count * self.columns,
+                             offset=HEADER.size).reshape(self.count, self.columns)
+
+    def close(self):
+        """
+        Unmap the deck. Card views handed out earlier must be released first.
+        """
+        self._view.release()
+        self._map.close()
+        if self._index_map is not None:
+            self._index_numbers.release()
+            self._index_view.release()
+            self._index_map.close()
+
+    def __enter__(self) -> 'DeckReader':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def export_message_history(message_db, path: str, code_page=None) -> int:
+    """
+    Write every message in a MessageDatabase to a new deck file.
+
+    Args:
+        message_db: MessageDatabase to export
+        path: Deck file to create (replaced if it exists)
+        code_page: Optional CodePage to encode with
+
+    Returns:
+        Number of cards written
+    """
+    for stale in (path, index_path(path)):
+        if os.path.exists(stale):
+            os.remove(stale)
+    with DeckWriter(path) as deck:
+        for record in message_db.messages:
+            deck.append_text(record.content, record.message_number, code_page)
+        return deck.count
@@ -0,0 +1,474 @@
+"""
+Hollerith Encoder for the Punch Card Project.
+
+This module is the single place where characters are turned into punches.
+Every character in CHAR_MAPPING is compiled once, at import time, into a
+12-bit column code stored in a 256-entry lookup table. Encoding a message is
+then one table lookup per character instead of a dictionary lookup, an
+.upper() call and a freshly built 12-element list.
+
+Column codes use one bit per row, in the same row order as every grid in the
+project (12, 11, 0, 1, 2, ... 9):
+
+    bit 0 = row 12, bit 1 = row 11, bit 2 = row 0, bit 3 = row 1 ... bit 11 = row 9
+
+Usage:
+    from src.core.hollerith import encode_text, punched_rows
+
+    for col, code in enumerate(encode_text("HELLO WORLD")):
+        for row in punched_rows(code):
+            ...
+
+When NumPy is installed, encode_deck() turns a whole list of messages into an
+(N, 12, 80) card tensor in one vectorized lookup, for heatmaps and exports
+over the full message history.
+
+Decoding goes the other way through a 4096-entry reverse table indexed by
+column code. Several characters share a code in CHAR_MAPPING (e.g. '0', '.'
+and "'"); the first one listed wins, so letters and digits decode as
+themselves and the shared specials decode to their letter/digit twin.
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+# NumPy is only needed for the batch deck encoder
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Card geometry
+ROWS = 12
+COLUMNS = 80
+
+# Row labels in grid order: 12, 11, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9
+ROW_LABELS = ["12", "11", "0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
+
+# Column code for a blank (unpunched) column
+BLANK = 0
+
+# Hollerith/EBCDIC encoding mapping
+CHAR_MAPPING = {
+    # ---------------------------------------
+    # A–I => zone=12 + digit=1..9
+    # ---------------------------------------
+    # A = 12,1
+    'A': [1,0,0,1,0,0,0,0,0,0,0,0],  # index=0 => row12, index=3 => row1
+    # B = 12,2
+    'B': [1,0,0,0,1,0,0,0,0,0,0,0],
+    # C = 12,3
+    'C': [1,0,0,0,0,1,0,0,0,0,0,0],
+    # D = 12,4
+    'D': [1,0,0,0,0,0,1,0,0,0,0,0],
+    # E = 12,5
+    'E': [1,0,0,0,0,0,0,1,0,0,0,0],
+    # F = 12,6
+    'F': [1,0,0,0,0,0,0,0,1,0,0,0],
+    # G = 12,7
+    'G': [1,0,0,0,0,0,0,0,0,1,0,0],
+    # H = 12,8
+    'H': [1,0,0,0,0,0,0,0,0,0,1,0],
+    # I = 12,9
+    'I': [1,0,0,0,0,0,0,0,0,0,0,1],
+
+    # ---------------------------------------
+    # J–R => zone=11 + digit=1..9
+    # ---------------------------------------
+    # J = 11,1
+    'J': [0,1,0,1,0,0,0,0,0,0,0,0],
+    # K = 11,2
+    'K': [0,1,0,0,1,0,0,0,0,0,0,0],
+    # L = 11,3
+    'L': [0,1,0,0,0,1,0,0,0,0,0,0],
+    # M = 11,4
+    'M': [0,1,0,0,0,0,1,0,0,0,0,0],
+    # N = 11,5
+    'N': [0,1,0,0,0,0,0,1,0,0,0,0],
+    # O = 11,6
+    'O': [0,1,0,0,0,0,0,0,1,0,0,0],
+    # P = 11,7
+    'P': [0,1,0,0,0,0,0,0,0,1,0,0],
+    # Q = 11,8
+    'Q': [0,1,0,0,0,0,0,0,0,0,1,0],
+    # R = 11,9
+    'R': [0,1,0,0,0,0,0,0,0,0,0,1],
+
+    # ---------------------------------------
+    # S–Z => zone=0 + digit=2..9 (skipping 1)
+    # ---------------------------------------
+    # S = 0,2
+    'S': [0,0,1,0,1,0,0,0,0,0,0,0],
+    # T = 0,3
+    'T': [0,0,1,0,0,1,0,0,0,0,0,0],
+    # U = 0,4
+    'U': [0,0,1,0,0,0,1,0,0,0,0,0],
+    # V = 0,5
+    'V': [0,0,1,0,0,0,0,1,0,0,0,0],
+    # W = 0,6
+    'W': [0,0,1,0,0,0,0,0,1,0,0,0],
+    # X = 0,7
+    'X': [0,0,1,0,0,0,0,0,0,1,0,0],
+    # Y = 0,8
+    'Y': [0,0,1,0,0,0,0,0,0,0,1,0],
+    # Z = 0,9
+    'Z': [0,0,1,0,0,0,0,0,0,0,0,1],
+
+    # ---------------------------------------
+    # Digits 0–9 => single punch in row 0..9
+    # ---------------------------------------
+    '0': [0,0,1,0,0,0,0,0,0,0,0,0],  # row 0
+    '1': [0,0,0,1,0,0,0,0,0,0,0,0],  # row 1
+    '2': [0,0,0,0,1,0,0,0,0,0,0,0],  # row 2
+    '3': [0,0,0,0,0,1,0,0,0,0,0,0],  # row 3
+    '4': [0,0,0,0,0,0,1,0,0,0,0,0],  # row 4
+    '5': [0,0,0,0,0,0,0,1,0,0,0,0],  # row 5
+    '6': [0,0,0,0,0,0,0,0,1,0,0,0],  # row 6
+    '7': [0,0,0,0,0,0,0,0,0,1,0,0],  # row 7
+    '8': [0,0,0,0,0,0,0,0,0,0,1,0],  # row 8
+    '9': [0,0,0,0,0,0,0,0,0,0,0,1],  # row 9
+
+    # ---------------------------------------
+    # Special Characters => combinations of punches
+    # ---------------------------------------
+    ' ': [0,0,0,0,0,0,0,0,0,0,0,0],  # no punch
+    '.': [0,0,1,0,0,0,0,0,0,0,0,0],  # row 0
+    ',': [0,0,0,1,0,0,0,0,0,0,0,0],  # row 1
+    '-': [0,0,0,0,1,0,0,0,0,0,0,0],  # row 2
+    '+': [0,0,0,0,0,1,0,0,0,0,0,0],  # row 3
+    '*': [0,0,0,0,0,0,1,0,0,0,0,0],  # row 4
+    '/': [0,0,0,0,0,0,0,1,0,0,0,0],  # row 5
+    '=': [0,0,0,0,0,0,0,0,1,0,0,0],  # row 6
+    '(': [0,0,0,0,0,0,0,0,0,1,0,0],  # row 7
+    ')': [0,0,0,0,0,0,0,0,0,0,1,0],  # row 8
+    '$': [0,0,0,0,0,0,0,0,0,0,0,1],  # row 9
+    '@': [1,1,0,0,0,0,0,0,0,0,0,0],  # 12,11
+    '#': [1,0,1,0,0,0,0,0,0,0,0,0],  # 12,0
+    '%': [0,1,1,0,0,0,0,0,0,0,0,0],  # 11,0
+    '&': [1,1,1,0,0,0,0,0,0,0,0,0],  # 12,11,0
+    '!': [1,0,0,0,0,0,0,0,0,0,0,0],  # 12
+    '"': [0,1,0,0,0,0,0,0,0,0,0,0],  # 11
+    "'": [0,0,1,0,0,0,0,0,0,0,0,0],  # 0
+    ':': [0,0,0,1,0,0,0,0,0,0,0,0],  # 1
+    ';': [0,0,0,0,1,0,0,0,0,0,0,0],  # 2
+    '?': [0,0,0,0,0,1,0,0,0,0,0,0],  # 3
+    '[': [0,0,0,0,0,0,1,0,0,0,0,0],  # 4
+    ']': [0,0,0,0,0,0,0,1,0,0,0,0],  # 5
+    '{': [0,0,0,0,0,0,0,0,1,0,0,0],  # 6
+    '}': [0,0,0,0,0,0,0,0,0,1,0,0],  # 7
+    '|': [0,0,0,0,0,0,0,0,0,0,1,0],  # 8
+    '\\': [0,0,0,0,0,0,0,0,0,0,0,1],  # 9
+    '<': [1,0,0,0,0,0,0,0,0,0,0,0],  # 12
+    '>': [0,1,0,0,0,0,0,0,0,0,0,0],  # 11
+    '~': [0,0,1,0,0,0,0,0,0,0,0,0],  # 0
+    '`': [0,0,0,1,0,0,0,0,0,0,0,0],  # 1
+    '^': [0,0,0,0,1,0,0,0,0,0,0,0],  # 2
+    '_': [0,0,0,0,0,1,0,0,0,0,0,0],  # 3
+}
+
+def pattern_to_code(pattern: Sequence[int]) -> int:
+    """Pack a 12-element punch pattern into a 12-bit column code."""
+    code = 0
+    for row, punched in enumerate(pattern):
+        if punched:
+            code |= 1 << row
+    return code
+
+def code_to_pattern(code: int) -> List[int]:
+    """Unpack a 12-bit column code into a 12-element punch pattern."""
+    return [(code >> row) & 1 for row in range(ROWS)]
+
+def _compile_encode_table() -> array:
+    """Build the 256-entry character -> column code lookup table."""
+    table = array('H', [BLANK]) * 256
+    for char, pattern in CHAR_MAPPING.items():
+        code = pattern_to_code(pattern)
+        # Fold case into the table so callers never need .upper()
+        for variant in {char, char.lower()}:
+            if ord(variant) < 256:
+                table[ord(variant)] = code
+    return table
+
+# Compiled lookup table, indexed by ord(char) for Latin-1 characters
+ENCODE_TABLE = _compile_encode_table()
+
+def encode_char(char: str) -> int:
+    """Get the column code for a single character (blank if unmapped)."""
+    index = ord(char)
+    return ENCODE_TABLE[index] if index < 256 else BLANK
+
+def encode_text(text: str, width: Optional[int] = None, table: array = ENCODE_TABLE) -> array:
+    """
+    Encode a message into an array of 12-bit column codes.
+    
+    Args:
+        text: Message to encode
+        width: Optional card width; the message is padded with blank
+            columns or truncated to exactly this many columns
+        table: 256-entry encode table (a code page's table; defaults to
+            the CHAR_MAPPING table)
+            
+    Returns:
+        array('H') with one uint16 column code per character
+    """
+    if width is not None:
+        text = text[:width]
+    try:
+        data = text.encode('latin-1')
+        columns = array('H', map(table.__getitem__, data))
+    except UnicodeEncodeError:
+        columns = array('H', (table[ord(char)] if ord(char) < 256 else BLANK for char in text))
+    if width is not None and len(columns) < width:
+        columns.extend(array('H', [BLANK]) * (width - len(columns)))
+    return columns
+
+def encode_many(texts: Iterable[str], width: Optional[int] = None) -> List[array]:
+    """
+    Encode a batch of messages.
+    
+    Args:
+        texts: Messages to encode
+        width: Optional card width applied to every message
+        
+    Returns:
+        List of column code arrays, one per message
+    """
+    return [encode_text(text, width) for text in texts]
+
+@lru_cache(maxsize=None)
+def punched_rows(code: int) -> Tuple[int, ...]:
+    """Get the grid row indices punched by a column code."""
+    return tuple(row for row in range(ROWS) if (code >> row) & 1)
+
+def describe_code(code: int) -> str:
+    """Describe a column code by its row labels, e.g. '12,1'."""
+    rows = punched_rows(code)
+    return ",".join(ROW_LABELS[row] for row in rows) if rows else "no punch"
+
+# Character returned for column codes that no character punches
+UNKNOWN_CHAR = "\ufffd"
+
+def _compile_decode_table() -> List[str]:
+    """Build the 4096-entry column code -> character reverse table."""
+    table = [UNKNOWN_CHAR] * (1 << ROWS)
+    seen = set()
+    for char, pattern in CHAR_MAPPING.items():
+        code = pattern_to_code(pattern)
+        if code not in seen:
+            seen.add(code)
+            table[code] = char
+    return table
+
+# Compiled reverse table, indexed by 12-bit column code
+DECODE_TABLE = _compile_decode_table()
+
+def decode_code(code: int) -> str:
+    """Get the character for a single column code."""
+    return DECODE_TABLE[code & 0xFFF]
+
+def decode_columns(codes: Iterable[int], table: Sequence[str] = DECODE_TABLE) -> str:
+    """Decode a sequence of column codes back into text (optionally with a code page's table)."""
+    # Ignore bits beyond the 12 rows, as decode_code does (e.g. unmasked column-binary words)
+    return "".join([table[code & 0xFFF] for code in codes])
+
+def grid_to_codes(grid: Sequence[Sequence[Any]]) -> array:
+    """
+    Collapse an LED grid into column codes.
+    
+    Args:
+        grid: A CardGrid (already packed), or 12 rows of per-column punch
+            states (ints or bools) in the legacy list-of-lists layout
+            
+    Returns:
+        array('H') with one column code per grid column
+    """
+    if hasattr(grid, "codes"):
+        return array('H', grid.codes)
+    columns = len(grid[0]) if grid else 0
+    codes = array('H', [BLANK]) * columns
+    for row, states in enumerate(grid[:ROWS]):
+        bit = 1 << row
+        for col, punched in enumerate(states):
+            if punched:
+                codes[col] |= bit
+    return codes
+
+def decode_grid(grid: Sequence[Sequence[Any]]) -> str:
+    """Decode a row-major LED grid back into text."""
+    return decode_columns(grid_to_codes(grid))
+
+def decode_many(grids: Iterable[Sequence[Sequence[Any]]]) -> List[str]:
+    """Decode a batch of row-major LED grids back into text."""
+    return [decode_grid(grid) for grid in grids]
+
+def _latin1(text: str) -> bytes:
+    """Get table indices for a message, mapping non-Latin-1 characters to blank."""
+    try:
+        return text.encode('latin-1')
+    except UnicodeEncodeError:
+        return bytes(ord(char) if ord(char) < 256 else 0 for char in text)
+
+def _deck_indices(texts: Sequence[str], columns: int) -> 'np.ndarray':
+    """Build an (N, columns) uint8 array of table indices, blank padded."""
+    buffer = b"".join(_latin1(text[:columns]).ljust(columns, b" ") for text in texts)
+    return np.frombuffer(buffer, dtype=np.uint8).reshape(len(texts), columns)
+
+@lru_cache(maxsize=1)
+def pattern_table() -> 'np.ndarray':
+    """Get the (256, 12) uint8 punch pattern table, one row per character."""
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy is required for batch deck encoding")
+    codes = np.array(ENCODE_TABLE, dtype=np.uint16)
+    return ((codes[:, None] >> np.arange(ROWS)) & 1).astype(np.uint8)
+
+def encode_deck_codes(texts: Sequence[str], columns: int = COLUMNS) -> 'np.ndarray':
+    """
+    Encode a deck of messages into column codes with NumPy.
+    
+    Args:
+        texts: Messages to encode, one card each
+        columns: Card width; messages are blank padded or truncated
+        
+    Returns:
+        (N, columns) uint16 array of 12-bit column codes
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy is required for batch deck encoding")
+    table = np.array(ENCODE_TABLE, dtype=np.uint16)
+    return table[_deck_indices(texts, columns)]
+
+def encode_deck(texts: Sequence[str], columns: int = COLUMNS, packed: bool = False) -> 'np.ndarray':
+    """
+    Encode a deck of messages into a card tensor with NumPy.
+    
+    Args:
+        texts: Messages to encode, one card each
+        columns: Card width; messages are blank padded or truncated
+        packed: Pack each row's holes into bits (np.packbits along columns)
+        
+    Returns:
+        (N, 12, columns) uint8 array of 0/1 punches, or
+        (N, 12, ceil(columns / 8)) uint8 array when packed
+    """
+    table = pattern_table()
+    # Fancy indexing gives (N, columns, 12); swap to card layout (N, 12, columns)
+    deck = np.ascontiguousarray(table[_deck_indices(texts, columns)].transpose(0, 2, 1))
+    if packed:
+        return np.packbits(deck, axis=2)
+    return deck
+
+def hole_heatmap(texts: Sequence[str], columns: int = COLUMNS) -> 'np.ndarray':
+    """
+    Count how often each hole is punched across a deck of messages.
+    
+    Returns:
+        (12, columns) int64 array of punch counts
+    """
+    return encode_deck(texts, columns).sum(axis=0, dtype=np.int64)
+
+@lru_cache(maxsize=1)
+def _decode_array() -> 'np.ndarray':
+    """Get DECODE_TABLE as a NumPy unicode array for vectorized lookups."""
+    return np.array(DECODE_TABLE, dtype='<U1')
+
+def decode_deck(deck: 'np.ndarray') -> List[str]:
+    """
+    Decode a deck of cards back into text with NumPy.
+    
+    Args:
+        deck: (N, 12, columns) punch tensor from encode_deck (unpacked), or
+            (N, columns) column codes from encode_deck_codes
+            
+    Returns:
+        List of decoded messages, one per card, at full card width
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy is required for batch deck decoding")
+    deck = np.asarray(deck)
+    if deck.ndim == 3:
+        # Collapse each column's 12 rows into its column code
+        weights = (1 << np.arange(ROWS, dtype=np.uint16))[None, :, None]
+        codes = (deck[:, :ROWS, :].astype(np.uint16) * weights).sum(axis=1, dtype=np.uint16)
+    else:
+        codes = deck.astype(np.uint16)
+    count, columns = codes.shape
+    if columns == 0:
+        return [""] * count
+    chars = np.ascontiguousarray(_decode_array()[codes & 0xFFF])
+    return chars.view(f'<U{columns}').reshape(count).tolist()
+
+@dataclass
+class RoundTripReport:
+    """Result of checking that cards decode back to what was sent."""
+    checked: int = 0
+    # (index, sent, decoded) for cards whose re-encoded columns differ
+    failures: List[Tuple[Any, str, str]] = field(default_factory=list)
+    # (index, sent, decoded) for cards that punch correctly but decode to
+    # different text because characters share a column code
+    ambiguous: List[Tuple[Any, str, str]] = field(default_factory=list)
+    
+    @property
+    def ok(self) -> bool:
+        """True if every card re-encodes to exactly the columns sent."""
+        return not self.failures
+
+def verify_round_trip(messages: Sequence[str], columns: int = COLUMNS,
+                      keys: Optional[Sequence[Any]] = None) -> RoundTripReport:
+    """
+    Check encode -> decode -> encode over a batch of messages.
+    
+    Args:
+        messages: Messages as sent to the display
+        columns: Card width
+        keys: Optional identifiers reported instead of list indices
+            (e.g. message numbers)
+            
+    Returns:
+        RoundTripReport listing failing and ambiguous cards
+    """
+    keys = list(keys) if keys is not None else list(range(len(messages)))
+    report = RoundTripReport(checked=len(messages))
+    
+    if NUMPY_AVAILABLE:
+        codes = encode_deck_codes(messages, columns)
+        decoded = decode_deck(codes)
+        recoded = encode_deck_codes(decoded, columns)
+        failed = set(np.nonzero((codes != recoded).any(axis=1))[0].tolist())
+    else:
+        codes = encode_many(messages, columns)
+        decoded = [decode_columns(card) for card in codes]
+        failed = {index for index, text in enumerate(decoded)
+                  if encode_text(text, columns) != codes[index]}
+    
+    for index, message in enumerate(messages):
+        sent = message[:columns]
+        text = decoded[index].rstrip()
+        if index in failed:
+            report.failures.append((keys[index], sent, text))
+        elif text != sent.upper().rstrip():
+            report.ambiguous.append((keys[index], sent, text))
+    return report
+
+def verify_message_history(message_db, columns: int = COLUMNS) -> RoundTripReport:
+    """
+    Round-trip every message in a MessageDatabase.
+    
+    Failures and ambiguous cards are keyed by message number.
+    """
+    records = message_db.messages
+    return verify_round_trip([record.content for record in records], columns,
+                             keys=[record.message_number for record in records])
+
+def verify_displayed(grid: Sequence[Sequence[Any]], message: str) -> List[int]:
+    """
+    Compare a displayed LED grid with the message that was sent to it.
+    
+    Returns:
+        Column indices whose punches differ from the encoded message
+    """
+    shown = grid_to_codes(grid)
+    expected = encode_text(message, len(shown))
+    return [col for col, (have, want) in enumerate(zip(shown, expected)) if have != want]
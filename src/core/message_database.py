@@ -1,8 +1,8 @@
 import json
 import os
 from datetime import datetime
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Optional
+from dataclasses import dataclass
 
 @dataclass
 class MessageRecord:
@@ -37,7 +37,8 @@ class MessageDatabase:
         """Save message history to file"""
         try:
             data = {
-                'messages': [asdict(msg) for msg in self.messages],
+                # Records hold only plain values, so vars() is a cheap asdict()
+                'messages': [vars(msg) for msg in self.messages],
                 'current_message_number': self.current_message_number
             }
             with open(self.db_path, 'w') as f:
@@ -45,8 +46,12 @@ class MessageDatabase:
         except Exception as e:
             print(f"Error saving message database: {e}")
             
-    def add_message(self, content: str, source: str = "Generated") -> int:
-        """Add a new message to the database"""
+    def save(self):
+        """Write the database to file (after changes made with save=False)"""
+        self._save_database()
+        
+    def add_message(self, content: str, source: str = "Generated", save: bool = True) -> int:
+        """Add a new message to the database; save=False defers the write to save()"""
         self.current_message_number += 1
         message = MessageRecord(
             message_number=self.current_message_number,
@@ -55,21 +60,40 @@ class MessageDatabase:
             source=source
         )
         self.messages.append(message)
-        self._save_database()
+        if save:
+            self._save_database()
         return self.current_message_number
         
-    def update_display_time(self, message_number: int):
+    def add_messages(self, contents: Iterable[str], source: str = "Generated") -> List[int]:
+        """Add many messages at once, saving the database a single time"""
+        timestamp = datetime.now().isoformat()
+        first = self.current_message_number + 1
+        for content in contents:
+            self.current_message_number += 1
+            self.messages.append(MessageRecord(
+                message_number=self.current_message_number,
+                content=content,
+                generated_at=timestamp,
+                source=source
+            ))
+        numbers = list(range(first, self.current_message_number + 1))
+        if numbers:
+            self._save_database()
+        return numbers
+        
+    def update_display_time(self, message_number: int, save: bool = True):
         """Update the last display time for a message"""
-        for message in self.messages:
-            if message.message_number == message_number:
-                message.last_displayed = datetime.now().isoformat()
-                message.display_count += 1
+        message = self.get_message(message_number)
+        if message:
+            message.last_displayed = datetime.now().isoformat()
+            message.display_count += 1
+            if save:
                 self._save_database()
-                break
                 
     def get_message(self, message_number: int) -> Optional[MessageRecord]:
         """Get a message by its number"""
-        for message in self.messages:
+        # Search from the end: the messages asked for are almost always the newest
+        for message in reversed(self.messages):
             if message.message_number == message_number:
                 return message
         return None
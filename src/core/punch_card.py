@@ -47,11 +47,20 @@ import os
 import time
 import random
 import json
-from typing import Dict, List, Optional, Any
+import signal
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import shutil
 from src.core.message_database import MessageDatabase
+from src.core.hollerith import describe_code, encode_text
+from src.core.code_pages import DEFAULT_CODE_PAGE, get_code_page
+from src.core.card_grid import CardGrid
+from src.core.animations import hole_wave_text, slide_offsets
+from src.core.deck_file import DeckFormatError, DeckWriter
+from src.display.frame_renderer import FrameRenderer
+from src.utils.frame_scheduler import FrameScheduler
 from pathlib import Path
 
 def get_version_info() -> Dict[str, str]:
@@ -126,6 +135,13 @@ DEFAULT_IDLE_RANDOM = True  # Default to random idle time
 # Constants for debug settings
 DEFAULT_SHOW_DEBUG_MESSAGES = True  # Default to showing debug messages
 
+# Column-binary deck file that shown messages are appended to (None = disabled)
+DEFAULT_DECK_FILE = None
+
+# Fast-forward mode: messages between saves, and seconds between emitted frames
+FAST_FORWARD_SAVE_INTERVAL = 1000
+FAST_FORWARD_FRAME_INTERVAL = 1 / 30
+
 # Constants for terminal size
 MIN_TERMINAL_WIDTH = 101  # Changed from 100 to 101 as requested
 MIN_TERMINAL_HEIGHT = 30  # Maintained at 30
@@ -139,124 +155,6 @@ DESCRIPTION = version_info["description"]
 # Settings file path
 SETTINGS_FILE = 'punch_card_settings.json'
 
-# Hollerith/EBCDIC encoding mapping
-CHAR_MAPPING = {
-    # ---------------------------------------
-    # A–I => zone=12 + digit=1..9
-    # ---------------------------------------
-    # A = 12,1
-    'A': [1,0,0,1,0,0,0,0,0,0,0,0],  # index=0 => row12, index=3 => row1
-    # B = 12,2
-    'B': [1,0,0,0,1,0,0,0,0,0,0,0],
-    # C = 12,3
-    'C': [1,0,0,0,0,1,0,0,0,0,0,0],
-    # D = 12,4
-    'D': [1,0,0,0,0,0,1,0,0,0,0,0],
-    # E = 12,5
-    'E': [1,0,0,0,0,0,0,1,0,0,0,0],
-    # F = 12,6
-    'F': [1,0,0,0,0,0,0,0,1,0,0,0],
-    # G = 12,7
-    'G': [1,0,0,0,0,0,0,0,0,1,0,0],
-    # H = 12,8
-    'H': [1,0,0,0,0,0,0,0,0,0,1,0],
-    # I = 12,9
-    'I': [1,0,0,0,0,0,0,0,0,0,0,1],
-
-    # ---------------------------------------
-    # J–R => zone=11 + digit=1..9
-    # ---------------------------------------
-    # J = 11,1
-    'J': [0,1,0,1,0,0,0,0,0,0,0,0],
-    # K = 11,2
-    'K': [0,1,0,0,1,0,0,0,0,0,0,0],
-    # L = 11,3
-    'L': [0,1,0,0,0,1,0,0,0,0,0,0],
-    # M = 11,4
-    'M': [0,1,0,0,0,0,1,0,0,0,0,0],
-    # N = 11,5
-    'N': [0,1,0,0,0,0,0,1,0,0,0,0],
-    # O = 11,6
-    'O': [0,1,0,0,0,0,0,0,1,0,0,0],
-    # P = 11,7
-    'P': [0,1,0,0,0,0,0,0,0,1,0,0],
-    # Q = 11,8
-    'Q': [0,1,0,0,0,0,0,0,0,0,1,0],
-    # R = 11,9
-    'R': [0,1,0,0,0,0,0,0,0,0,0,1],
-
-    # ---------------------------------------
-    # S–Z => zone=0 + digit=2..9 (skipping 1)
-    # ---------------------------------------
-    # S = 0,2
-    'S': [0,0,1,0,1,0,0,0,0,0,0,0],
-    # T = 0,3
-    'T': [0,0,1,0,0,1,0,0,0,0,0,0],
-    # U = 0,4
-    'U': [0,0,1,0,0,0,1,0,0,0,0,0],
-    # V = 0,5
-    'V': [0,0,1,0,0,0,0,1,0,0,0,0],
-    # W = 0,6
-    'W': [0,0,1,0,0,0,0,0,1,0,0,0],
-    # X = 0,7
-    'X': [0,0,1,0,0,0,0,0,0,1,0,0],
-    # Y = 0,8
-    'Y': [0,0,1,0,0,0,0,0,0,0,1,0],
-    # Z = 0,9
-    'Z': [0,0,1,0,0,0,0,0,0,0,0,1],
-
-    # ---------------------------------------
-    # Digits 0–9 => single punch in row 0..9
-    # ---------------------------------------
-    '0': [0,0,1,0,0,0,0,0,0,0,0,0],  # row 0
-    '1': [0,0,0,1,0,0,0,0,0,0,0,0],  # row 1
-    '2': [0,0,0,0,1,0,0,0,0,0,0,0],  # row 2
-    '3': [0,0,0,0,0,1,0,0,0,0,0,0],  # row 3
-    '4': [0,0,0,0,0,0,1,0,0,0,0,0],  # row 4
-    '5': [0,0,0,0,0,0,0,1,0,0,0,0],  # row 5
-    '6': [0,0,0,0,0,0,0,0,1,0,0,0],  # row 6
-    '7': [0,0,0,0,0,0,0,0,0,1,0,0],  # row 7
-    '8': [0,0,0,0,0,0,0,0,0,0,1,0],  # row 8
-    '9': [0,0,0,0,0,0,0,0,0,0,0,1],  # row 9
-
-    # ---------------------------------------
-    # Special Characters => combinations of punches
-    # ---------------------------------------
-    ' ': [0,0,0,0,0,0,0,0,0,0,0,0],  # no punch
-    '.': [0,0,1,0,0,0,0,0,0,0,0,0],  # row 0
-    ',': [0,0,0,1,0,0,0,0,0,0,0,0],  # row 1
-    '-': [0,0,0,0,1,0,0,0,0,0,0,0],  # row 2
-    '+': [0,0,0,0,0,1,0,0,0,0,0,0],  # row 3
-    '*': [0,0,0,0,0,0,1,0,0,0,0,0],  # row 4
-    '/': [0,0,0,0,0,0,0,1,0,0,0,0],  # row 5
-    '=': [0,0,0,0,0,0,0,0,1,0,0,0],  # row 6
-    '(': [0,0,0,0,0,0,0,0,0,1,0,0],  # row 7
-    ')': [0,0,0,0,0,0,0,0,0,0,1,0],  # row 8
-    '$': [0,0,0,0,0,0,0,0,0,0,0,1],  # row 9
-    '@': [1,1,0,0,0,0,0,0,0,0,0,0],  # 12,11
-    '#': [1,0,1,0,0,0,0,0,0,0,0,0],  # 12,0
-    '%': [0,1,1,0,0,0,0,0,0,0,0,0],  # 11,0
-    '&': [1,1,1,0,0,0,0,0,0,0,0,0],  # 12,11,0
-    '!': [1,0,0,0,0,0,0,0,0,0,0,0],  # 12
-    '"': [0,1,0,0,0,0,0,0,0,0,0,0],  # 11
-    "'": [0,0,1,0,0,0,0,0,0,0,0,0],  # 0
-    ':': [0,0,0,1,0,0,0,0,0,0,0,0],  # 1
-    ';': [0,0,0,0,1,0,0,0,0,0,0,0],  # 2
-    '?': [0,0,0,0,0,1,0,0,0,0,0,0],  # 3
-    '[': [0,0,0,0,0,0,1,0,0,0,0,0],  # 4
-    ']': [0,0,0,0,0,0,0,1,0,0,0,0],  # 5
-    '{': [0,0,0,0,0,0,0,0,1,0,0,0],  # 6
-    '}': [0,0,0,0,0,0,0,0,0,1,0,0],  # 7
-    '|': [0,0,0,0,0,0,0,0,0,0,1,0],  # 8
-    '\\': [0,0,0,0,0,0,0,0,0,0,0,1],  # 9
-    '<': [1,0,0,0,0,0,0,0,0,0,0,0],  # 12
-    '>': [0,1,0,0,0,0,0,0,0,0,0,0],  # 11
-    '~': [0,0,1,0,0,0,0,0,0,0,0,0],  # 0
-    '`': [0,0,0,1,0,0,0,0,0,0,0,0],  # 1
-    '^': [0,0,0,0,1,0,0,0,0,0,0,0],  # 2
-    '_': [0,0,0,0,0,1,0,0,0,0,0,0],  # 3
-}
-
 # Mapping of punch patterns to human-readable descriptions
 PUNCH_DESCRIPTIONS = {
     # Letters (A-Z)
@@ -335,6 +233,19 @@ PUNCH_DESCRIPTIONS = {
     '_': '3'
 }
 
+# Row labels in punch card order: 12, 11, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9
+ROW_LABELS = ["12", "11", "0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
+
+class CardLayout(NamedTuple):
+    """Centering offsets and prebuilt card chrome for one terminal size."""
+    x_offset: int
+    y_offset: int
+    indent: str
+    top_border: str
+    bottom_border: str
+    row_prefixes: Tuple[str, ...]    # Indent, row label and left border for each row
+    blank_prefixes: Tuple[str, ...]  # The same without row labels
+
 class PunchCardStats:
     def __init__(self):
         self.cards_processed = 0
@@ -383,8 +294,8 @@ class PunchCardStats:
         except Exception as e:
             print(f"Warning: Could not save stats to file: {e}")
     
-    def update_message_stats(self, message: str):
-        """Update statistics for a processed message"""
+    def update_message_stats(self, message: str, save: bool = True):
+        """Update statistics for a processed message; save=False defers the write to save_stats()"""
         self.stats['cards_processed'] += 1
         self.stats['last_update'] = time.time()
         
@@ -409,7 +320,8 @@ class PunchCardStats:
         self.stats['total_holes'] += len(message)
         
         # Save updated statistics
-        self.save_stats()
+        if save:
+            self.save_stats()
     
     def get_stats(self):
         """Get current statistics"""
@@ -435,12 +347,28 @@ class PunchCard:
                  message_delay: float = DEFAULT_MESSAGE_DELAY,
                  random_delay: bool = True,
                  skip_splash: bool = False,
-                 debug_mode: bool = False):
+                 debug_mode: bool = False,
+                 sleep: Callable[[float], None] = time.sleep,
+                 clock: Callable[[], float] = time.monotonic,
+                 fast_forward: bool = False):
         """Initialize the punch card display"""
+        # Every display delay goes through self.sleep so benchmarks can run without waiting
+        self.sleep = sleep
+        # Animations are paced against monotonic deadlines so render time doesn't add to each frame
+        self.scheduler = FrameScheduler(sleep, clock)
+        
+        # Fast-forward mode skips animations and delays and batches saves (see flush())
+        self.fast_forward = fast_forward
+        self._unsaved_messages = 0
+        self._last_fast_frame = None
+        
         # Try to set terminal size using ANSI escape sequences
         # This won't work on all terminals but is worth trying
         print("\033[8;{0};{1}t".format(MIN_TERMINAL_HEIGHT, MIN_TERMINAL_WIDTH), end='')
         
+        # Frame renderer for terminal output (ANSI, redraws only changed cells)
+        self.renderer = FrameRenderer()
+        
         # Load settings from file or use defaults
         self.settings = self._load_settings()
         
@@ -471,6 +399,13 @@ class PunchCard:
         # Add debug message display setting
         self.show_debug_messages = self.settings.get('show_debug_messages', DEFAULT_SHOW_DEBUG_MESSAGES)
         
+        # Code page used to encode messages (compiled lookup tables)
+        try:
+            self.code_page = get_code_page(self.settings.get('code_page', DEFAULT_CODE_PAGE))
+        except ValueError as e:
+            print(f"⚠️ {e}; using {DEFAULT_CODE_PAGE}")
+            self.code_page = get_code_page(DEFAULT_CODE_PAGE)
+        
         # Set dimensions
         self.rows = ROWS
         self.columns = COLUMNS
@@ -490,8 +425,16 @@ class PunchCard:
         if self.terminal_height < MIN_TERMINAL_HEIGHT:
             self.terminal_height = MIN_TERMINAL_HEIGHT
         
+        # Card layouts are cached per terminal size; SIGWINCH marks them stale
+        self._layouts: Dict[tuple, CardLayout] = {}
+        self._terminal_resized = False
+        self._previous_sigwinch = None
+        if hasattr(signal, 'SIGWINCH') and threading.current_thread() is threading.main_thread():
+            self._previous_sigwinch = signal.signal(signal.SIGWINCH, self._on_terminal_resize)
+        
         # Initialize display grid
-        self.grid = [[0 for _ in range(self.columns)] for _ in range(self.rows)]
+        self.grid = CardGrid(self.rows, self.columns)
+        self.displayed_grid = self.grid.freeze()  # Last frame drawn, read by display adapters
         self.current_message = ""
         self.current_column = 0
         self.message_number = 0
@@ -503,6 +446,16 @@ class PunchCard:
         self.message_db = MessageDatabase()
         self.message_number = self.message_db.current_message_number
         
+        # Optional column-binary deck that every shown message is appended to
+        deck_file = self.settings.get('deck_file', DEFAULT_DECK_FILE)
+        self.deck_writer = None
+        self._deck_numbering_warned = False
+        if deck_file:
+            try:
+                self.deck_writer = DeckWriter(deck_file)
+            except DeckFormatError as e:
+                print(f"⚠️ {e}; not recording cards to a deck")
+        
         # Clear screen
         self._clear_screen()
         
@@ -523,14 +476,14 @@ class PunchCard:
             # Adjust dimensions to fit available space
             self.columns = min(self.columns, self.terminal_width - 4)  # Leave space for borders
             self.rows = min(self.rows, self.terminal_height - 6)  # Leave space for status and borders
-            self.grid = [[0 for _ in range(self.columns)] for _ in range(self.rows)]
+            self.grid = CardGrid(self.rows, self.columns)
             if self.debug_mode and self.show_debug_messages:
                 print(f"Debug: Adjusted display size to {self.rows}x{self.columns}")
         else:
             # If terminal is large enough, use default size
             self.columns = COLUMNS
             self.rows = ROWS
-            self.grid = [[0 for _ in range(self.columns)] for _ in range(self.rows)]
+            self.grid = CardGrid(self.rows, self.columns)
             if self.debug_mode and self.show_debug_messages:
                 print(f"Debug: Using default display size {self.rows}x{self.columns}")
         
@@ -556,7 +509,9 @@ class PunchCard:
                 'min_idle_time': DEFAULT_MIN_IDLE_TIME,
                 'max_idle_time': DEFAULT_MAX_IDLE_TIME,
                 'idle_random': DEFAULT_IDLE_RANDOM,
-                'show_debug_messages': DEFAULT_SHOW_DEBUG_MESSAGES
+                'show_debug_messages': DEFAULT_SHOW_DEBUG_MESSAGES,
+                'code_page': DEFAULT_CODE_PAGE,
+                'deck_file': DEFAULT_DECK_FILE
             }
     
     def _save_settings(self):
@@ -575,6 +530,10 @@ class PunchCard:
             'max_idle_time': self.max_idle_time,
             'idle_random': self.idle_random,
             'show_debug_messages': self.show_debug_messages,
+            'code_page': self.code_page.name,
+            # Keep a configured deck even if it couldn't be opened this run
+            'deck_file': self.deck_writer.path if getattr(self, 'deck_writer', None)
+                         else self.settings.get('deck_file', DEFAULT_DECK_FILE),
             # Add new transition settings
             'receive_duration': self.receive_duration,
             'transition_steps': self.transition_steps,
@@ -611,52 +570,55 @@ class PunchCard:
         self.generation_delay = DEFAULT_GENERATION_DELAY
         # Reset debug message display setting
         self.show_debug_messages = DEFAULT_SHOW_DEBUG_MESSAGES
+        self.code_page = get_code_page(DEFAULT_CODE_PAGE)
         self._save_settings()
 
     def _ensure_terminal_size(self):
-        """Update terminal size information"""
-        self.terminal_width = shutil.get_terminal_size().columns
-        self.terminal_height = shutil.get_terminal_size().lines
+        """Update terminal size information and drop the layouts cached for the old size"""
+        terminal_size = shutil.get_terminal_size((MIN_TERMINAL_WIDTH, MIN_TERMINAL_HEIGHT))
+        self.terminal_width = max(terminal_size.columns, MIN_TERMINAL_WIDTH)
+        self.terminal_height = max(terminal_size.lines, MIN_TERMINAL_HEIGHT)
+        self._terminal_resized = False
+        self._layouts.clear()
         return self.terminal_width, self.terminal_height
+    
+    def _on_terminal_resize(self, signum, frame):
+        """SIGWINCH handler: only flags the resize, the next frame re-reads the size"""
+        self._terminal_resized = True
+        if callable(self._previous_sigwinch):
+            self._previous_sigwinch(signum, frame)
         
     def _clear_screen(self):
         """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # ANSI clear instead of spawning 'clear'; also forces the next frame to redraw fully
+        self.renderer.clear()
         
     def char_to_led_pattern(self, char: str) -> List[bool]:
         """Convert character to LED pattern using Hollerith/EBCDIC encoding"""
-        pattern = CHAR_MAPPING.get(char.upper(), [0] * ROWS)
-        # Reorder the pattern to match the correct row order: 12, 11, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9
-        reordered_pattern = [
-            pattern[0],  # 12
-            pattern[1],  # 11
-            pattern[2],  # 0
-            pattern[3],  # 1
-            pattern[4],  # 2
-            pattern[5],  # 3
-            pattern[6],  # 4
-            pattern[7],  # 5
-            pattern[8],  # 6
-            pattern[9],  # 7
-            pattern[10], # 8
-            pattern[11]  # 9
-        ]
-        return reordered_pattern
+        # Pattern is in row order: 12, 11, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9
+        return self.code_page.char_to_pattern(char)
+    
+    def set_code_page(self, name: str):
+        """Switch the code page used for new messages (takes effect immediately)"""
+        self.code_page = get_code_page(name)
         
     def _get_character_description(self, char: str) -> str:
-        """Get the description of a character's punch pattern"""
-        return PUNCH_DESCRIPTIONS.get(char.upper(), "unknown")
+        """Get the description of a character's punch pattern on the active code page"""
+        return describe_code(self.code_page.encode_char(char))
             
     def _display_grid(self, status: str = None, show_message: bool = True, show_progress_bar: bool = False, progress: int = 0, total_steps: int = 0, is_transition: bool = False, show_row_numbers: bool = True):
         """Display the current state of the LED grid"""
-        self._clear_screen()
+        # Publish this frame for other threads before drawing it
+        self.displayed_grid = self.grid.freeze()
         
         # Use the helper method to calculate offsets consistently, with additional offset for main display
-        x_offset, y_offset = self._calculate_offsets(header_height=4, footer_height=1, apply_additional_offset=True)
-        y_offset -= 3  # Move the display up by 3 rows (changed from -2 to -3)
+        layout = self._card_layout(header_height=4, footer_height=1, apply_additional_offset=True)
+        y_offset = layout.y_offset - 3  # Move the display up by 3 rows (changed from -2 to -3)
+        indent = layout.indent
         
+        # Build the frame as a list of screen lines; the renderer only redraws what changed
         # Add vertical spacing to center the content
-        print("\n" * max(0, y_offset))
+        frame = [""] * (max(0, y_offset) + 1)
         
         # Display message number and content (static position)
         if is_transition:
@@ -685,41 +647,26 @@ class PunchCard:
         # Always print message headers to maintain consistent spacing
         # If show_message is False, print blank lines instead of actual content
         if show_message:
-            print(" " * x_offset + message_text)
-            print(" " * x_offset + source_text)
-            print(" " * x_offset + status_text)
-            print()
+            frame += [indent + message_text, indent + source_text, indent + status_text, ""]
         else:
             # Print empty header lines to maintain consistent spacing
-            print(" " * x_offset + "Message #0000000: ")
-            print(" " * x_offset + "Source: ")
-            print(" " * x_offset + "Status: ")
-            print()
+            frame += [indent + "Message #0000000: ", indent + "Source: ", indent + "Status: ", ""]
         
         # Print top border with corner cutout
-        print(" " * x_offset + "   ┌" + "─" * (self.columns - 1) + "─┐")
+        frame.append(layout.top_border)
         
-        # Define the correct row order for punch cards: 12, 11, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9
-        row_order = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
-        row_labels = ["12", "11", "0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
-        
-        # Print grid with correct row order and consistent spacing
-        for i, row_idx in enumerate(row_order):
-            row_num = row_labels[i] if show_row_numbers else "  "  # Use the correct row label
-            # Create row content with empty boxes for all holes
-            row_content = ""
-            for col in range(self.columns):
-                if self.grid[row_idx][col]:
-                    row_content += "█"  # Filled box for punched hole
-                else:
-                    row_content += "□"  # Empty box for unpunched hole
-            print(" " * x_offset + f"{row_num:2s} │{row_content}│")
+        # Print grid rows in punch card order (12, 11, 0-9) with consistent spacing
+        prefixes = layout.row_prefixes if show_row_numbers else layout.blank_prefixes
+        for row_idx, prefix in enumerate(prefixes):
+            # Filled box for punched holes, empty box for unpunched holes
+            row_content = "".join("█" if punched else "□" for punched in self.grid.row_bits(row_idx))
+            frame.append(prefix + row_content + "│")
         
         # Print bottom border
-        print(" " * x_offset + "   └" + "─" * (self.columns - 1) + "─┘")
+        frame.append(layout.bottom_border)
         
         # Add empty line before decrypting status
-        print()
+        frame.append("")
         
         # Only print progress bar or decryption status if needed
         if show_progress_bar:
@@ -732,27 +679,27 @@ class PunchCard:
             dashes = " " * dash_position + "-" * 5 + " " * (7 - dash_position)
             
             # Show progress bar with left-justified text
-            print(" " * x_offset + f"Receiving Message {dashes} [{progress_bar}] {percentage}%")
+            frame.append(indent + f"Receiving Message {dashes} [{progress_bar}] {percentage}%")
         else:
             # Show decrypting message during message display
             if show_message and self.current_column < len(self.current_message):
                 current_char = self.current_message[self.current_column]
-                print(" " * x_offset + f"Decrypting: {current_char}({self._get_character_description(current_char)})")
+                frame.append(indent + f"Decrypting: {current_char}({self._get_character_description(current_char)})")
             else:
-                # Print empty line to maintain consistent spacing
-                print()
+                # Empty line to maintain consistent spacing
+                frame.append("")
         
-        # Add remaining vertical spacing to complete centering
-        # Adjust total_content_height to account for the extra empty line
-        total_content_height = (self.rows + 2) + 4 + 2  # card height + header height + footer height + extra line
-        remaining_lines = max(0, self.terminal_height - y_offset - total_content_height)
-        if remaining_lines > 0:
-            print("\n" * remaining_lines)
+        # Write the whole frame at once (lines below the frame stay blank)
+        self.renderer.render(frame)
         
     def show_message(self, message: str, source: str = "Generated"):
         """Display a message on the LED grid"""
+        if self.fast_forward:
+            self._fast_forward_message(message, source)
+            return
+        
         # Store the previous message grid state before clearing for the new message
-        previous_grid = [row[:] for row in self.grid]  # Deep copy of current grid
+        previous_grid = self.grid.snapshot()  # Copy-on-write snapshot of current grid
         
         # Add message to database and get message number
         self.message_number = self.message_db.add_message(message, source)
@@ -762,64 +709,64 @@ class PunchCard:
         # Update statistics
         self.stats.update_message_stats(message)
         
+        # Encode once; the same column codes feed the deck file and the grid
+        codes = self.code_page.encode_text(message)
+        if self.deck_writer:
+            self._record_card(codes)
+            self.deck_writer.flush()
+        
         # ===== TYPING STATE =====
-        # Display each character with original delays
-        for col, char in enumerate(message):
+        # Display each character with original delays; frames are skipped only when behind schedule
+        scheduler = self.scheduler
+        scheduler.start()
+        draw = True
+        last_col = len(codes) - 1
+        for col, code in enumerate(codes):
             self.current_column = col
-            pattern = self.char_to_led_pattern(char)
-            for row, is_punched in enumerate(pattern):
-                self.grid[row][col] = is_punched
-            self._display_grid(show_progress_bar=False)
-            time.sleep(self.led_delay)
+            self.grid.set_column(col, code)
+            if draw or col == last_col:
+                self._display_grid(show_progress_bar=False)
+            draw = scheduler.wait(self.led_delay)
         
         # Update display time in database
         self.message_db.update_display_time(self.message_number)
         
         # ===== IDLE STATE =====
         # Wait after message completion using the configurable delay
-        time.sleep(0.2 if self.debug_mode else self.completion_delay)
+        scheduler.wait(0.2 if self.debug_mode else self.completion_delay)
         
         # ===== RECEIVING/LISTENING STATE =====
         # Show "Receiving Message" progress bar until 100% using configurable parameters
+        draw = True
         for i in range(FIXED_PROGRESS_STEPS):
-            self._display_grid(show_progress_bar=True, progress=i, total_steps=FIXED_PROGRESS_STEPS, is_transition=False)
-            time.sleep(self.receive_duration / FIXED_PROGRESS_STEPS)
+            if draw:
+                self._display_grid(show_progress_bar=True, progress=i, total_steps=FIXED_PROGRESS_STEPS, is_transition=False)
+            draw = scheduler.wait(self.receive_duration / FIXED_PROGRESS_STEPS)
         
         # Store the current message's grid for transition
-        current_message_grid = [row[:] for row in self.grid]  # Deep copy of current grid
+        current_message_grid = self.grid.snapshot()  # Copy-on-write snapshot of current grid
         
         # ===== SAVING/CLEARING STATE =====
         # Animate the sliding transition (saving animation)
-        for step in range(self.transition_steps):
-            # Create a temporary grid for the transition
-            temp_grid = [[0 for _ in range(self.columns)] for _ in range(self.rows)]
-            
-            # Calculate current transition progress (0.0 to 1.0)
-            progress = step / self.transition_steps
-            
-            # Simple slide effect - move content left
-            offset = int(progress * self.columns)
-            for row in range(self.rows):
-                for col in range(self.columns):
-                    if col + offset < self.columns:
-                        temp_grid[row][col] = current_message_grid[row][col + offset]
-            
-            # Update the main grid with the temporary grid
-            self.grid = temp_grid
+        draw = True
+        for offset in slide_offsets(self.columns, self.transition_steps):
+            # Simple slide effect - move content left by a precomputed offset
+            self.grid = current_message_grid.shifted(offset)
             
             # Update the display showing transition status
-            self._display_grid(show_progress_bar=True, progress=FIXED_PROGRESS_STEPS, total_steps=FIXED_PROGRESS_STEPS, is_transition=True)
+            if draw:
+                self._display_grid(show_progress_bar=True, progress=FIXED_PROGRESS_STEPS, total_steps=FIXED_PROGRESS_STEPS, is_transition=True)
             
             # Use the configured transition delay
-            time.sleep(self.transition_delay)
+            draw = scheduler.wait(self.transition_delay)
         
         # Optional post-save delay
         if self.post_save_delay > 0:
-            time.sleep(self.post_save_delay)
+            scheduler.wait(self.post_save_delay)
         
         # ===== THINKING STATE =====
         # Clear the grid completely for the "thinking" state
-        self.grid = [[0 for _ in range(self.columns)] for _ in range(self.rows)]
+        self.grid = CardGrid(self.rows, self.columns)
         self.current_message = ""
         self.current_column = 0
         
@@ -827,16 +774,68 @@ class PunchCard:
         if self.thinking_delay > 0:
             # Create custom display method for thinking state to avoid recycling _display_static_card
             self._display_thinking_state()
-            time.sleep(self.thinking_delay)
+            self.sleep(self.thinking_delay)
             # Note: The actual generation delay happens in the main.py file, not here
         
+    def _fast_forward_message(self, message: str, source: str):
+        """Run a message through the pipeline with no animations or delays"""
+        self.message_number = self.message_db.add_message(message, source, save=False)
+        self.current_message = message
+        message = message.ljust(self.columns)[:self.columns]
+        self.stats.update_message_stats(message, save=False)
+        
+        codes = self.code_page.encode_text(message)
+        if self.deck_writer:
+            self._record_card(codes)
+        
+        # Final frame of the message: every column punched
+        self.grid = CardGrid.from_codes(codes, self.rows)
+        self.current_column = len(codes)
+        self.message_db.update_display_time(self.message_number, save=False)
+        
+        # Saves are batched; frames are capped at the terminal's useful rate
+        self._unsaved_messages += 1
+        if self._unsaved_messages >= FAST_FORWARD_SAVE_INTERVAL:
+            self._save_fast_forward()
+        now = self.scheduler.clock()
+        if self._last_fast_frame is None or now - self._last_fast_frame >= FAST_FORWARD_FRAME_INTERVAL:
+            self._last_fast_frame = now
+            self._display_grid()
+    
+    def _record_card(self, codes):
+        """Append a message's card to the deck, indexed by its message number when possible"""
+        try:
+            self.deck_writer.append(codes, self.message_number)
+        except ValueError as e:
+            # The deck already indexes later numbers (e.g. from an import); keep the card unindexed
+            if not self._deck_numbering_warned:
+                print(f"⚠️ {e}; recording cards without index entries")
+                self._deck_numbering_warned = True
+            self.deck_writer.append(codes)
+    
+    def _save_fast_forward(self):
+        """Write out the history, statistics and deck changed by fast-forwarded messages"""
+        self.message_db.save()
+        self.stats.save_stats()
+        if self.deck_writer:
+            self.deck_writer.flush()
+        self._unsaved_messages = 0
+    
+    def flush(self):
+        """Save everything fast-forward mode has deferred and draw the latest frame"""
+        if self._unsaved_messages:
+            self._save_fast_forward()
+        if self.fast_forward and self._last_fast_frame is not None:
+            self._display_grid()
+    
     def _display_thinking_state(self):
         """Display an empty card with THINKING status"""
         # Clear screen first to ensure no previous content
         self._clear_screen()
         
         # Calculate centering offsets using the helper method with consistent header height
-        x_offset, y_offset = self._calculate_offsets(header_height=4, footer_height=1)
+        layout = self._card_layout(header_height=4, footer_height=1)
+        x_offset, y_offset = layout.x_offset, layout.y_offset
         
         # Add vertical spacing to center the content
         print("\n" * max(0, y_offset))
@@ -848,7 +847,7 @@ class PunchCard:
         print()
         
         # Print top border with corner cutout
-        print(" " * x_offset + "   ┌" + "─" * (self.columns - 1) + "─┐")
+        print(layout.top_border)
         
         # Define the correct row order for punch cards
         row_order = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
@@ -861,7 +860,7 @@ class PunchCard:
             print(" " * x_offset + f"{row_num:2s} │{row_content}│")
         
         # Print bottom border
-        print(" " * x_offset + "   └" + "─" * (self.columns - 1) + "─┘")
+        print(layout.bottom_border)
         
         # Add remaining vertical spacing with consistent calculations
         total_content_height = (self.rows + 2) + 4 + 1  # card height + header height + footer height
@@ -875,7 +874,8 @@ class PunchCard:
         self._clear_screen()
         
         # Calculate centering offsets using the helper method with consistent header height
-        x_offset, y_offset = self._calculate_offsets(header_height=4, footer_height=1)
+        layout = self._card_layout(header_height=4, footer_height=1)
+        x_offset, y_offset = layout.x_offset, layout.y_offset
         
         # Add vertical spacing to center the card
         print("\n" * max(0, y_offset))
@@ -887,7 +887,7 @@ class PunchCard:
         print()
         
         # Print top border with corner cutout
-        print(" " * x_offset + "   ┌" + "─" * (self.columns - 1) + "─┐")
+        print(layout.top_border)
         
         # Define the correct row order for punch cards: 12, 11, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9
         row_order = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
@@ -900,7 +900,7 @@ class PunchCard:
             print(" " * x_offset + f"{row_num:2s} │{row_content}│")
         
         # Print bottom border
-        print(" " * x_offset + "   └" + "─" * (self.columns - 1) + "─┘")
+        print(layout.bottom_border)
         
         # Add remaining vertical spacing with consistent calculations
         total_content_height = (self.rows + 2) + 4 + 1  # card height + header height + footer height
@@ -913,7 +913,8 @@ class PunchCard:
         self._clear_screen()
         
         # Calculate centering offsets using the helper method with consistent header height
-        x_offset, y_offset = self._calculate_offsets(header_height=4, footer_height=1)
+        layout = self._card_layout(header_height=4, footer_height=1)
+        x_offset, y_offset = layout.x_offset, layout.y_offset
         
         # Add vertical spacing to center the content
         print("\n" * max(0, y_offset))
@@ -925,7 +926,7 @@ class PunchCard:
         print()
         
         # Display the card frame
-        print(" " * x_offset + "   ┌" + "─" * (self.columns - 1) + "─┐")
+        print(layout.top_border)
         
         # Define row order and labels
         row_order = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
@@ -953,7 +954,7 @@ class PunchCard:
             print(" " * x_offset + f"{row_num:2s} │{row_content}│")
         
         # Print bottom border
-        print(" " * x_offset + "   └" + "─" * (self.columns - 1) + "─┘")
+        print(layout.bottom_border)
         
         # Add remaining vertical spacing with consistent calculations
         total_content_height = (self.rows + 2) + 4 + 1  # card height + header height + footer height
@@ -966,7 +967,8 @@ class PunchCard:
         self._clear_screen()
 
         # Calculate offsets using helper method with consistent header height
-        x_offset, y_offset = self._calculate_offsets(header_height=4, footer_height=1)
+        layout = self._card_layout(header_height=4, footer_height=1)
+        x_offset, y_offset = layout.x_offset, layout.y_offset
 
         # Add vertical spacing to center the content
         print("\n" * max(0, y_offset))
@@ -978,7 +980,7 @@ class PunchCard:
         print()
 
         # Print top border with corner cutout
-        print(" " * x_offset + "   ┌" + "─" * (self.columns - 1) + "─┐")
+        print(layout.top_border)
 
         # Define the correct row order for punch cards
         row_order = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
@@ -1000,7 +1002,7 @@ class PunchCard:
             print(" " * x_offset + f"{row_num:2s} │{row_content}│")
 
         # Print bottom border
-        print(" " * x_offset + "   └" + "─" * (self.columns - 1) + "─┘")
+        print(layout.bottom_border)
 
         # Add remaining vertical spacing with consistent calculations
         total_content_height = (self.rows + 2) + 4 + 1  # card height + header height + footer height
@@ -1011,179 +1013,42 @@ class PunchCard:
     def _animate_holes_filling(self):
         """Animate holes filling with a wave pattern that moves diagonally"""
         # Calculate offsets for consistent positioning - use same as other methods
-        x_offset, y_offset = self._calculate_offsets(header_height=4, footer_height=1)
-        
-        # Add additional vertical offset to move wave down
-        y_offset += 4  # Move wave down by 3 rows
-        
-        # Define row order and labels
-        row_order = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
-        row_labels = ["12", "11", "0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
-        
-        # Create a temporary grid for the animation
-        temp_grid = [[0 for _ in range(self.columns)] for _ in range(self.rows)]
+        def card_frame(rows, labels_shown=0):
+            """Build the screen lines of the card with the given row contents - no headers"""
+            # Looked up per frame so a resize mid-animation recenters the card
+            layout = self._card_layout(header_height=4, footer_height=1)
+            # Row labels are revealed one by one after the wave
+            prefixes = layout.row_prefixes[:labels_shown] + layout.blank_prefixes[labels_shown:]
+            frame = [""] * (max(0, layout.y_offset + 4) + 1)  # Move wave down by 4 rows
+            frame.append(layout.top_border)
+            frame += [prefix + content + "│" for prefix, content in zip(prefixes, rows)]
+            frame.append(layout.bottom_border)
+            return frame
         
         # Display empty card for 0.2 seconds before starting
         self._clear_screen()
-        
-        # Add vertical spacing to center the content
-        print("\n" * max(0, y_offset))
-        
-        # Print the initial empty card frame - no headers
-        print(" " * x_offset + "   ┌" + "─" * (self.columns - 1) + "─┐")
-        for i, row_idx in enumerate(row_order):
-            row_num = "  "  # Hide row numbers during animation
-            row_content = " " * self.columns
-            print(" " * x_offset + f"{row_num:2s} │{row_content}│")
-        print(" " * x_offset + "   └" + "─" * (self.columns - 1) + "─┘")
-        
-        # Add remaining vertical spacing
-        total_content_height = (self.rows + 2) + 1  # card height + footer height (no headers)
-        remaining_lines = max(0, self.terminal_height - y_offset - total_content_height)
-        if remaining_lines > 0:
-            print("\n" * remaining_lines)
-            
-        time.sleep(0.2)
-        
-        # Calculate total number of diagonals
-        total_diagonals = 12 + self.columns - 1  # Fixed to use 12 rows
-        
-        # Animate holes filling
-        for diagonal in range(total_diagonals + 24):  # Add 24 to allow trailing waves to complete
-            # Calculate start position for leading empty holes
-            if diagonal < 12:  # Fixed to use 12 rows
-                row = diagonal
-                col = 0
-            else:
-                row = 11  # Fixed to use 11 (last row index)
-                col = diagonal - 12 + 1
-            
-            # Fill leading empty holes
-            empty_row, empty_col = row, col
-            while empty_row >= 0 and empty_col < self.columns:
-                if empty_col < self.columns:  # Check column bounds
-                    temp_grid[empty_row][empty_col] = 2  # Use 2 to indicate empty hole
-                empty_row -= 1
-                empty_col += 1
-            
-            # Fill punched holes 12 diagonals behind
-            punched_diagonal = diagonal - 12
-            if punched_diagonal >= 0:
-                if punched_diagonal < 12:  # Fixed to use 12 rows
-                    punched_row = punched_diagonal
-                    punched_col = 0
-                else:
-                    punched_row = 11  # Fixed to use 11 (last row index)
-                    punched_col = punched_diagonal - 12 + 1
-                
-                while punched_row >= 0 and punched_col < self.columns:
-                    if punched_col < self.columns:  # Check column bounds
-                        temp_grid[punched_row][punched_col] = 1  # Use 1 to indicate punched hole
-                    punched_row -= 1
-                    punched_col += 1
-            
-            # Fill trailing empty holes 12 diagonals behind punched holes
-            trailing_diagonal = diagonal - 24
-            if trailing_diagonal >= 0:
-                if trailing_diagonal < 12:  # Fixed to use 12 rows
-                    trailing_row = trailing_diagonal
-                    trailing_col = 0
-                else:
-                    trailing_row = 11  # Fixed to use 11 (last row index)
-                    trailing_col = trailing_diagonal - 12 + 1
-                
-                while trailing_row >= 0 and trailing_col < self.columns:
-                    if trailing_col < self.columns:  # Check column bounds
-                        temp_grid[trailing_row][trailing_col] = 2  # Use 2 to indicate empty hole
-                    trailing_row -= 1
-                    trailing_col += 1
-            
-            # Print current state
-            self._clear_screen()
-            
-            # Add vertical spacing to center the content
-            print("\n" * max(0, y_offset))
-            
-            # Print the card frame with current animation state - no headers
-            print(" " * x_offset + "   ┌" + "─" * (self.columns - 1) + "─┐")
-            for i, row_idx in enumerate(row_order):
-                row_num = "  "  # Hide row numbers during animation
-                row_content = ""
-                for j in range(self.columns):
-                    if temp_grid[row_idx][j] == 1:
-                        row_content += "█"
-                    elif temp_grid[row_idx][j] == 2:
-                        row_content += "□"
-                    else:
-                        row_content += " "
-                print(" " * x_offset + f"{row_num:2s} │{row_content}│")
-            print(" " * x_offset + "   └" + "─" * (self.columns - 1) + "─┘")
-            
-            # Add remaining vertical spacing
-            remaining_lines = max(0, self.terminal_height - y_offset - total_content_height)
-            if remaining_lines > 0:
-                print("\n" * remaining_lines)
-                
-            time.sleep(0.05)  # Adjust speed of animation
-        
-        # Animate row numbers counting up starting from 0
-        for i in range(13):  # Fixed to use 13 (12 rows + 1 for final state)
-            self._clear_screen()
-            
-            # Add vertical spacing to center the content
-            print("\n" * max(0, y_offset))
-            
-            print(" " * x_offset + "   ┌" + "─" * (self.columns - 1) + "─┐")
-            for j, row_idx in enumerate(row_order):
-                # Show row numbers in order: 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12
-                if j < i:
-                    row_num = row_labels[j]
-                else:
-                    row_num = "  "  # Hide row number if we haven't reached it yet
-                row_content = ""
-                for k in range(self.columns):
-                    if temp_grid[row_idx][k] == 1:
-                        row_content += "█"
-                    elif temp_grid[row_idx][k] == 2:
-                        row_content += "□"
-                    else:
-                        row_content += " "
-                print(" " * x_offset + f"{row_num:2s} │{row_content}│")
-            print(" " * x_offset + "   └" + "─" * (self.columns - 1) + "─┘")
-            
-            # Add remaining vertical spacing
-            remaining_lines = max(0, self.terminal_height - y_offset - total_content_height)
-            if remaining_lines > 0:
-                print("\n" * remaining_lines)
-                
-            time.sleep(0.1)  # Adjust speed of row number animation
-        
-        # Keep the final state visible for 0.2 seconds with all row numbers
-        self._clear_screen()
-        
-        # Add vertical spacing to center the content
-        print("\n" * max(0, y_offset))
-        
-        print(" " * x_offset + "   ┌" + "─" * (self.columns - 1) + "─┐")
-        for i, row_idx in enumerate(row_order):
-            row_num = row_labels[i]  # Show all row numbers in final state
-            row_content = ""
-            for j in range(self.columns):
-                if temp_grid[row_idx][j] == 1:
-                    row_content += "█"
-                elif temp_grid[row_idx][j] == 2:
-                    row_content += "□"
-                else:
-                    row_content += " "
-            print(" " * x_offset + f"{row_num:2s} │{row_content}│")
-        print(" " * x_offset + "   └" + "─" * (self.columns - 1) + "─┘")
-        
-        # Add remaining vertical spacing
-        remaining_lines = max(0, self.terminal_height - y_offset - total_content_height)
-        if remaining_lines > 0:
-            print("\n" * remaining_lines)
-            
-        time.sleep(1.0)
+        self.renderer.render(card_frame([" " * self.columns] * self.rows))
+        self.sleep(0.2)
+        
+        # Play back the precompiled wave; frames are skipped only when behind schedule
+        frames = hole_wave_text(self.rows, self.columns)
+        scheduler = self.scheduler
+        scheduler.start()
+        draw = True
+        for rows in frames:
+            if draw:
+                self.renderer.render(card_frame(rows))
+            draw = scheduler.wait(0.05)  # Adjust speed of animation
+        
+        # Animate row numbers counting up
+        for i in range(self.rows + 1):
+            if draw:
+                self.renderer.render(card_frame(frames[-1], labels_shown=i))
+            draw = scheduler.wait(0.1)  # Adjust speed of row number animation
+        
+        # Keep the final state visible with all row numbers
+        self.renderer.render(card_frame(frames[-1], labels_shown=self.rows))
+        self.sleep(1.0)
 
     def _show_settings_menu(self):
         """
@@ -1443,9 +1308,9 @@ class PunchCard:
             self._display_card_frame(content, show_row_numbers=False, is_settings=False, hide_headers=True)
             # Longer delay for title pages, shorter for loading messages
             if i < 4:  # First 4 messages (title pages)
-                time.sleep(1.2)  # 1.2 seconds for title pages
+                self.sleep(1.2)  # 1.2 seconds for title pages
             else:
-                time.sleep(0.7)  # 0.7 seconds for loading messages
+                self.sleep(0.7)  # 0.7 seconds for loading messages
         
         # Get current statistics
         stats = self.stats.get_stats()
@@ -1465,7 +1330,7 @@ class PunchCard:
             f"LED Brightness: {self.brightness:.2f}"
         ]
         self._display_card_frame(config_stats, show_row_numbers=False, is_settings=False, hide_headers=True)
-        time.sleep(2.5)  # Increased from 2 to 2.5 seconds
+        self.sleep(2.5)  # Increased from 2 to 2.5 seconds
         
         # Page 2: System Status
         system_stats = [
@@ -1478,7 +1343,7 @@ class PunchCard:
             f"Last Update: {datetime.fromtimestamp(stats['last_update']).strftime('%Y-%m-%d %H:%M:%S')}"
         ]
         self._display_card_frame(system_stats, show_row_numbers=False, is_settings=False, hide_headers=True)
-        time.sleep(2.5)  # Increased from 2 to 2.5 seconds
+        self.sleep(2.5)  # Increased from 2 to 2.5 seconds
         
         # Page 3: Statistics Overview
         overview_stats = [
@@ -1489,7 +1354,7 @@ class PunchCard:
             f"Version: {VERSION}"
         ]
         self._display_card_frame(overview_stats, show_row_numbers=False, is_settings=False, hide_headers=True)
-        time.sleep(2.5)  # Increased from 2 to 2.5 seconds
+        self.sleep(2.5)  # Increased from 2 to 2.5 seconds
         
         # Page 4: Character Statistics - Numbers and Letters
         char_stats = ["Character Statistics"]
@@ -1529,7 +1394,7 @@ class PunchCard:
         char_stats.append(f'"Space":{space_count}')
         
         self._display_card_frame(char_stats, show_row_numbers=False, is_settings=False, hide_headers=True)
-        time.sleep(2.5)  # Increased from 2 to 2.5 seconds
+        self.sleep(2.5)  # Increased from 2 to 2.5 seconds
         
         # Page 5: Symbol Statistics - Reorganized for better visuals
         symbol_stats = ["Symbol Statistics"]
@@ -1567,7 +1432,7 @@ class PunchCard:
             symbol_stats.append(symbol_line)
         
         self._display_card_frame(symbol_stats, show_row_numbers=False, is_settings=False, hide_headers=True)
-        time.sleep(2.5)  # Increased from 2 to 2.5 seconds
+        self.sleep(2.5)  # Increased from 2 to 2.5 seconds
         
         # Page 6: Message Length Statistics (sorted by length, longest first)
         msg_stats = ["Message Length Statistics"]
@@ -1576,7 +1441,7 @@ class PunchCard:
         for length, count in sorted_lengths:
             msg_stats.append(f"{length} Characters: {count} Instances")
         self._display_card_frame(msg_stats, show_row_numbers=False, is_settings=False, hide_headers=True)
-        time.sleep(2.5)  # Increased from 2 to 2.5 seconds
+        self.sleep(2.5)  # Increased from 2 to 2.5 seconds
         
         # Show settings prompt
         if self._prompt_for_settings():
@@ -1586,7 +1451,7 @@ class PunchCard:
         self._animate_holes_filling()
         
         # Final pause before starting
-        time.sleep(1)  # Keep at 1 second
+        self.sleep(1)  # Keep at 1 second
         
         # Clear the screen and display empty card for the final state
         self._clear_screen()
@@ -1598,9 +1463,7 @@ class PunchCard:
         """Clear the display"""
         self.current_message = ""
         self.current_column = 0
-        for row in range(self.rows):
-            for col in range(self.columns):
-                self.grid[row][col] = 0
+        self.grid.clear()
         self._display_grid() 
 
     def _display_status(self, status_text: str, status_value: str = "") -> None:
@@ -1683,7 +1546,8 @@ class PunchCard:
         self._clear_screen()
         
         # Calculate centering offsets - always use 4 for header height to maintain consistent positioning
-        x_offset, y_offset = self._calculate_offsets(header_height=4, footer_height=1)
+        layout = self._card_layout(header_height=4, footer_height=1)
+        x_offset, y_offset = layout.x_offset, layout.y_offset
         
         # Add vertical spacing to center the card
         print("\n" * max(0, y_offset))
@@ -1699,7 +1563,7 @@ class PunchCard:
             print("\n" * 4)  # Keep the same spacing as with headers
         
         # Print top border
-        print(" " * x_offset + "   ┌" + "─" * (self.columns - 1) + "─┐")
+        print(layout.top_border)
         
         # Define row order and labels
         row_order = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
@@ -1722,7 +1586,7 @@ class PunchCard:
             print(" " * x_offset + f"{row_num:2s} │{row_content}│")
         
         # Print bottom border
-        print(" " * x_offset + "   └" + "─" * (self.columns - 1) + "─┘")
+        print(layout.bottom_border)
         
         # Add remaining vertical spacing to complete centering
         # Always use consistent total_content_height to ensure proper positioning
@@ -1783,6 +1647,35 @@ class PunchCard:
 
     def _calculate_offsets(self, header_height: int = 4, footer_height: int = 1, apply_additional_offset: bool = False):
         """Calculate horizontal and vertical offsets for centering content."""
+        layout = self._card_layout(header_height, footer_height, apply_additional_offset)
+        return layout.x_offset, layout.y_offset
+    
+    def _card_layout(self, header_height: int = 4, footer_height: int = 1, apply_additional_offset: bool = False) -> CardLayout:
+        """
+        Get the centering offsets and card chrome for the current terminal size.
+        
+        Layouts are cached and only rebuilt after the terminal is resized.
+        
+        Args:
+            header_height: Lines reserved above the card
+            footer_height: Lines reserved below the card
+            apply_additional_offset: Shift the card down 4 lines (main display)
+            
+        Returns:
+            CardLayout for these parameters
+        """
+        if self._terminal_resized:
+            self._ensure_terminal_size()
+            # Whatever is on screen was laid out for the old size
+            self.renderer.clear()
+        key = (header_height, footer_height, apply_additional_offset, self.rows, self.columns)
+        layout = self._layouts.get(key)
+        if layout is None:
+            layout = self._layouts[key] = self._build_layout(header_height, footer_height, apply_additional_offset)
+        return layout
+    
+    def _build_layout(self, header_height: int, footer_height: int, apply_additional_offset: bool) -> CardLayout:
+        """Compute a CardLayout from scratch (see _card_layout)."""
         card_width = self.columns + 4  # 80 columns + 2 borders + 2 spaces for row numbers
         card_height = self.rows + 2  # 12 rows + top and bottom borders
         
@@ -1795,7 +1688,17 @@ class PunchCard:
         if apply_additional_offset:
             y_offset += 4  # Changed back from 3 to 4 to restore previous positioning
 
-        return x_offset, y_offset
+        indent = " " * x_offset
+        labels = ROW_LABELS[:self.rows] + [""] * (self.rows - len(ROW_LABELS))
+        return CardLayout(
+            x_offset=x_offset,
+            y_offset=y_offset,
+            indent=indent,
+            top_border=indent + "   ┌" + "─" * (self.columns - 1) + "─┐",
+            bottom_border=indent + "   └" + "─" * (self.columns - 1) + "─┘",
+            row_prefixes=tuple(indent + f"{label:2s} │" for label in labels),
+            blank_prefixes=(indent + "   │",) * self.rows,
+        )
 
     def get_display_data(self) -> Dict[str, Any]:
         """
@@ -1807,7 +1710,7 @@ class PunchCard:
         """
         # Prepare data for display adapters
         data = {
-            'grid': self.grid_state if hasattr(self, 'grid_state') else [[False for _ in range(COLUMNS)] for _ in range(ROWS)],
+            'grid': self.displayed_grid if hasattr(self, 'displayed_grid') else CardGrid(ROWS, COLUMNS).freeze(),
             'message': self.current_message if hasattr(self, 'current_message') else DEFAULT_MESSAGE,
             'status': self.status if hasattr(self, 'status') else "Ready",
             'version': VERSION,
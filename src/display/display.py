@@ -24,19 +24,31 @@ import shutil
 from typing import List, Tuple, Callable, Optional, Dict, Union, Any
 from functools import partial
 
+from src.core.hollerith import encode_char, encode_text
+from src.core.card_grid import CardGrid
+from src.utils.frame_scheduler import FrameScheduler
+
 # Rich imports for terminal display
 try:
-    from rich.console import Console
+    from rich.align import Align
+    from rich.console import Console, Group
     from rich.panel import Panel
     from rich.layout import Layout
     from rich.live import Live
-    from rich.table import Table
     from rich.text import Text
-    from rich.align import Align
     RICH_AVAILABLE = True
 except ImportError:
     RICH_AVAILABLE = False
 
+# Characters for the Rich grid
+RICH_ON_CHAR = "█"
+RICH_OFF_CHAR = "░"
+ROW_LABELS = ["12", "11", "0 ", "1 ", "2 ", "3 ", "4 ", "5 ", "6 ", "7 ", "8 ", "9 "]
+
+def _row_label(row: int) -> str:
+    """Get the two-character label of a grid row (row numbers past the 12 Hollerith rows)."""
+    return ROW_LABELS[row] if row < len(ROW_LABELS) else f"{row:<2}"
+
 # PyQt6 imports for GUI display
 try:
     from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
@@ -75,13 +87,16 @@ class PunchCardDisplay:
         """
         self.num_rows = num_rows
         self.num_cols = num_cols
-        self.grid = [[False for _ in range(num_cols)] for _ in range(num_rows)]
+        self.grid = CardGrid(num_rows, num_cols)
         self.led_delay = led_delay
         self.message_delay = message_delay
         self.random_delay = random_delay
         self.skip_splash = skip_splash
         self.debug_mode = debug_mode
         
+        # Paces animation frames against monotonic deadlines
+        self.scheduler = FrameScheduler()
+        
         # Statistics for tracking operations
         self.stats = {
             "start_time": time.time(),
@@ -120,6 +135,9 @@ class PunchCardDisplay:
             Layout(name="legend", size=3),
             Layout(name="status", size=3)
         )
+        
+        # Build the renderables once; frames only edit the Text objects in place
+        self._build_rich_renderables()
     
     def _init_gui_display(self) -> None:
         """Initialize the PyQt6-based GUI display."""
@@ -217,20 +235,26 @@ class PunchCardDisplay:
             state: True for on, False for off
         """
         if 0 <= row < self.num_rows and 0 <= col < self.num_cols:
-            self.grid[row][col] = state
+            # Unchanged LEDs need no refresh
+            if not self.grid.set(row, col, state):
+                return
             
             # Update display if necessary
-            if self.display_mode == "gui":
+            if self.display_mode == "rich":
+                self._set_rich_cell(row, col, state)
+            elif self.display_mode == "gui":
                 # In GUI mode, refresh the display
                 if hasattr(self, 'window') and hasattr(self.window, 'punch_card'):
                     self.window.punch_card.update()
     
     def clear_grid(self) -> None:
         """Clear the entire grid."""
-        self.grid = [[False for _ in range(self.num_cols)] for _ in range(self.num_rows)]
+        self.grid.clear()
         
         # Update display if necessary
-        if self.display_mode == "gui":
+        if self.display_mode == "rich":
+            self._reset_rich_rows()
+        elif self.display_mode == "gui":
             # In GUI mode, refresh the display
             if hasattr(self, 'window') and hasattr(self.window, 'punch_card'):
                 self.window.punch_card.update()
@@ -269,45 +293,22 @@ class PunchCardDisplay:
                 self.clear_grid()
                 
                 # Display message character by character
-                for i, char in enumerate(message):
-                    # Update the grid
-                    self._display_character(char, i)
-                    
-                    # Update the display
-                    self.layout["grid"].update(
-                        Panel(
-                            Align.center(self._create_rich_grid_display()),
-                            title="[bold blue]Punch Card Display[/]",
-                            border_style="blue"
-                        )
-                    )
-                    self.layout["legend"].update(
-                        Panel(
-                            Align.center(self._create_rich_legend()),
-                            title="[bold green]Legend[/]",
-                            border_style="green"
-                        )
-                    )
-                    self.layout["status"].update(
-                        Panel(
-                            Align.center(Text(f"[bold]Displaying:[/] {message[:i+1]}", style="blue")),
-                            border_style="yellow"
-                        )
-                    )
+                self.scheduler.start()
+                draw = True
+                for i, code in enumerate(encode_text(message)):
+                    # Update the grid (set_led edits the changed cells of the row Texts)
+                    self._display_column(code, i)
                     
-                    # Refresh the display
-                    live.refresh()
-                    time.sleep(self.led_delay)
+                    # Refresh the display once per frame, unless behind schedule
+                    if draw:
+                        self._set_rich_status("Displaying: ", message[:i+1], "blue")
+                        live.refresh()
+                    draw = self.scheduler.wait(self.led_delay)
                 
                 # Final update
-                self.layout["status"].update(
-                    Panel(
-                        Align.center(Text("[bold green]Message display complete[/]")),
-                        border_style="green"
-                    )
-                )
+                self._set_rich_status("Message display complete", "", "bold green")
                 live.refresh()
-                time.sleep(self.message_delay)
+                self.scheduler.wait(self.message_delay)
         except Exception as e:
             print(f"\n\nDisplay error: {e}")
             print("Please ensure your terminal window is large enough.")
@@ -335,65 +336,79 @@ class PunchCardDisplay:
         self.clear_grid()
         
         # Display message character by character
-        for i, char in enumerate(message):
+        self.scheduler.start()
+        draw = True
+        codes = encode_text(message)
+        for i, code in enumerate(codes):
             # Update the grid
-            self._display_character(char, i)
+            self._display_column(code, i)
             
-            # Print the current state
-            self._print_simple_grid()
-            print(f"Displaying: {message[:i+1]}")
+            # Print the current state, unless behind schedule
+            if draw or i == len(codes) - 1:
+                self._print_simple_grid()
+                print(f"Displaying: {message[:i+1]}")
             
             # Delay
-            time.sleep(self.led_delay)
+            draw = self.scheduler.wait(self.led_delay)
         
         # Final message
         print("\nMessage display complete")
-        time.sleep(self.message_delay)
+        self.scheduler.wait(self.message_delay)
     
-    def _create_rich_grid_display(self) -> Table:
-        """Create the grid display table for Rich display."""
-        table = Table(show_header=False, box=None, padding=0, width=self.required_width-4)
-        
-        # Define the correct row order for punch cards
-        row_labels = ["12", "11", "0 ", "1 ", "2 ", "3 ", "4 ", "5 ", "6 ", "7 ", "8 ", "9 "]
-        
-        # Add top spacing (3 rows for better fit)
-        for _ in range(3):
-            table.add_row("  │" + "─" * self.num_cols + "│")
-        
-        # Add the actual punch card rows
-        for i in range(12):
-            row_content = []
-            for j in range(self.num_cols):
-                row_content.append("█" if self.grid[i][j] else "░")
-            table.add_row(f"{row_labels[i]}│{''.join(row_content)}│")
-        
-        # Add bottom spacing (3 rows for better fit)
-        for _ in range(3):
-            table.add_row("  │" + "─" * self.num_cols + "│")
-        
-        return table
+    def _build_rich_renderables(self) -> None:
+        """Create the persistent panels and Text objects for Rich display."""
+        # One Text per punch card row, plus static spacing rows above and below
+        spacer = "  │" + "─" * self.num_cols + "│"
+        self._rich_rows = [Text(f"{_row_label(i)}│{RICH_OFF_CHAR * self.num_cols}│", no_wrap=True)
+                           for i in range(self.num_rows)]
+        spacing = [Text(spacer, no_wrap=True) for _ in range(3)]
+        self.layout["grid"].update(
+            Panel(
+                Align.center(Group(*spacing, *self._rich_rows, *spacing)),
+                title="[bold blue]Punch Card Display[/]",
+                border_style="blue"
+            )
+        )
+        self.layout["legend"].update(
+            Panel(
+                Text.from_markup(f"[bold]{RICH_ON_CHAR}[/] = Punched hole    [bold]{RICH_OFF_CHAR}[/] = No hole",
+                                 justify="center"),
+                title="[bold green]Legend[/]",
+                border_style="green"
+            )
+        )
+        self._rich_status = Text(justify="center")
+        self.layout["status"].update(Panel(self._rich_status, border_style="yellow"))
+    
+    def _set_rich_cell(self, row: int, col: int, state: bool) -> None:
+        """Update one LED in its row Text."""
+        text = self._rich_rows[row]
+        line = text.plain
+        pos = 3 + col  # After the row label and border
+        text.plain = line[:pos] + (RICH_ON_CHAR if state else RICH_OFF_CHAR) + line[pos + 1:]
+    
+    def _reset_rich_rows(self) -> None:
+        """Blank every row Text."""
+        for i, text in enumerate(self._rich_rows):
+            text.plain = f"{_row_label(i)}│{RICH_OFF_CHAR * self.num_cols}│"
     
-    def _create_rich_legend(self) -> Table:
-        """Create the legend table for Rich display."""
-        table = Table(show_header=False, box=None, width=self.required_width-4)
-        table.add_row(Align.center("[bold]█[/] = Punched hole    [bold]░[/] = No hole"))
-        return table
+    def _set_rich_status(self, label: str, detail: str, style: str) -> None:
+        """Replace the status line text in place."""
+        status = self._rich_status
+        status.plain = ""
+        status.style = style
+        status.append(label, style="bold")
+        status.append(detail)
     
     def _print_simple_grid(self) -> None:
         """Print the grid using simple ASCII characters."""
-        # Define the correct row order for punch cards
-        row_labels = ["12", "11", "0 ", "1 ", "2 ", "3 ", "4 ", "5 ", "6 ", "7 ", "8 ", "9 "]
-        
         # Print top border
         print("   +" + "-" * self.num_cols + "+")
         
         # Print the grid rows
         for i in range(12):
-            row_content = []
-            for j in range(self.num_cols):
-                row_content.append("#" if self.grid[i][j] else ".")
-            print(f"{row_labels[i]} |{''.join(row_content)}|")
+            row_content = ["#" if punched else "." for punched in self.grid.row_bits(i)]
+            print(f"{ROW_LABELS[i]} |{''.join(row_content)}|")
         
         # Print bottom border
         print("   +" + "-" * self.num_cols + "+")
@@ -406,52 +421,22 @@ class PunchCardDisplay:
             char: Character to display
             col: Column to display the character in
         """
-        # Convert to uppercase
-        char = char.upper()
-        
-        # Clear the column first
-        for row in range(12):
-            self.set_led(row, col, False)
-        
-        # Handle different character types
-        if char.isalpha():
-            # Letters
-            if char in "ABCDEFGHI":
-                # A-I: row 12 + digit 1-9
-                self.set_led(0, col, True)  # Row 12
-                digit = ord(char) - ord('A') + 1
-                self.set_led(digit + 2, col, True)  # Convert to punch card row
-            elif char in "JKLMNOPQR":
-                # J-R: row 11 + digit 1-9
-                self.set_led(1, col, True)  # Row 11
-                digit = ord(char) - ord('J') + 1
-                self.set_led(digit + 2, col, True)  # Convert to punch card row
-            else:
-                # S-Z: row 0 + digit 2-9
-                self.set_led(2, col, True)  # Row 0
-                digit = ord(char) - ord('S') + 2
-                if digit <= 9:
-                    self.set_led(digit + 2, col, True)  # Convert to punch card row
-        
-        elif char.isdigit():
-            # Digits 0-9
-            digit = int(char)
-            if digit == 0:
-                self.set_led(2, col, True)  # Row 0
-            else:
-                self.set_led(digit + 2, col, True)  # Convert to punch card row
-        
-        elif char == ' ':
-            # Space - no punches
-            pass
+        self._display_column(encode_char(char), col)
+    
+    def _display_column(self, code: int, col: int) -> None:
+        """
+        Display an encoded column on the punch card grid.
         
-        else:
-            # Special characters - simplified version
-            self.set_led(1, col, True)  # Row 11
-            self.set_led(2, col, True)  # Row 0
+        Args:
+            code: 12-bit column code from the Hollerith encoder
+            col: Column to display the code in
+        """
+        # Set every row of the column from the code bits
+        for row in range(self.num_rows):
+            self.set_led(row, col, bool((code >> row) & 1))
         
         # Update the total hole count
-        if char != ' ':
+        if code:
             self.stats["total_holes"] += 1
     
     def show_splash_screen(self) -> None:
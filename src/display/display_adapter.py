@@ -6,10 +6,12 @@ with the existing punch card system.
 
 import time
 import threading
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Optional, Union
 
 # Import the terminal display module
 from src.display.terminal_display import TerminalDisplay, CharacterSet
+from src.core.hollerith import decode_grid, verify_displayed
+from src.core.card_grid import CardGrid, FrozenCardGrid
 
 class DisplayAdapter:
     """Adapter to connect a display interface with the punch card system."""
@@ -62,15 +64,18 @@ class DisplayAdapter:
     
     def _update_loop(self):
         """Update loop to keep the display in sync with the punch card state."""
+        last_frame = None
         try:
             while self.running:
                 # Get data from punch card
                 if hasattr(self.punch_card, 'get_display_data'):
                     data = self.punch_card.get_display_data()
                     
-                    # Update display with data
-                    if hasattr(self.display, 'update'):
+                    # Only push frames whose grid, message or status changed
+                    frame = (data.get('grid'), data.get('message'), data.get('status'))
+                    if frame != last_frame and hasattr(self.display, 'update'):
                         self.display.update(data)
+                        last_frame = frame
                 
                 # Sleep to avoid high CPU usage
                 time.sleep(0.1)
@@ -125,7 +130,7 @@ class PunchCardDisplayAdapter:
         self.terminal_display = TerminalDisplay(verbose=verbose, char_set=char_set)
         
         # Initialize grid state
-        self.grid_state = [[False for _ in range(num_cols)] for _ in range(num_rows)]
+        self.grid_state = CardGrid(num_rows, num_cols)
         
         # Start the terminal display
         if self.use_ui:
@@ -147,7 +152,8 @@ class PunchCardDisplayAdapter:
             state: True to turn on, False to turn off
         """
         if 0 <= row < self.num_rows and 0 <= col < self.num_cols:
-            self.grid_state[row][col] = state
+            if not self.grid_state.set(row, col, state):
+                return
             
             if self.use_ui:
                 self.terminal_display.update_led_grid(self.grid_state)
@@ -161,18 +167,37 @@ class PunchCardDisplayAdapter:
         Args:
             led_states: List of (row, col, state) tuples
         """
+        changed = 0
         for row, col, state in led_states:
             if 0 <= row < self.num_rows and 0 <= col < self.num_cols:
-                self.grid_state[row][col] = state
+                changed += self.grid_state.set(row, col, state)
+        
+        # Skip the push entirely when no LED actually changed
+        if not changed:
+            return
         
         if self.use_ui:
             self.terminal_display.update_led_grid(self.grid_state)
         elif self.verbose:
-            print(f"Updated {len(led_states)} LEDs")
+            print(f"Updated {changed} of {len(led_states)} LEDs")
+    
+    def show_grid(self, target: CardGrid) -> int:
+        """
+        Bring the LEDs to a target card state, driving only the cells that differ.
+        
+        Args:
+            target: Card state to display (same size as the adapter grid)
+            
+        Returns:
+            Number of LEDs that changed
+        """
+        changes = self.grid_state.diff(target)
+        self.set_multiple_leds(changes)
+        return len(changes)
     
     def clear_all(self):
         """Clear all LEDs (turn them off)."""
-        self.grid_state = [[False for _ in range(self.num_cols)] for _ in range(self.num_rows)]
+        self.grid_state.clear()
         
         if self.use_ui:
             self.terminal_display.update_led_grid(self.grid_state)
@@ -196,29 +221,50 @@ class PunchCardDisplayAdapter:
         elif self.verbose:
             print(f"[{level.upper()}] {message}")
     
-    def get_grid_state(self) -> List[List[bool]]:
-        """Get the current grid state."""
-        return self.grid_state
+    def get_grid_state(self) -> FrozenCardGrid:
+        """Get a read-only snapshot of the current grid state."""
+        return self.grid_state.freeze()
     
-    def update_grid_from_punch_card(self, punch_card_grid: List[List[bool]]):
+    def get_displayed_text(self) -> str:
+        """Decode the current grid state back into the text it shows."""
+        return decode_grid(self.grid_state)
+    
+    def verify_message(self, message: str) -> List[int]:
+        """
+        Check the current grid state against the message that was sent.
+        
+        Args:
+            message: Message that should be displayed
+            
+        Returns:
+            Column indices whose LEDs do not match the encoded message
+        """
+        return verify_displayed(self.grid_state, message)
+    
+    def update_grid_from_punch_card(self, punch_card_grid: Union[CardGrid, List[List[bool]]]):
         """
         Update the grid state from the punch card grid.
         This handles any differences in grid format between systems.
         
         Args:
-            punch_card_grid: Punch card grid to update from
+            punch_card_grid: Punch card grid (CardGrid or list of rows) to update from
         """
-        # Copy the grid data (with size checks)
-        rows_to_copy = min(len(punch_card_grid), self.num_rows)
+        if not isinstance(punch_card_grid, CardGrid):
+            punch_card_grid = CardGrid.from_rows(punch_card_grid)
+        
+        # Copy the grid data a column at a time (with size checks)
+        rows_to_copy = min(punch_card_grid.rows, self.num_rows)
+        cols_to_copy = min(punch_card_grid.columns, self.num_cols)
+        row_mask = (1 << rows_to_copy) - 1
         
-        for i in range(rows_to_copy):
-            row = punch_card_grid[i]
-            cols_to_copy = min(len(row), self.num_cols)
-            for j in range(cols_to_copy):
-                self.grid_state[i][j] = row[j]
+        changed = 0
+        for col in range(cols_to_copy):
+            code = self.grid_state.get_column(col) & ~row_mask
+            changed += self.grid_state.set_column(col, code | (punch_card_grid.get_column(col) & row_mask))
         
         if self.use_ui:
-            self.terminal_display.update_led_grid(self.grid_state)
+            if changed:
+                self.terminal_display.update_led_grid(self.grid_state)
             self.terminal_display.add_debug_message(f"Updated grid from punch card ({rows_to_copy}x{cols_to_copy})")
         elif self.verbose:
             print(f"Updated grid from punch card ({rows_to_copy}x{cols_to_copy})") 
\ No newline at end of file
@@ -0,0 +1,128 @@
+"""
+ANSI Frame Renderer for the Punch Card Project.
+
+Terminal mode used to clear the screen with os.system('clear') (a fork and
+exec) and re-print every line of every frame. FrameRenderer keeps the
+previous frame as a list of lines and, for each new frame, emits ANSI
+cursor positioning plus only the changed span of each changed line. The
+whole frame goes out in a single write() followed by one flush(), so the
+terminal never shows a half-drawn frame.
+
+Usage:
+    from src.display.frame_renderer import FrameRenderer
+
+    renderer = FrameRenderer()
+    renderer.render(["Status: TYPING", "12 │█□□□...│"])
+    renderer.clear()        # blank the screen and force a full redraw
+"""
+
+import sys
+from typing import List, Optional, Sequence, TextIO
+
+# ANSI escape sequences
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+ERASE_TO_EOL = "\x1b[K"
+
+def move_to(row: int, col: int = 0) -> str:
+    """Get the escape sequence that moves the cursor to a 0-based row/column."""
+    return f"\x1b[{row + 1};{col + 1}H"
+
+def changed_span(old: str, new: str) -> Optional[tuple]:
+    """
+    Find the part of a line that differs between two frames.
+
+    Returns:
+        (start, end) slice of the new line to write, with end None when the
+        rest of the line must be rewritten and erased; None if unchanged
+    """
+    if old == new:
+        return None
+    limit = min(len(old), len(new))
+    start = 0
+    while start < limit and old[start] == new[start]:
+        start += 1
+    if len(old) != len(new):
+        return start, None
+    end = len(new)
+    while end > start and old[end - 1] == new[end - 1]:
+        end -= 1
+    return start, end
+
+class FrameRenderer:
+    """Draws full-screen text frames, rewriting only what changed."""
+
+    def __init__(self, out: Optional[TextIO] = None):
+        """
+        Initialize the renderer.
+
+        Args:
+            out: Text stream to write frames to (defaults to sys.stdout)
+        """
+        self.out = out
+        self._previous: Optional[List[str]] = None
+        self.frames = 0
+        self.bytes_written = 0
+
+    @property
+    def stream(self) -> TextIO:
+        """The stream frames are written to."""
+        return self.out if self.out is not None else sys.stdout
+
+    def invalidate(self):
+        """Forget the previous frame so the next render redraws everything."""
+        self._previous = None
+
+    def clear(self):
+        """
+        Blank the screen now. Other output may follow before the next frame,
+        so that frame is drawn in full.
+        """
+        self._write(CLEAR_SCREEN)
+        self._previous = None
+
+    def render(self, lines: Sequence[str]) -> int:
+        """
+        Draw a frame.
+
+        Args:
+            lines: The full frame, one string per screen line from the top
+
+        Returns:
+            Number of lines that changed
+        """
+        previous = self._previous
+        parts = []
+        if previous is None:
+            # Nothing known about the screen: clear it and draw every line
+            parts.append(CLEAR_SCREEN)
+            previous = []
+        changed = 0
+        for row, line in enumerate(lines):
+            old = previous[row] if row < len(previous) else ""
+            span = changed_span(old, line)
+            if span is None:
+                continue
+            changed += 1
+            start, end = span
+            if end is None:
+                parts.append(move_to(row, start) + line[start:] + ERASE_TO_EOL)
+            else:
+                parts.append(move_to(row, start) + line[start:end])
+        # Blank out lines left over from a taller previous frame
+        for row in range(len(lines), len(previous)):
+            if previous[row]:
+                parts.append(move_to(row) + ERASE_TO_EOL)
+                changed += 1
+        # Park the cursor below the frame so stray output lands there
+        parts.append(move_to(len(lines)))
+        self._write("".join(parts))
+        self._previous = list(lines)
+        self.frames += 1
+        return changed
+
+    def _write(self, data: str):
+        """Write data in one call and flush it."""
+        stream = self.stream
+        stream.write(data)
+        stream.flush()
+        self.bytes_written += len(data)
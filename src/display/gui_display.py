@@ -13,19 +13,28 @@ import math
 import os
 import socket
 import threading
+import html
+from collections import deque
 from functools import partial
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Callable, List, NamedTuple, Optional, Dict, Any, Tuple
 from datetime import datetime
 import json
 
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QLabel, QPushButton, QStackedLayout, QRadioButton,
-                            QSizePolicy, QFrame, QDialog, QTextEdit, QSpinBox,
+                            QSizePolicy, QFrame, QDialog, QTextEdit, QPlainTextEdit, QSpinBox,
                             QCheckBox, QFormLayout, QGroupBox, QTabWidget, 
                             QLineEdit, QComboBox, QSlider, QDoubleSpinBox,
                             QDialogButtonBox, QMessageBox, QMenu, QSpacerItem)
 from PyQt6.QtCore import Qt, QTimer, QSize, QRect, QRectF, pyqtSignal, QDir, QObject, QEvent, QPoint, QDateTime
-from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QPalette, QBrush, QPainterPath, QKeyEvent
+from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QPalette, QBrush, QPainterPath, QKeyEvent, QPixmap
+
+from src.core.hollerith import encode_char, encode_text, describe_code
+from src.core.card_grid import CardGrid
+from src.core.animations import MaskStep, splash_steps
+from src.display.tick_scheduler import TickScheduler
+from src.display.network_tasks import (NetworkTaskRunner, fetch_status, list_chat_models, check_api_key,
+                                       OPENAI_STATUS_URL, FLYIO_STATUS_URL)
 
 # Color scheme
 COLORS = {
@@ -95,6 +104,9 @@ NOTCH_HEIGHT = int(6.35 * SCALE_FACTOR)   # 4/16 inch = 6.35mm
 NUM_ROWS = 12
 NUM_COLS = 80
 
+# Margin around a hole repainted when it changes, so its outline is fully refreshed
+HOLE_UPDATE_MARGIN = 4
+
 class ClassicTitleBar(QWidget):
     """Classic Macintosh-style title bar."""
     def __init__(self, title: str, parent=None):
@@ -160,6 +172,18 @@ class RetroButton(QPushButton):
         self.setFont(get_font(size=12))
 
 
+class HoleGeometry(NamedTuple):
+    """Pixel positions of the card and every hole for one widget size."""
+    size: QSize
+    card_x: int
+    card_y: int
+    left: float        # x of column 0
+    top: float         # y of row 0
+    col_pitch: float
+    row_pitch: float
+    holes: Tuple[Tuple[QRectF, ...], ...]        # [col][row] hole rectangle
+    update_rects: Tuple[Tuple[QRect, ...], ...]  # [col][row] area to repaint when the hole changes
+
 class PunchCardWidget(QWidget):
     """Widget for displaying the minimalist punch card."""
     
@@ -167,7 +191,12 @@ class PunchCardWidget(QWidget):
         super().__init__(parent)
         self.num_rows = NUM_ROWS
         self.num_cols = NUM_COLS
-        self.grid = [[False for _ in range(self.num_cols)] for _ in range(self.num_rows)]
+        self.grid = CardGrid(self.num_rows, self.num_cols)
+        
+        # Hole positions and the card outline with empty holes, built once per size
+        self._geometry: Optional[HoleGeometry] = None
+        self._background: Optional[QPixmap] = None
+        self._hole_pen = QPen(COLORS['hole_outline'], 0.15)
         
         # Initialize dimensions
         self.update_dimensions()
@@ -177,6 +206,8 @@ class PunchCardWidget(QWidget):
         palette = self.palette()
         palette.setColor(QPalette.ColorRole.Window, COLORS['background'])
         self.setPalette(palette)
+        # paintEvent covers every pixel with the cached background, so skip erasing first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
         
         # Ensure widget maintains a consistent size policy
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -211,65 +242,142 @@ class PunchCardWidget(QWidget):
         # Update minimum size
         window_margin = 40
         self.setMinimumSize(self.card_width + 2*window_margin, self.card_height + 2*window_margin)
+        self._invalidate_geometry()
         self.update()
     
     def resizeEvent(self, event):
         """Handle resize events to maintain consistent appearance."""
         super().resizeEvent(event)
-        # No additional logic needed here as paintEvent will handle proper centering
+        # The card is re-centered, so the cached geometry no longer lines up
+        if self._geometry is not None and self._geometry.size != event.size():
+            self._invalidate_geometry()
     
     def set_led(self, row: int, col: int, state: bool):
         """Set a single LED in the grid."""
         if 0 <= row < self.num_rows and 0 <= col < self.num_cols:
             # Only update if the state is actually changing
-            if self.grid[row][col] != state:
-                self.grid[row][col] = state
-                
-                # Calculate hole position for targeted update
-                card_x = (self.width() - self.card_width) // 2
-                card_y = (self.height() - self.card_height) // 2
-                
-                # Calculate usable area for holes
-                usable_width = self.card_width - (2 * self.side_margin)
-                usable_height = self.card_height - (2 * self.top_margin)
-                
-                # Calculate spacing between holes
-                col_spacing = (usable_width - (NUM_COLS * self.hole_width)) / (NUM_COLS - 1)
-                row_spacing = (usable_height - (NUM_ROWS * self.hole_height)) / (NUM_ROWS - 1)
+            if self.grid.set(row, col, state):
                 
-                # Calculate the exact position of this LED
-                x = card_x + self.side_margin + col * (self.hole_width + col_spacing)
-                y = card_y + self.top_margin + row * (self.hole_height + row_spacing)
-                
-                # Add a larger margin for the update region to ensure the hole and its outline
-                # are completely refreshed, preventing visual artifacts
-                margin = 4  # Increased from 2 to 4 for better coverage
-                update_rect = QRect(int(x - margin), int(y - margin), 
-                                   int(self.hole_width + 2*margin), int(self.hole_height + 2*margin))
-                
-                # Update the region of this LED with a slight delay to ensure complete rendering
-                self.update(update_rect)
+                # Update only the region of this LED
+                self.update(self._hole_geometry().update_rects[col][row])
+    
+    def set_column(self, col: int, code: int) -> int:
+        """
+        Set a whole column from its code with a single repaint request.
+        
+        Returns:
+            Number of LEDs that changed
+        """
+        if not 0 <= col < self.num_cols:
+            return 0
+        return self._apply_columns(((col, code),))
+    
+    def set_region(self, step: MaskStep) -> int:
+        """
+        Punch and clear the holes of a mask step (e.g. a diagonal band) in one operation.
+        
+        Returns:
+            Number of LEDs that changed
+        """
+        get_column = self.grid.get_column
+        return self._apply_columns((col, (get_column(col) & ~clear) | punch)
+                                   for col, punch, clear in zip(step.columns, step.punch, step.clear))
+    
+    def show_grid(self, target: CardGrid) -> int:
+        """
+        Bring the widget to a target card state, touching only changed LEDs.
+        
+        Returns:
+            Number of LEDs that changed
+        """
+        return self._apply_columns((col, target.get_column(col)) for col in range(self.num_cols))
+    
+    def _apply_columns(self, columns) -> int:
+        """
+        Write (col, code) pairs to the grid and request one repaint covering every changed hole.
+        
+        Returns:
+            Number of LEDs that changed
+        """
+        update_rects = self._hole_geometry().update_rects
+        row_mask = (1 << self.num_rows) - 1
+        dirty = QRect()
+        changed = 0
+        for col, code in columns:
+            flipped = (self.grid.get_column(col) ^ code) & row_mask
+            if not flipped:
+                continue
+            self.grid.set_column(col, code)
+            rects = update_rects[col]
+            # Changed holes in a column lie between its lowest and highest flipped row
+            first, last = (flipped & -flipped).bit_length() - 1, flipped.bit_length() - 1
+            dirty = dirty.united(rects[first]).united(rects[last])
+            changed += bin(flipped).count("1")
+        if changed:
+            self.update(dirty)
+        return changed
     
     def clear_grid(self):
         """Clear the entire grid."""
-        # Check if grid already empty to avoid unnecessary updates
-        if any(any(row) for row in self.grid):
-            # Reset the entire grid to False
-            self.grid = [[False for _ in range(self.num_cols)] for _ in range(self.num_rows)]
-            
-            # Force a complete redraw of the entire widget
-            # This ensures all visual artifacts are cleared
-            self.repaint()  # Use repaint instead of update for immediate refresh
+        # Only the punched columns need repainting
+        self._apply_columns((col, 0) for col in range(self.num_cols))
     
-    def paintEvent(self, event):
-        """Paint the punch card with exact IBM specifications."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def _invalidate_geometry(self):
+        """Drop the hole geometry and card background cached for the old size."""
+        self._geometry = None
+        self._background = None
+    
+    def _hole_geometry(self) -> HoleGeometry:
+        """Get the position of every hole, computing the table if the size changed."""
+        if self._geometry is not None:
+            return self._geometry
         
         # Calculate the centered position of the card
         card_x = (self.width() - self.card_width) // 2
         card_y = (self.height() - self.card_height) // 2
         
+        # Calculate usable area for holes
+        usable_width = self.card_width - (2 * self.side_margin)
+        usable_height = self.card_height - (2 * self.top_margin)
+        
+        # Calculate spacing between holes
+        col_spacing = (usable_width - (NUM_COLS * self.hole_width)) / (NUM_COLS - 1)
+        row_spacing = (usable_height - (NUM_ROWS * self.hole_height)) / (NUM_ROWS - 1)
+        col_pitch = self.hole_width + col_spacing
+        row_pitch = self.hole_height + row_spacing
+        left = card_x + self.side_margin
+        top = card_y + self.top_margin
+        
+        holes = []
+        update_rects = []
+        margin = HOLE_UPDATE_MARGIN
+        for col in range(self.num_cols):
+            x = left + col * col_pitch
+            ys = [top + row * row_pitch for row in range(self.num_rows)]
+            holes.append(tuple(QRectF(x, y, self.hole_width, self.hole_height) for y in ys))
+            update_rects.append(tuple(QRect(int(x - margin), int(y - margin),
+                                            int(self.hole_width + 2*margin), int(self.hole_height + 2*margin))
+                                      for y in ys))
+        
+        self._geometry = HoleGeometry(self.size(), card_x, card_y, left, top, col_pitch, row_pitch,
+                                      tuple(holes), tuple(update_rects))
+        return self._geometry
+    
+    def _card_background(self) -> QPixmap:
+        """Get the card outline with every hole empty, rendering it if the size changed."""
+        if self._background is not None:
+            return self._background
+        
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(max(1, round(self.width() * ratio)), max(1, round(self.height() * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(COLORS['background'])
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        geometry = self._hole_geometry()
+        card_x, card_y = geometry.card_x, geometry.card_y
+        
         # Create the card path with notched corner
         card_path = QPainterPath()
         
@@ -292,48 +400,87 @@ class PunchCardWidget(QWidget):
         painter.setPen(QPen(COLORS['card_outline'], 0.3))
         painter.drawPath(card_path)
         
-        # Calculate usable area for holes
-        usable_width = self.card_width - (2 * self.side_margin)
-        usable_height = self.card_height - (2 * self.top_margin)
+        # Draw all holes empty; punched ones are painted over them in paintEvent
+        painter.setPen(self._hole_pen)
+        painter.setBrush(COLORS['hole_fill'])
+        for column in geometry.holes:
+            for hole in column:
+                painter.drawRect(hole)
+        painter.end()
         
-        # Calculate spacing between holes
-        col_spacing = (usable_width - (NUM_COLS * self.hole_width)) / (NUM_COLS - 1)
-        row_spacing = (usable_height - (NUM_ROWS * self.hole_height)) / (NUM_ROWS - 1)
+        self._background = pixmap
+        return pixmap
+    
+    def paintEvent(self, event):
+        """Paint the punch card with exact IBM specifications."""
+        dirty = event.rect()
+        background = self._card_background()
         
-        # Draw all holes
-        for row in range(self.num_rows):
-            for col in range(self.num_cols):
-                # Calculate hole position
-                x = card_x + self.side_margin + col * (self.hole_width + col_spacing)
-                y = card_y + self.top_margin + row * (self.hole_height + row_spacing)
-                
-                # Create the hole path
-                hole_rect = QRectF(x, y, self.hole_width, self.hole_height)
-                
-                # Set fill color based on hole state
-                if self.grid[row][col]:
-                    painter.fillRect(hole_rect, COLORS['hole_punched'])
-                else:
-                    painter.fillRect(hole_rect, COLORS['hole_fill'])
-                
-                # Draw hole outline (white) with thinner stroke
-                painter.setPen(QPen(COLORS['hole_outline'], 0.15))
-                painter.drawRect(hole_rect)
+        # Blit the cached card for the dirty area only
+        painter = QPainter(self)
+        ratio = background.devicePixelRatio()
+        source = QRectF(dirty.x() * ratio, dirty.y() * ratio, dirty.width() * ratio, dirty.height() * ratio)
+        painter.drawPixmap(QRectF(dirty), background, source)
+        
+        # Then draw the punched holes that intersect it
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self._hole_pen)
+        painter.setBrush(COLORS['hole_punched'])
+        geometry = self._hole_geometry()
+        first_col = max(0, int((dirty.left() - geometry.left - self.hole_width) // geometry.col_pitch))
+        last_col = min(self.num_cols - 1, int((dirty.right() - geometry.left) // geometry.col_pitch) + 1)
+        first_row = max(0, int((dirty.top() - geometry.top - self.hole_height) // geometry.row_pitch))
+        last_row = min(self.num_rows - 1, int((dirty.bottom() - geometry.top) // geometry.row_pitch) + 1)
+        for col in range(first_col, last_col + 1):
+            code = self.grid.get_column(col)
+            if not code:
+                continue
+            holes = geometry.holes[col]
+            for row in range(first_row, last_row + 1):
+                if code >> row & 1:
+                    painter.drawRect(holes[row])
+        painter.end()
+
+# Console buffering: lines kept on screen (older ones are dropped) and the flush period
+CONSOLE_MAX_LINES = 2000
+CONSOLE_FLUSH_INTERVAL = 100  # milliseconds
+
+CONSOLE_LEVEL_COLORS = {
+    "INFO": "white",
+    "LED": "cyan",
+    "WARNING": "yellow",
+    "ERROR": "red",
+    "SUCCESS": "green"
+}
 
 class ConsoleWindow(QDialog):
-    """Console window for displaying system information and debug data."""
-    def __init__(self, parent=None):
+    """
+    Console window for displaying system information and debug data.
+    
+    log() only queues the line in a bounded ring buffer, so it is cheap and
+    safe to call from any thread. The first queued line arms a single-shot
+    tick job that appends everything queued in one batch, so an idle console
+    never wakes the event loop. The view keeps at most CONSOLE_MAX_LINES lines.
+    """
+    # Emitted by log() to arm the flush job on the GUI thread
+    _flush_requested = pyqtSignal()
+    
+    def __init__(self, parent=None, ticks: Optional[TickScheduler] = None):
         super().__init__(parent)
         self.setWindowTitle("System Console")
         self.setMinimumSize(600, 400)
         
+        # Lines waiting for the next flush, and the levels that are not shown
+        self._pending = deque(maxlen=CONSOLE_MAX_LINES)
+        self.hidden_levels = set()
+        
         # Set dark theme
         self.setStyleSheet(f"""
             QDialog {{
                 background-color: {COLORS['console_bg'].name()};
                 color: {COLORS['console_text'].name()};
             }}
-            QTextEdit {{
+            QPlainTextEdit {{
                 background-color: {COLORS['console_bg'].name()};
                 color: {COLORS['console_text'].name()};
                 {get_font_css(size=12)}
@@ -343,13 +490,20 @@ class ConsoleWindow(QDialog):
         layout = QVBoxLayout(self)
         
         # Create console text area
-        self.console = QTextEdit()
+        self.console = QPlainTextEdit()
         self.console.setReadOnly(True)
+        self.console.setMaximumBlockCount(CONSOLE_MAX_LINES)
         layout.addWidget(self.console)
         
         # Add buttons layout
         button_layout = QHBoxLayout()
         
+        # Per-LED activity is the bulk of the log; let it be switched off
+        led_checkbox = QCheckBox("Show LED activity")
+        led_checkbox.setChecked(True)
+        led_checkbox.toggled.connect(lambda checked: self.set_level_enabled("LED", checked))
+        button_layout.addWidget(led_checkbox)
+        
         # Add save button
         save_button = RetroButton("Save Log")
         save_button.clicked.connect(self.save_log)
@@ -366,21 +520,52 @@ class ConsoleWindow(QDialog):
         button_layout.addWidget(close_button)
         
         layout.addLayout(button_layout)
+        
+        # Append queued lines in batches on the GUI thread, only when there are some
+        self.ticks = ticks or getattr(parent, 'ticks', None) or TickScheduler(self)
+        self._flush_job = self.ticks.add("console_flush", self.flush, CONSOLE_FLUSH_INTERVAL, single_shot=True)
+        self._flush_armed = False
+        self._flush_requested.connect(self._arm_flush, Qt.ConnectionType.QueuedConnection)
+    
+    def is_enabled(self, level: str) -> bool:
+        """Check whether messages of a level are shown; use it to skip formatting hot-path messages."""
+        return level not in self.hidden_levels
+    
+    def set_level_enabled(self, level: str, enabled: bool):
+        """Show or hide messages of one level."""
+        if enabled:
+            self.hidden_levels.discard(level)
+        else:
+            self.hidden_levels.add(level)
     
     def log(self, message: str, level: str = "INFO"):
-        """Add a message to the console with timestamp and level."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        level_color = {
-            "INFO": "white",
-            "LED": "cyan",
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "SUCCESS": "green"
-        }.get(level, "white")
-        
-        self.console.append(f'<span style="color: gray">[{timestamp}]</span> '
-                          f'<span style="color: {level_color}">[{level}]</span> '
-                          f'<span style="color: white">{message}</span>')
+        """Queue a message for the console with timestamp and level."""
+        if level in self.hidden_levels:
+            return
+        self._pending.append((datetime.now(), level, message))
+        if not self._flush_armed:
+            self._flush_armed = True
+            self._flush_requested.emit()
+    
+    def _arm_flush(self):
+        """Schedule a flush unless one is already due."""
+        if not self._flush_job.isActive():
+            self._flush_job.start()
+    
+    def flush(self):
+        """Append the queued messages to the console in one batch."""
+        # Cleared first, so a line queued while flushing arms the next flush
+        self._flush_armed = False
+        if not self._pending:
+            return
+        lines = []
+        while self._pending:
+            when, level, message = self._pending.popleft()
+            level_color = CONSOLE_LEVEL_COLORS.get(level, "white")
+            lines.append(f'<p><span style="color: gray">[{when:%H:%M:%S}]</span> '
+                         f'<span style="color: {level_color}">[{level}]</span> '
+                         f'<span style="color: white">{html.escape(message)}</span></p>')
+        self.console.appendHtml("".join(lines))
         self.console.verticalScrollBar().setValue(
             self.console.verticalScrollBar().maximum()
         )
@@ -390,6 +575,7 @@ class ConsoleWindow(QDialog):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"console_log_{timestamp}.txt"
         try:
+            self.flush()
             with open(filename, 'w') as f:
                 f.write(self.console.toPlainText())
             self.log(f"Log saved to {filename}", "SUCCESS")
@@ -398,6 +584,7 @@ class ConsoleWindow(QDialog):
     
     def clear_log(self):
         """Clear the console log."""
+        self._pending.clear()
         self.console.clear()
         self.log("Console cleared", "INFO")
 
@@ -410,6 +597,9 @@ class SettingsDialog(QDialog):
         self.setWindowTitle("Punch Card Settings")
         self.resize(550, 650)  # Make dialog larger to accommodate tabs
         
+        # Network calls run on a thread pool so the card keeps animating
+        self.network = NetworkTaskRunner(self)
+        
         # Set dark theme
         self.setStyleSheet(f"""
             QDialog {{
@@ -858,60 +1048,51 @@ class SettingsDialog(QDialog):
     
     def refresh_models(self):
         """Refresh the available models list."""
-        try:
-            # Try to get the models from the API if we have a key
-            api_key = self.api_key_edit.text().strip()
-            if api_key and len(api_key) > 20 and api_key != "●●●●●●●●●●●●●●●●●●●●●●●●●●●●":
-                # Import OpenAI
-                try:
-                    from openai import OpenAI
-                    
-                    # Create a temporary client
-                    temp_client = OpenAI(api_key=api_key)
-                    
-                    # Try to get models
-                    models = temp_client.models.list()
-                    
-                    # Extract model names that are appropriate for chat
-                    model_names = [
-                        model.id for model in models.data
-                        if model.id.startswith(("gpt-3", "gpt-4")) and not model.id.endswith("-vision")
-                    ]
-                    
-                    if model_names:
-                        # Remember the current selection
-                        current_model = self.model_combo.currentText()
-                        
-                        # Update the combo box
-                        self.model_combo.clear()
-                        self.model_combo.addItems(model_names)
-                        
-                        # Try to restore previous selection
-                        index = self.model_combo.findText(current_model)
-                        if index >= 0:
-                            self.model_combo.setCurrentIndex(index)
-                        
-                        self.model_description.setText("Models refreshed from API")
-                        return
-                    
-                except ImportError:
-                    self.model_description.setText("Error: OpenAI module not installed")
-                except Exception as e:
-                    self.model_description.setText(f"Error refreshing models: {str(e)[:60]}")
+        # Try to get the models from the API if we have a key
+        api_key = self.api_key_edit.text().strip()
+        if not (api_key and len(api_key) > 20 and api_key != "●●●●●●●●●●●●●●●●●●●●●●●●●●●●"):
+            self._use_default_models()
+            return
+        
+        def models_loaded(model_names):
+            if not model_names:
+                self._use_default_models()
+                return
+            # Remember the current selection
+            current_model = self.model_combo.currentText()
             
-            # Fallback to default models if we can't get them from the API
+            # Update the combo box
             self.model_combo.clear()
-            self.model_combo.addItems([
-                "gpt-4o",
-                "gpt-4-turbo",
-                "gpt-4",
-                "gpt-3.5-turbo",
-                "gpt-3.5-turbo-16k"
-            ])
-            self.model_description.setText("Using default model list (API key not set or error)")
+            self.model_combo.addItems(model_names)
             
-        except Exception as e:
-            self.model_description.setText(f"Error: {str(e)[:60]}")
+            # Try to restore previous selection
+            index = self.model_combo.findText(current_model)
+            if index >= 0:
+                self.model_combo.setCurrentIndex(index)
+            
+            self.model_description.setText("Models refreshed from API")
+        
+        def models_failed(error):
+            self._use_default_models()
+            if isinstance(error, ImportError):
+                self.model_description.setText("Error: OpenAI module not installed")
+            else:
+                self.model_description.setText(f"Error refreshing models: {str(error)[:60]}")
+        
+        self.model_description.setText("Refreshing models...")
+        self.network.run("models", partial(list_chat_models, api_key), models_loaded, models_failed)
+    
+    def _use_default_models(self):
+        """Fall back to the default model list."""
+        self.model_combo.clear()
+        self.model_combo.addItems([
+            "gpt-4o",
+            "gpt-4-turbo",
+            "gpt-4",
+            "gpt-3.5-turbo",
+            "gpt-3.5-turbo-16k"
+        ])
+        self.model_description.setText("Using default model list (API key not set or error)")
 
     def verify_api_key(self):
         """Check if the API key is valid."""
@@ -928,33 +1109,26 @@ class SettingsDialog(QDialog):
         self.api_key_status.setText("Status: Verifying...")
         self.api_key_status.setStyleSheet("color: #AAAAAA;")
         
-        # Try to initialize a client to test the key
-        try:
-            # Import OpenAI
-            from openai import OpenAI, APIError
-            
-            # Create a temporary client
-            temp_client = OpenAI(api_key=api_key)
-            
-            # Try a lightweight API call to verify the key
+        def key_valid(_):
+            self.api_key_status.setText(f"Status: Valid ✅")
+            self.api_key_status.setStyleSheet("color: #55AA55;")
+        
+        def key_failed(error):
             try:
-                models = temp_client.models.list(limit=1)
-                
-                # Key is valid
-                self.api_key_status.setText(f"Status: Valid ✅")
-                self.api_key_status.setStyleSheet("color: #55AA55;")
-                
-            except APIError as e:
+                from openai import APIError
+            except ImportError:
+                APIError = ()
+            if isinstance(error, ImportError):
+                self.api_key_status.setText("Status: OpenAI module not installed")
+            elif isinstance(error, APIError):
                 # API-specific errors (usually authentication or permissions)
-                self.api_key_status.setText(f"Status: Invalid key - {str(e)[:60]}")
-                self.api_key_status.setStyleSheet("color: #FF5555;")
-                
-        except ImportError:
-            self.api_key_status.setText("Status: OpenAI module not installed")
-            self.api_key_status.setStyleSheet("color: #FF5555;")
-        except Exception as e:
-            self.api_key_status.setText(f"Status: Error - {str(e)[:60]}")
+                self.api_key_status.setText(f"Status: Invalid key - {str(error)[:60]}")
+            else:
+                self.api_key_status.setText(f"Status: Error - {str(error)[:60]}")
             self.api_key_status.setStyleSheet("color: #FF5555;")
+        
+        # Try a lightweight API call to verify the key
+        self.network.run("verify_key", partial(check_api_key, api_key), key_valid, key_failed)
 
     def save_api_key(self):
         """Update the API key in the configuration."""
@@ -1021,37 +1195,27 @@ class SettingsDialog(QDialog):
         """Check the OpenAI service status."""
         self.service_status_label.setText("Status: Checking...")
         
-        try:
-            import requests
-            
-            url = "https://status.openai.com/api/v2/status.json"
-            response = requests.get(url, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                status_indicator = data.get("status", {}).get("indicator", "unknown")
-                status_description = data.get("status", {}).get("description", "Unknown status")
-                
-                if status_indicator == "none":
-                    self.service_status_label.setText("Status: All systems operational")
-                    self.service_status_label.setStyleSheet("color: #55AA55;")
-                else:
-                    self.service_status_label.setText(f"Status: {status_description}")
-                    
-                    # Set color based on status
-                    if status_indicator == "minor":
-                        self.service_status_label.setStyleSheet("color: #FFAA55;")
-                    elif status_indicator == "major" or status_indicator == "critical":
-                        self.service_status_label.setStyleSheet("color: #FF5555;")
-                    else:
-                        self.service_status_label.setStyleSheet("color: #AAAAAA;")
+        def status_loaded(status):
+            status_indicator, status_description = status
+            if status_indicator == "none":
+                self.service_status_label.setText("Status: All systems operational")
+                self.service_status_label.setStyleSheet("color: #55AA55;")
             else:
-                self.service_status_label.setText(f"Status: Error (HTTP {response.status_code})")
-                self.service_status_label.setStyleSheet("color: #FF5555;")
+                self.service_status_label.setText(f"Status: {status_description}")
                 
-        except Exception as e:
-            self.service_status_label.setText(f"Status: Error - {str(e)[:60]}")
+                # Set color based on status
+                if status_indicator == "minor":
+                    self.service_status_label.setStyleSheet("color: #FFAA55;")
+                elif status_indicator == "major" or status_indicator == "critical":
+                    self.service_status_label.setStyleSheet("color: #FF5555;")
+                else:
+                    self.service_status_label.setStyleSheet("color: #AAAAAA;")
+        
+        def status_failed(error):
+            self.service_status_label.setText(f"Status: Error - {str(error)[:60]}")
             self.service_status_label.setStyleSheet("color: #FF5555;")
+        
+        self.network.run("openai_service", partial(fetch_status, OPENAI_STATUS_URL), status_loaded, status_failed)
 
     def update_usage_stats(self):
         """Update the OpenAI usage statistics display."""
@@ -1297,80 +1461,75 @@ class SettingsDialog(QDialog):
 
     def refresh_service_status(self):
         """Refresh the service status display."""
-        global service_status
-        
-        # Update the status
-        self.check_openai_status()
-        self.check_flyio_status()
+        pending = {"openai", "flyio"}
         
-        # Update the display
-        self.service_status_text.setText(self.get_service_status_text())
+        def checked(service):
+            pending.discard(service)
+            if pending:
+                return
+            # Update the display
+            self.service_status_text.setText(self.get_service_status_text())
+            
+            QMessageBox.information(
+                self,
+                "Service Status",
+                "Service status has been refreshed."
+            )
         
-        QMessageBox.information(
-            self,
-            "Service Status",
-            "Service status has been refreshed."
-        )
+        # Both checks run at the same time in the background
+        self.check_openai_status(on_finished=partial(checked, "openai"))
+        self.check_flyio_status(on_finished=partial(checked, "flyio"))
 
-    def check_openai_status(self):
-        """Check OpenAI API status and update global status tracking."""
-        global service_status
+    def check_openai_status(self, on_finished: Optional[Callable[[bool], None]] = None):
+        """
+        Check OpenAI API status in the background and update global status tracking.
         
-        import requests
-        from datetime import datetime
+        Args:
+            on_finished: Called with True/False (checked/failed) once the status is recorded
+        """
+        def record(status):
+            status_indicator, status_description = status
+            if status_indicator == "none":
+                status = ("operational", "All systems operational")
+            self._record_service_status("openai", status, on_finished)
         
-        url = "https://status.openai.com/api/v2/status.json"
-        service_status["openai"]["last_checked"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._start_status_check("openai", OPENAI_STATUS_URL, record, on_finished)
+
+    def check_flyio_status(self, on_finished: Optional[Callable[[bool], None]] = None):
+        """
+        Check fly.io status in the background and update global status tracking.
         
-        try:
-            # Try to make a simple API request
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()
-            
-            data = response.json()
-            status_indicator = data.get("status", {}).get("indicator", "unknown")
-            status_description = data.get("status", {}).get("description", "Unknown status")
-            
-            if status_indicator == "none":
-                service_status["openai"]["status"] = "operational"
-                service_status["openai"]["message"] = "All systems operational"
-            else:
-                service_status["openai"]["status"] = status_indicator
-                service_status["openai"]["message"] = status_description
-                
-            return True
-        except Exception as e:
-            service_status["openai"]["status"] = "error"
-            service_status["openai"]["message"] = f"Error checking status: {str(e)[:50]}"
-            return False
+        Args:
+            on_finished: Called with True/False (checked/failed) once the status is recorded
+        """
+        def record(status):
+            self._record_service_status("flyio", status, on_finished)
+        
+        self._start_status_check("flyio", FLYIO_STATUS_URL, record, on_finished)
 
-    def check_flyio_status(self):
-        """Check fly.io status and update global status tracking."""
+    def _start_status_check(self, service: str, url: str, on_status: Callable, on_finished: Optional[Callable]):
+        """Fetch a status page in the background; errors are recorded as the service status."""
         global service_status
         
-        import requests
-        from datetime import datetime
+        service_status[service]["last_checked"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        url = "https://status.fly.io/api/v2/status.json"
-        service_status["flyio"]["last_checked"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        def failed(error):
+            self._record_service_status(service, ("error", f"Error checking status: {str(error)[:50]}"), on_finished)
         
-        try:
-            # Try to make a simple API request
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()
-            
-            data = response.json()
-            status_indicator = data.get("status", {}).get("indicator", "unknown")
-            status_description = data.get("status", {}).get("description", "Unknown status")
-            
-            service_status["flyio"]["status"] = status_indicator
-            service_status["flyio"]["message"] = status_description
-                
-            return True
-        except Exception as e:
-            service_status["flyio"]["status"] = "error"
-            service_status["flyio"]["message"] = f"Error checking status: {str(e)[:50]}"
-            return False
+        self.network.run(f"{service}_status", partial(fetch_status, url), on_status, failed)
+
+    def _record_service_status(self, service: str, status: Tuple[str, str], on_finished: Optional[Callable]):
+        """Store a (status, message) pair in the global status tracking."""
+        global service_status
+        
+        service_status[service]["status"], service_status[service]["message"] = status
+        if on_finished is not None:
+            on_finished(status[0] != "error")
+
+    def done(self, result):
+        """Drop pending network calls when the dialog closes."""
+        self.network.cancel_all()
+        super().done(result)
 
     def _load_settings(self):
         """Load existing settings into the dialog."""
@@ -2002,10 +2161,13 @@ class WiFiStatusWidget(QWidget):
 class InAppMenuBar(QWidget):
     """Custom in-app menu bar that simulates classic Mac menu bar appearance."""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, ticks: Optional[TickScheduler] = None):
         super().__init__(parent)
         self.setFixedHeight(22)
         
+        # Periodic jobs share the main window's scheduler when there is one
+        self.ticks = ticks or getattr(parent, 'ticks', None) or TickScheduler(self)
+        
         # Set background color to match the punch card theme
         self.setStyleSheet(f"""
             background-color: black;
@@ -2114,14 +2276,12 @@ class InAppMenuBar(QWidget):
         self.clock_button.clicked.connect(self.show_notifications)
         
         # Setup clock timer
-        self.clock_timer = QTimer(self)
-        self.clock_timer.timeout.connect(self.update_clock)
+        self.clock_timer = self.ticks.add("menu_clock", self.update_clock)
         self.clock_timer.start(1000)  # Update every second
         self.update_clock()
         
         # Update WiFi status periodically
-        self.wifi_timer = QTimer(self)
-        self.wifi_timer.timeout.connect(self.update_wifi_status)
+        self.wifi_timer = self.ticks.add("wifi_status", self.update_wifi_status)
         self.wifi_timer.start(5000)  # Check every 5 seconds
         self.update_wifi_status()
 
@@ -2315,9 +2475,12 @@ class PunchCardDisplay(QMainWindow):
         self.main_layout.setContentsMargins(0, 0, 0, 0)  # No margins to allow full-width menu bar
         self.main_layout.setSpacing(0)  # Reduce spacing to minimize shifts
         
+        # All periodic jobs (clock, polling, animations) share one timer
+        self.ticks = TickScheduler(self)
+        
         # ================== MENU BAR SECTION ==================
         # Add custom in-app menu bar
-        self.menu_bar = InAppMenuBar(self)
+        self.menu_bar = InAppMenuBar(self, self.ticks)
         self.main_layout.addWidget(self.menu_bar)
         
         # Add spacer to separate menu bar from content
@@ -2476,6 +2639,7 @@ class PunchCardDisplay(QMainWindow):
         self.message_delay = 3000
         self.message_display_time = 5  # Default 5 seconds for message display
         self.current_message = ""
+        self.current_codes = encode_text("")
         self.current_char_index = 0
         self.running = False
         self.card_errors = {}
@@ -2484,13 +2648,10 @@ class PunchCardDisplay(QMainWindow):
         self.splash_delay = 50
         
         # Setup timers
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.display_next_char)
+        self.timer = self.ticks.add("typing", self.display_next_char)
         
         # Add a timer for message display time
-        self.message_display_timer = QTimer()
-        self.message_display_timer.setSingleShot(True)
-        self.message_display_timer.timeout.connect(self.clear_message)
+        self.message_display_timer = self.ticks.add("message_display", self.clear_message, single_shot=True)
         
         # Create console and settings dialogs
         self.console = ConsoleWindow(self)
@@ -2502,10 +2663,8 @@ class PunchCardDisplay(QMainWindow):
         # Setup menu bar actions
         self.menu_bar.setup_menu_actions(self)
         
-        # Initialize clock timer to update clock in menu bar
-        self.clock_timer = QTimer()
-        self.clock_timer.timeout.connect(self.update_clock)
-        self.clock_timer.start(1000)  # Update every second
+        # The menu bar keeps its clock current on the shared scheduler
+        self.clock_timer = self.menu_bar.clock_timer
         
         # Show console automatically
         self.console.show()
@@ -2517,25 +2676,21 @@ class PunchCardDisplay(QMainWindow):
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         
         # Initialize auto-timer but don't start it yet
-        self.auto_timer = QTimer()
-        self.auto_timer.timeout.connect(self.generate_next_message)
+        self.auto_timer = self.ticks.add("auto_message", self.generate_next_message)
         
         # Initialize hardware detector
         self.hardware_detector = HardwareDetector(self.console)
         
         # Add splash screen timer
-        self.splash_timer = QTimer()
-        self.splash_timer.timeout.connect(self.update_splash)
+        self.splash_timer = self.ticks.add("splash", self.update_splash)
         self.splash_step = 0
         self.showing_splash = True
         self.hardware_check_complete = False
         self.countdown_seconds = 10
-        self.countdown_timer = QTimer()
-        self.countdown_timer.timeout.connect(self.update_countdown)
+        self.countdown_timer = self.ticks.add("countdown", self.update_countdown)
         
-        # Hardware status update timer
-        self.hardware_status_timer = QTimer()
-        self.hardware_status_timer.timeout.connect(self.update_hardware_status)
+        # Hardware status update timer; suspends itself once the animation starts
+        self.hardware_status_timer = self.ticks.add("hardware_status", self.update_hardware_status)
         self.hardware_status_timer.start(500)  # Check every 500ms
         
         # Add more variables for animation control
@@ -2550,7 +2705,7 @@ class PunchCardDisplay(QMainWindow):
     
     def validate_led_state(self, row: int, col: int, expected_state: bool, phase: str):
         """Validate that an LED is in the expected state and fix if necessary."""
-        actual_state = self.punch_card.grid[row][col]
+        actual_state = self.punch_card.grid.get(row, col)
         if actual_state != expected_state:
             self.console.log(f"LED STATE ERROR: LED at ({row},{col}) is {actual_state} but should be {expected_state} during {phase}", "ERROR")
             self.punch_card.set_led(row, col, expected_state)
@@ -2623,6 +2778,7 @@ class PunchCardDisplay(QMainWindow):
             return
             
         self.current_message = message.upper()
+        self.current_codes = encode_text(self.current_message)
         self.current_char_index = 0
         self.punch_card.clear_grid()
         self.led_delay = delay
@@ -2649,12 +2805,8 @@ class PunchCardDisplay(QMainWindow):
     def display_next_char(self):
         """Display the next character in the message."""
         if self.current_char_index < len(self.current_message) and self.current_char_index < self.punch_card.num_cols:
-            # Clear the current column first
-            for row in range(self.punch_card.num_rows):
-                self.punch_card.set_led(row, self.current_char_index, False)
-            
             char = self.current_message[self.current_char_index]
-            self._display_character(char, self.current_char_index)
+            self._display_column(self.current_codes[self.current_char_index], self.current_char_index, char)
             self.update_status(f"DISPLAYING: {self.current_message[:self.current_char_index+1]}")
             self.current_char_index += 1
         else:
@@ -2674,60 +2826,28 @@ class PunchCardDisplay(QMainWindow):
     
     def _display_character(self, char: str, col: int):
         """Display a character on the punch card grid."""
-        # Convert to uppercase
-        char = char.upper()
-        
-        # Clear the column first
-        for row in range(self.punch_card.num_rows):
-            self.punch_card.set_led(row, col, False)
-            self.console.log(f"LED: Cleared row {row}, col {col}", "LED")
-        
+        self._display_column(encode_char(char), col, char)
+    
+    def _display_column(self, code: int, col: int, char: str = ""):
+        """Display an encoded column on the punch card grid."""
         # Log the character being displayed
         self.console.log(f"Displaying character '{char}' in column {col}", "INFO")
         
-        # Handle different character types
-        if char.isalpha():
-            # Letters
-            if char in "ABCDEFGHI":
-                # A-I: row 12 + digit 1-9
-                self.punch_card.set_led(0, col, True)  # Row 12
-                digit = ord(char) - ord('A') + 1
-                self.punch_card.set_led(digit + 2, col, True)  # Convert to punch card row
-                self.console.log(f"LED: Row 12 + Row {digit + 2} for '{char}'", "LED")
-            elif char in "JKLMNOPQR":
-                # J-R: row 11 + digit 1-9
-                self.punch_card.set_led(1, col, True)  # Row 11
-                digit = ord(char) - ord('J') + 1
-                self.punch_card.set_led(digit + 2, col, True)  # Convert to punch card row
-                self.console.log(f"LED: Row 11 + Row {digit + 2} for '{char}'", "LED")
-            else:
-                # S-Z: row 0 + digit 2-9
-                self.punch_card.set_led(2, col, True)  # Row 0
-                digit = ord(char) - ord('S') + 2
-                if digit <= 9:
-                    self.punch_card.set_led(digit + 2, col, True)  # Convert to punch card row
-                    self.console.log(f"LED: Row 0 + Row {digit + 2} for '{char}'", "LED")
-        
-        elif char.isdigit():
-            # Digits 0-9
-            digit = int(char)
-            if digit == 0:
-                self.punch_card.set_led(2, col, True)  # Row 0
-                self.console.log(f"LED: Row 0 for '0'", "LED")
-            else:
-                self.punch_card.set_led(digit + 2, col, True)  # Convert to punch card row
-                self.console.log(f"LED: Row {digit + 2} for '{digit}'", "LED")
+        log_leds = self.console.is_enabled("LED")
         
-        elif char == ' ':
-            # Space - no punches
-            self.console.log("LED: Space character - no punches", "LED")
-            pass
+        # Log the LEDs being cleared, then write the whole column with one repaint
+        if log_leds:
+            for row, state in self.punch_card.grid.diff_column(col, code):
+                if not state:
+                    self.console.log(f"LED: Cleared row {row}, col {col}", "LED")
+        self.punch_card.set_column(col, code)
         
+        if not log_leds:
+            return
+        if code:
+            self.console.log(f"LED: Rows {describe_code(code)} for '{char}'", "LED")
         else:
-            # Special characters - simplified version
-            self.punch_card.set_led(1, col, True)  # Row 11
-            self.punch_card.set_led(2, col, True)  # Row 0
-            self.console.log(f"LED: Special character '{char}' - Row 11 + Row 0", "LED")
+            self.console.log(f"LED: '{char}' - no punches", "LED")
 
     def update_card_dimensions(self, settings: Dict[str, Any]):
         """Update the punch card dimensions with new settings."""
@@ -2867,8 +2987,13 @@ class PunchCardDisplay(QMainWindow):
         # Start the splash animation timer
         self.splash_timer.start(100)
     
-    def update_hardware_status(self):
-        """Update the hardware status label."""
+    def update_hardware_status(self) -> bool:
+        """
+        Update the hardware status label.
+        
+        Returns:
+            False once there is nothing left to poll, which suspends the polling job
+        """
         # If hardware detection is complete and animation hasn't started yet
         if self.hardware_detector.detection_complete and not self.animation_started:
             # Show hardware detection results
@@ -2911,17 +3036,20 @@ class PunchCardDisplay(QMainWindow):
                 f'Raspberry Pi: <span style="color:yellow;">Detecting...</span>, ' +
                 f'LED Controller: <span style="color:yellow;">Waiting...</span>'
             )
+        
+        return not self.animation_started
     
     def update_splash(self):
         """Update the splash screen animation."""
         if not self.showing_splash:
             return
             
-        # Calculate total steps needed to cover the entire card
-        total_steps = NUM_COLS + NUM_ROWS - 1  # This ensures we cover the entire diagonal
+        # Precompiled splash keyframes (cached per card size)
+        steps = splash_steps(NUM_ROWS, NUM_COLS)
+        total_steps = NUM_COLS + NUM_ROWS - 1  # Diagonals needed to cover the entire card
         
         # Log the current splash step to console only
-        self.console.log(f"Splash step: {self.splash_step} of {total_steps*2 + 12}", "INFO")
+        self.console.log(f"Splash step: {self.splash_step} of {len(steps)}", "INFO")
         
         # Ensure we have hardware detection complete - critical fix
         if not self.hardware_check_complete:
@@ -2935,106 +3063,25 @@ class PunchCardDisplay(QMainWindow):
                 self.auto_skip_hardware_detection()
                 return
             
-        # Phase transitions - verify top-left corner state
-        if self.splash_step == 0:
-            # At the very beginning, make sure top-left corner is OFF
-            self.verify_top_left_corner(False, "Initial state")
-        elif self.splash_step == total_steps:
-            # At start of Phase 2, verify top-left corner is OFF before we turn it ON
-            self.verify_top_left_corner(False, "Start of Phase 2")
-        elif self.splash_step == total_steps * 2:
-            # At start of Phase 3, verify that top-left corner is either ON or OFF depending on current animation
-            # Logic below will ensure it gets properly set
-            pass
-            
-        # Phase 1: Initial clearing (empty card)
-        if self.splash_step < total_steps:
-            # Make sure the top-left corner (0,0) is explicitly cleared first
-            if self.splash_step == 0:
-                self.console.log(f"LED: Explicitly clearing top-left corner (0,0)", "LED")
-                self.punch_card.set_led(0, 0, False)
-                # Verify it got cleared
-                self.verify_top_left_corner(False, "Phase 1 start")
-            
-            # Clear the current diagonal
-            for row in range(NUM_ROWS):
-                col = self.splash_step - row
-                if 0 <= col < NUM_COLS:
-                    # Skip the top-left corner as we've already handled it
-                    if not (row == 0 and col == 0):
-                        self.console.log(f"LED: Clearing row {row}, col {col} (Phase 1)", "LED")
-                        self.punch_card.set_led(row, col, False)
-            
-            # Only show phase information in console, not in main GUI
-            self.console.log(f"SPLASH ANIMATION - CLEARING {self.splash_step}/{total_steps}", "INFO")
-        
-        # Phase 2: Punching holes with a 12-hole width
-        elif self.splash_step < total_steps * 2:
-            current_step = self.splash_step - total_steps
-            
-            # At the beginning of Phase 2, explicitly turn on the top-left corner
-            if current_step == 0:
-                self.console.log(f"LED: Explicitly turning ON top-left corner (0,0)", "LED")
-                self.punch_card.set_led(0, 0, True)
-                # Verify it got turned on
-                self.verify_top_left_corner(True, "Phase 2 start")
-            elif current_step <= 12:
-                # During the first 12 steps of Phase 2, keep checking that the top-left corner is ON
-                if not self.verify_top_left_corner(True, f"Phase 2 step {current_step}"):
-                    # If verification failed, explicitly turn it back ON
-                    self.console.log(f"LED: Re-enabling top-left corner (0,0) that was incorrectly OFF", "LED")
-                    self.punch_card.set_led(0, 0, True)
-            
-            # Punch new holes at the current diagonal
-            for row in range(NUM_ROWS):
-                col = current_step - row
-                if 0 <= col < NUM_COLS:
-                    # Skip the top-left corner as we've already handled it
-                    if not (row == 0 and col == 0):
-                        self.console.log(f"LED: Setting row {row}, col {col} ON (Phase 2)", "LED")
-                        self.punch_card.set_led(row, col, True)
-            
-            # Clear old holes (trailing diagonal pattern - 12 columns wide)
-            trailing_step = max(0, current_step - 12)
-            for row in range(NUM_ROWS):
-                col = trailing_step - row
-                if 0 <= col < NUM_COLS:
-                    # Only clear top-left corner when it's definitely time to clear it
-                    # This prevents it from being cleared too early
-                    if row == 0 and col == 0 and current_step >= 12:
-                        self.console.log(f"LED: Explicitly turning OFF top-left corner (0,0)", "LED")
-                        self.punch_card.set_led(0, 0, False)
-                        # Verify it got turned off
-                        self.verify_top_left_corner(False, f"Phase 2 trailing step {current_step}")
-                    elif not (row == 0 and col == 0):
-                        self.console.log(f"LED: Setting row {row}, col {col} OFF (Phase 2 trailing)", "LED")
-                        self.punch_card.set_led(row, col, False)
+        if self.splash_step < len(steps):
+            # Apply this step's punch/clear masks, repainting only the band that changes
+            changed = self.punch_card.set_region(steps[self.splash_step])
+            if self.console.is_enabled("LED"):
+                self.console.log(f"LED: Splash step {self.splash_step} changed {changed} LEDs", "LED")
             
             # Only show phase information in console, not in main GUI
-            self.console.log(f"SPLASH ANIMATION - ILLUMINATING {current_step}/{total_steps}", "INFO")
-        
-        # Phase 3: Clear the remaining 12 columns in a diagonal pattern
-        elif self.splash_step < total_steps * 2 + 12:
-            current_clear_step = self.splash_step - (total_steps * 2) + (total_steps - 12)
-            
-            # Make sure top-left corner is OFF by this phase
-            if self.splash_step == total_steps * 2:
-                self.console.log(f"LED: Final check - ensuring top-left corner (0,0) is OFF", "LED")
-                self.punch_card.set_led(0, 0, False)
-                # Verify it got turned off
-                self.verify_top_left_corner(False, "Phase 3 start")
-            
-            for row in range(NUM_ROWS):
-                col = current_clear_step - row
-                if 0 <= col < NUM_COLS:
-                    # Skip the top-left corner as we've already handled it
-                    if not (row == 0 and col == 0):
-                        self.console.log(f"LED: Setting row {row}, col {col} OFF (Phase 3)", "LED")
-                        self.punch_card.set_led(row, col, False)
-            
-            # Only show phase information in console, not in main GUI
-            remaining_steps = (total_steps * 2 + 12) - self.splash_step
-            self.console.log(f"SPLASH ANIMATION - FINISHING (REMAINING: {remaining_steps})", "INFO")
+            if self.splash_step < total_steps:
+                self.console.log(f"SPLASH ANIMATION - CLEARING {self.splash_step}/{total_steps}", "INFO")
+            elif self.splash_step < total_steps * 2:
+                current_step = self.splash_step - total_steps
+                if current_step == 0:
+                    self.verify_top_left_corner(True, "Phase 2 start")
+                self.console.log(f"SPLASH ANIMATION - ILLUMINATING {current_step}/{total_steps}", "INFO")
+            else:
+                if self.splash_step == total_steps * 2:
+                    self.verify_top_left_corner(False, "Phase 3 start")
+                remaining_steps = len(steps) - self.splash_step
+                self.console.log(f"SPLASH ANIMATION - FINISHING (REMAINING: {remaining_steps})", "INFO")
         
         else:
             # Wait for hardware detection to complete before ending splash screen
@@ -3057,14 +3104,13 @@ class PunchCardDisplay(QMainWindow):
             self.keyboard_hint_label.setText("")
             
             # Verify all LEDs are OFF before final clearing
-            if self.punch_card.grid[0][0]:
+            if self.punch_card.grid.get(0, 0):
                 self.console.log(f"LED STATE ERROR: Top-left corner (0,0) is still ON at end of animation!", "ERROR")
             
             # Clear all LEDs and log each one
-            for row in range(NUM_ROWS):
-                for col in range(NUM_COLS):
-                    if self.punch_card.grid[row][col]:
-                        self.console.log(f"LED: Final clearing row {row}, col {col}", "LED")
+            if self.console.is_enabled("LED"):
+                for row, col, _ in self.punch_card.grid.diff(CardGrid(NUM_ROWS, NUM_COLS)):
+                    self.console.log(f"LED: Final clearing row {row}, col {col}", "LED")
                         
             # Clear the grid with a single operation after logging
             self.punch_card.clear_grid()
@@ -3074,9 +3120,8 @@ class PunchCardDisplay(QMainWindow):
             # Schedule actual UI reveal and message generation after a delay
             QTimer.singleShot(500, self.complete_splash_screen)
             return
-        
-        # Force a repaint to ensure LED changes are displayed
-        self.punch_card.update()
+
+        # set_region already scheduled the repaint of the changed band
         self.splash_step += 1
     
     def complete_splash_screen(self):
@@ -0,0 +1,199 @@
+"""
+Background Network Tasks for the Punch Card GUI.
+
+The settings dialog used to call the OpenAI API and the status pages
+directly on the Qt main thread. Each call could block for its whole timeout
+(twice in a row for a service status refresh), which froze the card
+animation. NetworkTaskRunner runs these calls as QRunnables on the global
+QThreadPool and reports back on the GUI thread through signals:
+
+- Each task has a timeout. The blocking call gets it as its own socket
+  timeout, and a watchdog on the GUI thread reports TimeoutError if the
+  task still hasn't finished when it expires.
+- Tasks are named. Starting a task cancels the pending one with the same
+  name, and cancel_all() drops everything, e.g. when the dialog closes.
+  A cancelled task can't interrupt its socket call, but its result is
+  discarded and its callbacks never run.
+
+The blocking calls themselves (status pages, model listing, key check)
+are plain functions, so they can also be used outside Qt.
+
+Usage:
+    from src.display.network_tasks import NetworkTaskRunner, fetch_status
+
+    runner = NetworkTaskRunner(parent)
+    runner.run("openai_status", partial(fetch_status, OPENAI_STATUS_URL),
+               on_done=show_status, on_error=show_error)
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+# Status pages (Statuspage API) and the default time allowed for each call
+OPENAI_STATUS_URL = "https://status.openai.com/api/v2/status.json"
+FLYIO_STATUS_URL = "https://status.fly.io/api/v2/status.json"
+NETWORK_TIMEOUT = 5.0  # seconds
+
+def fetch_status(url: str, timeout: float = NETWORK_TIMEOUT) -> Tuple[str, str]:
+    """
+    Read a Statuspage status summary.
+
+    Returns:
+        (indicator, description), e.g. ("none", "All Systems Operational")
+
+    Raises:
+        requests.RequestException: if the page can't be fetched
+    """
+    import requests
+
+    response = requests.get(url, timeout=timeout)
+    response.raise_for_status()
+    status = response.json().get("status", {})
+    return status.get("indicator", "unknown"), status.get("description", "Unknown status")
+
+def list_chat_models(api_key: str, timeout: float = NETWORK_TIMEOUT) -> List[str]:
+    """
+    Get the chat model names available to an API key.
+
+    Raises:
+        ImportError: if the openai package isn't installed
+    """
+    from openai import OpenAI
+
+    client = OpenAI(api_key=api_key, timeout=timeout, max_retries=0)
+    return [
+        model.id for model in client.models.list().data
+        if model.id.startswith(("gpt-3", "gpt-4")) and not model.id.endswith("-vision")
+    ]
+
+def check_api_key(api_key: str, timeout: float = NETWORK_TIMEOUT) -> bool:
+    """
+    Verify an API key with a lightweight request.
+
+    Raises:
+        ImportError: if the openai package isn't installed
+        openai.APIError: if the key is rejected
+    """
+    from openai import OpenAI
+
+    client = OpenAI(api_key=api_key, timeout=timeout, max_retries=0)
+    client.models.list(limit=1)
+    return True
+
+class TaskSignals(QObject):
+    """Signals of one task (QRunnable isn't a QObject)."""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+
+class NetworkTask(QRunnable):
+    """Runs one blocking call on a pool thread."""
+
+    def __init__(self, name: str, function: Callable[..., Any], timeout: float):
+        """
+        Initialize the task.
+
+        Args:
+            name: Task name; a new task with the same name replaces this one
+            function: Blocking call, given the timeout as a keyword argument
+            timeout: Seconds allowed for the call
+        """
+        super().__init__()
+        self.name = name
+        self.function = function
+        self.timeout = timeout
+        self.signals = TaskSignals()
+        self.watchdog: Optional[QTimer] = None
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Discard the result of this task; it is not delivered once cancelled."""
+        self._cancelled.set()
+
+    def run(self):
+        if self.cancelled:
+            return
+        try:
+            result = self.function(timeout=self.timeout)
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+class NetworkTaskRunner(QObject):
+    """Starts NetworkTasks and delivers their results on the GUI thread."""
+
+    def __init__(self, parent: Optional[QObject] = None, pool: Optional[QThreadPool] = None):
+        super().__init__(parent)
+        self.pool = pool or QThreadPool.globalInstance()
+        self._tasks: Dict[str, NetworkTask] = {}
+
+    def run(self, name: str, function: Callable[..., Any],
+            on_done: Callable[[Any], None],
+            on_error: Optional[Callable[[Exception], None]] = None,
+            timeout: float = NETWORK_TIMEOUT) -> NetworkTask:
+        """
+        Run a blocking call in the background.
+
+        Args:
+            name: Task name; cancels a pending task with the same name
+            function: Blocking call, given the timeout as a keyword argument
+            on_done: Called on the GUI thread with the result
+            on_error: Called on the GUI thread with the exception, or a
+                TimeoutError if the call overruns its timeout
+            timeout: Seconds allowed for the call
+
+        Returns:
+            The started task
+        """
+        self.cancel(name)
+        task = NetworkTask(name, function, timeout)
+        task.signals.finished.connect(lambda result: self._deliver(task, on_done, result))
+        task.signals.failed.connect(lambda error: self._deliver(task, on_error, error))
+        self._tasks[name] = task
+
+        # Report a timeout even if the call ignores its own
+        task.watchdog = QTimer(self)
+        task.watchdog.setSingleShot(True)
+        task.watchdog.timeout.connect(
+            lambda: self._deliver(task, on_error, TimeoutError(f"timed out after {timeout:g}s")))
+        task.watchdog.start(int(timeout * 1000))
+        self.pool.start(task)
+        return task
+
+    def cancel(self, name: str):
+        """Cancel the pending task with this name, if any."""
+        task = self._tasks.pop(name, None)
+        if task is not None:
+            self._retire(task)
+
+    def cancel_all(self):
+        """Cancel every pending task."""
+        for name in list(self._tasks):
+            self.cancel(name)
+
+    def is_running(self, name: str) -> bool:
+        """Check whether a task with this name is pending."""
+        return name in self._tasks
+
+    def _deliver(self, task: NetworkTask, callback: Optional[Callable], value: Any):
+        """Hand a task's outcome to its callback, once, unless it was cancelled."""
+        if task.cancelled or self._tasks.get(task.name) is not task:
+            return
+        del self._tasks[task.name]
+        self._retire(task)  # Later outcomes (e.g. after a timeout) are dropped
+        if callback is not None:
+            callback(value)
+
+    def _retire(self, task: NetworkTask):
+        """Cancel a task and release its watchdog."""
+        task.cancel()
+        if task.watchdog is not None:
+            task.watchdog.stop()
+            task.watchdog.deleteLater()
+            task.watchdog = None
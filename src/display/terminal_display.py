@@ -14,6 +14,24 @@ import queue
 from enum import Enum, auto
 from typing import List, Tuple, Dict, Any, Optional, Union
 
+from src.core.card_grid import CardGrid
+
+# Queued by stop() to wake a display thread blocked on the message queue
+STOP_MESSAGE = ("stop",)
+
+def coalesce_messages(messages: List[tuple]) -> List[tuple]:
+    """
+    Drop all but the newest grid frame from a batch of queued messages.
+    
+    Status and debug messages are kept, in order.
+    """
+    newest_grid = None
+    for i, message in enumerate(messages):
+        if message[0] == "grid":
+            newest_grid = i
+    return [message for i, message in enumerate(messages)
+            if message[0] != "grid" or i == newest_grid]
+
 # Character set options for LED visualization
 class CharacterSet(Enum):
     DEFAULT = auto()  # Default character set (●○)
@@ -46,7 +64,6 @@ class TerminalDisplay:
         self.thread = None
         self.use_curses = True
         self.last_grid_update = 0
-        self.update_interval = 0.1  # Limit grid updates to once per 0.1 seconds
         
         # Try to determine terminal size
         try:
@@ -94,6 +111,8 @@ class TerminalDisplay:
     def stop(self):
         """Stop the terminal display thread."""
         self.running = False
+        # Wake the display thread if it is waiting for messages
+        self.message_queue.put(STOP_MESSAGE)
         if self.thread:
             self.thread.join(timeout=1.0)
             self.thread = None
@@ -109,13 +128,35 @@ class TerminalDisplay:
         """Add a debug message."""
         self.message_queue.put(("debug", message, level))
     
-    def update_led_grid(self, grid: List[List[bool]]):
+    def update_led_grid(self, grid: Union[CardGrid, List[List[bool]]]):
         """Update the LED grid state."""
-        # Limit how often we update the full grid to avoid console spam
-        current_time = time.time()
-        if current_time - self.last_grid_update >= self.update_interval:
-            self.last_grid_update = current_time
-            self.message_queue.put(("grid", grid))
+        if not isinstance(grid, CardGrid):
+            grid = CardGrid.from_rows(grid)
+        # Freeze so later changes by the caller can't reach the render thread.
+        # Frames that pile up are coalesced by the display thread.
+        self.message_queue.put(("grid", grid.freeze()))
+    
+    def _wait_for_messages(self, timeout: Optional[float] = None) -> List[tuple]:
+        """
+        Block until messages arrive, then take everything queued.
+        
+        Args:
+            timeout: Seconds to wait for the first message (None waits until one arrives)
+            
+        Returns:
+            Queued messages with grid frames coalesced, empty if the wait timed out
+        """
+        try:
+            messages = [self.message_queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        # Only take what is queued now so a busy producer can't keep us here
+        for _ in range(self.message_queue.qsize()):
+            try:
+                messages.append(self.message_queue.get_nowait())
+            except queue.Empty:
+                break
+        return coalesce_messages(messages)
     
     def _curses_thread_func(self):
         """Thread function for curses-based UI."""
@@ -161,157 +202,162 @@ class TerminalDisplay:
         debug_messages = []
         led_grid = None
         
+        # What is currently on screen, so only changes are drawn
+        rendered_status = None
+        rendered_debug = None
+        rendered_grid = None
+        
+        # Debug window title never changes
+        debug_win.addstr(0, 2, "Debug Messages")
+        dirty = {status_win, grid_win, debug_win}
+        
         # Main loop
         while self.running:
-            # Process messages from queue
-            try:
-                while not self.message_queue.empty():
-                    msg_type, *args = self.message_queue.get(block=False)
-                    
-                    if msg_type == "status":
-                        status_message, level = args
-                    elif msg_type == "debug":
-                        debug_message, level = args
-                        debug_messages.append((debug_message, level))
-                        # Keep only the last 3 debug messages
-                        if len(debug_messages) > 3:
-                            debug_messages.pop(0)
-                    elif msg_type == "grid":
-                        led_grid = args[0]
-            except queue.Empty:
-                pass
-            
-            # Update status window
-            status_win.clear()
-            status_win.box()
-            status_win.addstr(1, 2, f"Status: {status_message}"[:width-4])
+            # Update status window (pad to overwrite the previous text instead of clearing)
+            if status_message != rendered_status:
+                status_win.addstr(1, 2, f"Status: {status_message}"[:width-4].ljust(width-4))
+                rendered_status = status_message
+                dirty.add(status_win)
             
             # Update debug window
-            debug_win.clear()
-            debug_win.box()
-            debug_win.addstr(0, 2, "Debug Messages")
-            for i, (msg, level) in enumerate(debug_messages[-3:]):
-                color = 0
-                if curses.has_colors():
-                    if level == "info":
-                        color = curses.color_pair(1)
-                    elif level == "error":
-                        color = curses.color_pair(2)
-                    elif level == "warning":
-                        color = curses.color_pair(3)
-                    elif level == "debug":
-                        color = curses.color_pair(4)
-                debug_win.addstr(i+1, 2, f"{msg}"[:width-4], color)
+            if debug_messages != rendered_debug:
+                for i, (msg, level) in enumerate(debug_messages[-3:]):
+                    debug_win.addstr(i+1, 2, f"{msg}"[:width-4].ljust(width-4), self._level_color(level))
+                rendered_debug = list(debug_messages)
+                dirty.add(debug_win)
             
-            # Update LED grid window
-            grid_win.clear()
-            grid_win.box()
+            # Update LED grid window, touching only cells that changed
+            if led_grid is not None and led_grid is not rendered_grid:
+                if rendered_grid is None or (rendered_grid.rows, rendered_grid.columns) != (led_grid.rows, led_grid.columns):
+                    grid_win.erase()
+                    grid_win.box()
+                    self._draw_grid_labels(grid_win, led_grid, width, grid_height)
+                    cells = [(row, col, led_grid.get(row, col))
+                             for row in range(led_grid.rows) for col in range(led_grid.columns)]
+                else:
+                    cells = rendered_grid.diff(led_grid)
+                if cells:
+                    self._draw_grid_cells(grid_win, led_grid, cells, width, grid_height)
+                    dirty.add(grid_win)
+                rendered_grid = led_grid
             
-            if led_grid is not None:
-                rows = len(led_grid)
-                cols = len(led_grid[0]) if rows > 0 else 0
-                
-                # Calculate offset to center grid
-                x_offset = max(1, (width - cols * 2) // 2)
-                y_offset = max(1, (grid_height - rows) // 2)
-                
-                # Draw row labels
-                row_labels = ["12", "11", "0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
-                for i, label in enumerate(row_labels[:rows]):
-                    if y_offset + i < grid_height - 1:
-                        grid_win.addstr(y_offset + i, max(1, x_offset - 3), f"{label:>2s}")
-                
-                # Draw LED grid
-                for y in range(rows):
-                    if y_offset + y >= grid_height - 1:
-                        break
-                    for x in range(cols):
-                        if x_offset + x*2 >= width - 2:
-                            break
-                        grid_win.addstr(y_offset + y, x_offset + x*2, 
-                                        self.on_char if led_grid[y][x] else self.off_char)
-            
-            # Refresh windows
-            status_win.refresh()
-            grid_win.refresh()
-            debug_win.refresh()
+            # Refresh only the windows that changed, in a single terminal update
+            if dirty:
+                for win in (status_win, grid_win, debug_win):
+                    if win in dirty:
+                        win.noutrefresh()
+                curses.doupdate()
+                dirty.clear()
             
-            # Sleep to avoid high CPU usage
-            time.sleep(0.05)
+            # Sleep until there is something new to show
+            for msg_type, *args in self._wait_for_messages():
+                if msg_type == "status":
+                    status_message, level = args
+                elif msg_type == "debug":
+                    debug_message, level = args
+                    debug_messages.append((debug_message, level))
+                    # Keep only the last 3 debug messages
+                    if len(debug_messages) > 3:
+                        debug_messages.pop(0)
+                elif msg_type == "grid":
+                    led_grid = args[0]
+    
+    def _level_color(self, level: str) -> int:
+        """Get the curses color attribute for a message level."""
+        if not curses.has_colors():
+            return 0
+        pairs = {"info": 1, "error": 2, "warning": 3, "debug": 4}
+        return curses.color_pair(pairs[level]) if level in pairs else 0
+    
+    def _grid_offsets(self, grid: CardGrid, width: int, grid_height: int) -> Tuple[int, int]:
+        """Calculate the offset that centers a grid in the grid window."""
+        x_offset = max(1, (width - grid.columns * 2) // 2)
+        y_offset = max(1, (grid_height - grid.rows) // 2)
+        return x_offset, y_offset
+    
+    def _draw_grid_labels(self, grid_win, grid: CardGrid, width: int, grid_height: int):
+        """Draw the row labels beside the LED grid."""
+        x_offset, y_offset = self._grid_offsets(grid, width, grid_height)
+        row_labels = ["12", "11", "0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
+        for i, label in enumerate(row_labels[:grid.rows]):
+            if y_offset + i < grid_height - 1:
+                grid_win.addstr(y_offset + i, max(1, x_offset - 3), f"{label:>2s}")
+    
+    def _draw_grid_cells(self, grid_win, grid: CardGrid, cells, width: int, grid_height: int):
+        """Draw (row, col, state) LED cells that fit inside the grid window."""
+        x_offset, y_offset = self._grid_offsets(grid, width, grid_height)
+        for row, col, state in cells:
+            if y_offset + row >= grid_height - 1 or x_offset + col*2 >= width - 2:
+                continue
+            grid_win.addstr(y_offset + row, x_offset + col*2, self.on_char if state else self.off_char)
     
     def _fallback_thread_func(self):
         """Thread function for fallback console mode."""
         status_message = "Terminal display initialized in fallback mode."
         debug_messages = []
-        led_grid = None
         
         last_status_time = 0
         last_debug_time = 0
         
-        # Process up to 10 messages at once to avoid getting stuck
-        max_messages_per_cycle = 10
+        # Newest grid not yet printed; older ones are dropped
+        pending_grid = None
+        grid_interval = 0.5  # Limit grid updates to once per 0.5 seconds
         
         while self.running:
-            # Process messages from queue
-            messages_processed = 0
-            try:
-                while not self.message_queue.empty() and messages_processed < max_messages_per_cycle:
-                    msg_type, *args = self.message_queue.get(block=False)
-                    messages_processed += 1
-                    
-                    if msg_type == "status":
-                        status_message, level = args
-                        # Print status message with timestamp
-                        current_time = time.time()
-                        if current_time - last_status_time >= 1.0:  # Limit status updates to once per second
-                            last_status_time = current_time
-                            print(f"[STATUS] {status_message}")
-                    
-                    elif msg_type == "debug":
-                        debug_message, level = args
-                        debug_messages.append((debug_message, level))
-                        # Keep only the last 5 debug messages
-                        if len(debug_messages) > 5:
-                            debug_messages.pop(0)
-                        
-                        # Print debug message with timestamp and level
-                        current_time = time.time()
-                        if current_time - last_debug_time >= 0.5:  # Limit debug updates to twice per second
-                            last_debug_time = current_time
-                            print(f"[DEBUG] {debug_message}")
-                    
-                    elif msg_type == "grid":
-                        led_grid = args[0]
-                        
-                        # Only print the grid occasionally to avoid console spam
-                        current_time = time.time()
-                        if current_time - self.last_grid_update >= 0.5:  # Limit grid updates to once per 0.5 seconds
-                            self.last_grid_update = current_time
-                            
-                            if led_grid is not None:
-                                rows = len(led_grid)
-                                cols = len(led_grid[0]) if rows > 0 else 0
-                                
-                                # Print a bordered representation of the LED grid
-                                print("\nLED Grid State:")
-                                print("┌" + "─" * (cols * 2 - 1) + "┐")
-                                
-                                # Define the correct row order for punch cards: 12, 11, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9
-                                row_labels = ["12", "11", "0 ", "1 ", "2 ", "3 ", "4 ", "5 ", "6 ", "7 ", "8 ", "9 "]
-                                
-                                for i in range(min(rows, len(row_labels))):
-                                    row_content = []
-                                    for j in range(cols):
-                                        row_content.append(self.on_char if led_grid[i][j] else self.off_char)
-                                    print(f"{row_labels[i]}│{''.join(row_content)}│")
-                                
-                                print("└" + "─" * (cols * 2 - 1) + "┘")
+            # Wait for messages, or until the pending grid is due
+            timeout = None
+            if pending_grid is not None:
+                timeout = max(0.0, self.last_grid_update + grid_interval - time.time())
             
-            except queue.Empty:
-                pass
+            for msg_type, *args in self._wait_for_messages(timeout):
+                if msg_type == "status":
+                    status_message, level = args
+                    # Print status message with timestamp
+                    current_time = time.time()
+                    if current_time - last_status_time >= 1.0:  # Limit status updates to once per second
+                        last_status_time = current_time
+                        print(f"[STATUS] {status_message}")
+                
+                elif msg_type == "debug":
+                    debug_message, level = args
+                    debug_messages.append((debug_message, level))
+                    # Keep only the last 5 debug messages
+                    if len(debug_messages) > 5:
+                        debug_messages.pop(0)
+                    
+                    # Print debug message with timestamp and level
+                    current_time = time.time()
+                    if current_time - last_debug_time >= 0.5:  # Limit debug updates to twice per second
+                        last_debug_time = current_time
+                        print(f"[DEBUG] {debug_message}")
+                
+                elif msg_type == "grid":
+                    pending_grid = args[0]
             
-            # Sleep to avoid high CPU usage
-            time.sleep(0.1)
+            # Only print the grid occasionally to avoid console spam
+            current_time = time.time()
+            if pending_grid is not None and current_time - self.last_grid_update >= grid_interval:
+                self.last_grid_update = current_time
+                self._print_grid(pending_grid)
+                pending_grid = None
+    
+    def _print_grid(self, led_grid: CardGrid):
+        """Print a bordered representation of the LED grid."""
+        rows = led_grid.rows
+        cols = led_grid.columns
+        
+        print("\nLED Grid State:")
+        print("┌" + "─" * (cols * 2 - 1) + "┐")
+        
+        # Define the correct row order for punch cards: 12, 11, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9
+        row_labels = ["12", "11", "0 ", "1 ", "2 ", "3 ", "4 ", "5 ", "6 ", "7 ", "8 ", "9 "]
+        
+        for i in range(min(rows, len(row_labels))):
+            row_content = [self.on_char if punched else self.off_char
+                           for punched in led_grid.row_bits(i)]
+            print(f"{row_labels[i]}│{''.join(row_content)}│")
+        
+        print("└" + "─" * (cols * 2 - 1) + "┘")
 
     def update(self, data):
         """
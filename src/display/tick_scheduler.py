@@ -0,0 +1,164 @@
+"""
+Shared Tick Scheduler for the Punch Card GUI.
+
+The main window and the menu bar used to run a separate QTimer for every
+periodic job: clock, WiFi, hardware polling, countdown, splash, typing,
+auto messages and message display. Most of them kept waking the event loop
+long after they had anything to do. TickScheduler multiplexes these jobs
+onto one single-shot QTimer that is always armed for the next job due:
+
+- Each job has its own interval and can be single-shot.
+- A job that has nothing left to do returns False from its callback and is
+  suspended until something calls start() on it again (e.g. hardware
+  polling once detection completes).
+- With no active jobs the timer is stopped, so an idle kiosk gets no
+  wakeups at all.
+
+A TickJob offers the QTimer methods the GUI already used (start, stop,
+setInterval, isActive), so a job can stand in for a QTimer directly.
+
+Usage:
+    from src.display.tick_scheduler import TickScheduler
+
+    ticks = TickScheduler(parent)
+    clock = ticks.add("clock", update_clock, 1000)
+    clock.start()
+"""
+
+import math
+import time
+from typing import Callable, Dict, Optional
+
+from PyQt6.QtCore import QObject, Qt, QTimer
+
+class TickJob:
+    """A periodic or single-shot job on a TickScheduler."""
+
+    def __init__(self, scheduler: 'TickScheduler', name: str, callback: Callable[[], Optional[bool]],
+                 interval: int = 0, single_shot: bool = False):
+        """
+        Initialize the job (inactive until start() is called).
+
+        Args:
+            scheduler: Scheduler that runs the job
+            name: Unique job name
+            callback: Called when the job is due; returning False suspends the job
+            interval: Milliseconds between runs
+            single_shot: Run once per start()
+        """
+        self.scheduler = scheduler
+        self.name = name
+        self.callback = callback
+        self.interval_ms = interval
+        self.single_shot = single_shot
+        self.active = False
+        self.next_due = 0.0
+        self.runs = 0
+
+    # QTimer-compatible methods
+
+    def start(self, interval: Optional[int] = None):
+        """(Re)start the job, first due one interval from now."""
+        if interval is not None:
+            self.interval_ms = interval
+        self.active = True
+        self.next_due = self.scheduler.clock() + self.interval_ms / 1000
+        self.scheduler._reschedule()
+
+    def stop(self):
+        """Suspend the job."""
+        self.active = False
+        self.scheduler._reschedule()
+
+    def isActive(self) -> bool:
+        return self.active
+
+    def interval(self) -> int:
+        return self.interval_ms
+
+    def setInterval(self, interval: int):
+        """Change the interval; like QTimer, an active job restarts with it."""
+        self.interval_ms = interval
+        if self.active:
+            self.start()
+
+    def setSingleShot(self, single_shot: bool):
+        self.single_shot = single_shot
+
+class TickScheduler(QObject):
+    """Runs many timed jobs from one QTimer."""
+
+    def __init__(self, parent: Optional[QObject] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the scheduler.
+
+        Args:
+            parent: Qt parent that owns the timer
+            clock: Monotonic clock in seconds (injectable for tests)
+        """
+        super().__init__(parent)
+        self.clock = clock
+        self.jobs: Dict[str, TickJob] = {}
+        self.wakeups = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._run_due)
+
+    def add(self, name: str, callback: Callable[[], Optional[bool]], interval: int = 0,
+            single_shot: bool = False) -> TickJob:
+        """
+        Register a job. It stays inactive until its start() is called.
+
+        Args:
+            name: Unique job name
+            callback: Called when the job is due; returning False suspends the job
+            interval: Milliseconds between runs
+            single_shot: Run once per start()
+
+        Returns:
+            The new job
+        """
+        if name in self.jobs:
+            raise ValueError(f"Job '{name}' already exists")
+        job = self.jobs[name] = TickJob(self, name, callback, interval, single_shot)
+        return job
+
+    def remove(self, name: str):
+        """Stop and forget a job."""
+        job = self.jobs.pop(name, None)
+        if job is not None:
+            job.stop()
+
+    def active_jobs(self) -> Dict[str, int]:
+        """Get the interval of every active job, by name."""
+        return {name: job.interval_ms for name, job in self.jobs.items() if job.active}
+
+    def _reschedule(self):
+        """Arm the timer for the next job due, or stop it when nothing is active."""
+        due = [job.next_due for job in self.jobs.values() if job.active]
+        if not due:
+            self._timer.stop()
+            return
+        delay = max(0, math.ceil((min(due) - self.clock()) * 1000))
+        self._timer.start(delay)
+
+    def _run_due(self):
+        """Run every job that is due, then re-arm the timer."""
+        self.wakeups += 1
+        now = self.clock()
+        for job in list(self.jobs.values()):
+            # Allow for the timer's millisecond rounding
+            if not job.active or job.next_due > now + 0.001:
+                continue
+            if job.single_shot:
+                job.active = False
+            else:
+                # Keep a steady cadence, but don't fire a burst after a stall
+                job.next_due += job.interval_ms / 1000
+                if job.next_due <= now:
+                    job.next_due = now + job.interval_ms / 1000
+            job.runs += 1
+            if job.callback() is False:
+                job.active = False
+        self._reschedule()
@@ -0,0 +1,101 @@
+"""
+Frame Scheduler for the Punch Card Project.
+
+Animations used to render a frame and then sleep for the frame delay, so
+render time was added to every step and an 80-column message took longer
+than 80 * led_delay. FrameScheduler paces frames against absolute deadlines
+on a monotonic clock instead. Each wait sleeps only for what is left of the
+frame. When the animation falls a whole frame behind, wait() returns False
+so the caller can advance its state without drawing that frame and catch up.
+
+The scheduler also measures jitter, i.e. how far each frame ended from its
+deadline.
+
+Usage:
+    from src.utils.frame_scheduler import FrameScheduler
+
+    scheduler = FrameScheduler()
+    scheduler.start()
+    draw = True
+    for step in steps:
+        advance(step)
+        if draw:
+            render()
+        draw = scheduler.wait(0.05)
+    print(scheduler.report())
+"""
+
+import time
+from typing import Callable, Dict, Optional
+
+class FrameScheduler:
+    """Paces animation frames against absolute monotonic deadlines."""
+
+    def __init__(self, sleep: Callable[[float], None] = time.sleep,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the scheduler.
+
+        Args:
+            sleep: Function used to wait (injectable for headless runs)
+            clock: Monotonic clock in seconds; must advance across sleep() calls
+        """
+        self.sleep = sleep
+        self.clock = clock
+        self._deadline: Optional[float] = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Forget the jitter measured so far."""
+        self.frames = 0
+        self.skipped = 0
+        self._total_jitter = 0.0
+        self.max_jitter = 0.0
+
+    def start(self):
+        """Anchor the schedule at the current time. Call at the start of each animation."""
+        self._deadline = self.clock()
+
+    def wait(self, delay: float) -> bool:
+        """
+        End the current frame and wait until the next one is due.
+
+        Args:
+            delay: Duration of the frame in seconds
+
+        Returns:
+            False if the schedule is a whole frame or more behind, meaning the
+            caller should skip drawing the next frame
+        """
+        if self._deadline is None:
+            self.start()
+        self._deadline += delay
+        remaining = self._deadline - self.clock()
+        if remaining > 0:
+            self.sleep(remaining)
+            remaining = self._deadline - self.clock()
+
+        # How far from the deadline this frame actually ended
+        jitter = abs(remaining)
+        self.frames += 1
+        self._total_jitter += jitter
+        self.max_jitter = max(self.max_jitter, jitter)
+
+        on_time = remaining > -delay
+        if not on_time:
+            self.skipped += 1
+        return on_time
+
+    def report(self) -> Dict[str, float]:
+        """
+        Summarize the frame timing measured since the last reset.
+
+        Returns:
+            frames, skipped, mean and max jitter in milliseconds
+        """
+        return {
+            "frames": self.frames,
+            "skipped": self.skipped,
+            "mean_jitter_ms": self._total_jitter / self.frames * 1000 if self.frames else 0.0,
+            "max_jitter_ms": self.max_jitter * 1000,
+        }
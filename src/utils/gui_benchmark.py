@@ -0,0 +1,211 @@
+"""
+Offscreen Paint Benchmark for the Punch Card GUI.
+
+Runs PunchCardWidget and PunchCardDisplay under Qt's offscreen platform and
+drives scripted workloads through them tick by tick:
+
+- typing: messages typed column by column across a deck of full cards
+- clear_grid: wiping each typed card
+- splash: every update_splash keyframe
+- resize: a storm of window resizes
+- display splash / display typing: the same animations through the main
+  window's own update_splash and display_next_char, with its tick jobs
+  stopped so the benchmark sets the pace
+
+A tick is one scripted step followed by processing the events it posted,
+which is when Qt delivers the repaints. A probe wrapped around the widget's
+paintEvent counts the paints, times each one and compares its bounding dirty
+rect with the whole widget. The report shows paints per tick, p50/p99 paint
+time, paint time per tick and the mean dirty-area ratio, where 1.0 means
+every paint redrew the whole card.
+
+Usage:
+    python run.py --bench-gui
+    python run.py --bench-gui --bench-messages 50
+"""
+
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+# Must be set before the first QApplication is created
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from src.utils.render_benchmark import percentile
+
+# Window sizes cycled through by the resize storm
+RESIZE_SIZES = [(900, 500), (1280, 720), (700, 420), (1600, 900), (1024, 600), (800, 800)]
+
+class PaintProbe:
+    """Times a widget's paint events and the ticks that cause them."""
+
+    def __init__(self, widget: QWidget):
+        self.widget = widget
+        self.sections: Dict[str, Dict[str, List[tuple]]] = {}
+        self._section: Optional[str] = None
+        self._paint_event = widget.paintEvent
+        widget.paintEvent = self._timed_paint
+
+    def section(self, name: str):
+        """Attribute the ticks and paints that follow to a named section."""
+        self._section = name
+        self.sections.setdefault(name, {"ticks": [], "paints": []})
+
+    def tick(self, action: Callable[[], Any]) -> Any:
+        """Run one scripted step and deliver the repaints it requested."""
+        start = time.perf_counter()
+        result = action()
+        QApplication.processEvents()
+        if self._section is not None:
+            self.sections[self._section]["ticks"].append(time.perf_counter() - start)
+        return result
+
+    def _timed_paint(self, event):
+        start = time.perf_counter()
+        self._paint_event(event)
+        elapsed = time.perf_counter() - start
+        if self._section is not None:
+            dirty = event.rect()
+            area = max(1, self.widget.width() * self.widget.height())
+            self.sections[self._section]["paints"].append((elapsed, dirty.width() * dirty.height() / area))
+
+def summarize_paints(ticks: Sequence[float], paints: Sequence[tuple]) -> Dict[str, float]:
+    """Summarize tick times and (paint_time, dirty_ratio) paint records."""
+    times = [paint_time for paint_time, _ in paints]
+    return {
+        "ticks": len(ticks),
+        "paints": len(paints),
+        "paints_per_tick": len(paints) / len(ticks) if ticks else 0.0,
+        "p50_ms": percentile(times, 0.50) * 1000,
+        "p99_ms": percentile(times, 0.99) * 1000,
+        "paint_ms_per_tick": sum(times) * 1000 / len(ticks) if ticks else 0.0,
+        "tick_p50_ms": percentile(ticks, 0.50) * 1000,
+        "dirty_ratio": sum(ratio for _, ratio in paints) / len(paints) if paints else 0.0,
+    }
+
+@contextmanager
+def _scratch_directory() -> Iterator[str]:
+    """Run in a temporary directory so settings and logs written by the GUI are discarded."""
+    previous_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            yield scratch
+        finally:
+            os.chdir(previous_dir)
+
+def deal_cards(messages: Sequence[str], columns: int) -> List[str]:
+    """Run messages together and cut them into full-width cards."""
+    text = " ".join(message.upper() for message in messages)
+    return [text[start:start + columns] for start in range(0, len(text), columns)]
+
+def _run_widget_workloads(cards: Sequence[str], resizes: int) -> Dict[str, Dict[str, List[tuple]]]:
+    from src.core.animations import splash_steps
+    from src.core.hollerith import encode_text
+    from src.display.gui_display import PunchCardWidget
+
+    widget = PunchCardWidget()
+    widget.resize(1280, 720)
+    widget.show()
+    QApplication.processEvents()
+    probe = PaintProbe(widget)
+
+    for card in cards:
+        probe.section("typing")
+        for col, code in enumerate(encode_text(card)):
+            probe.tick(lambda: widget.set_column(col, code))
+        probe.section("clear_grid")
+        probe.tick(widget.clear_grid)
+
+    probe.section("splash")
+    for step in splash_steps(widget.num_rows, widget.num_cols):
+        probe.tick(lambda: widget.set_region(step))
+
+    probe.section("resize")
+    for i in range(resizes):
+        probe.tick(lambda: widget.resize(*RESIZE_SIZES[i % len(RESIZE_SIZES)]))
+
+    widget.close()
+    widget.deleteLater()
+    return probe.sections
+
+def _run_display_workloads(cards: Sequence[str]) -> Dict[str, Dict[str, List[tuple]]]:
+    from src.core.animations import splash_steps
+    from src.display.gui_display import PunchCardDisplay
+
+    display = PunchCardDisplay()
+    display.resize(1280, 800)
+    display.show()
+    # The benchmark drives the animations itself
+    for job in display.ticks.jobs.values():
+        job.stop()
+    QApplication.processEvents()
+    card_widget = display.punch_card
+    probe = PaintProbe(card_widget)
+
+    display.hardware_check_complete = True
+    display.showing_splash = True
+    display.splash_step = 0
+    probe.section("display splash")
+    for _ in splash_steps(card_widget.num_rows, card_widget.num_cols):
+        probe.tick(display.update_splash)
+
+    display.showing_splash = False
+    for card in cards:
+        display.display_message(card, "Benchmark")
+        display.timer.stop()
+        QApplication.processEvents()
+        probe.section("display typing")
+        for _ in card:
+            probe.tick(display.display_next_char)
+        probe.section("idle")
+
+    for job in display.ticks.jobs.values():
+        job.stop()
+    display.console.close()
+    display.close()
+    display.deleteLater()
+    return probe.sections
+
+def run_gui_benchmark(messages: Sequence[str], resizes: int = 60,
+                      display: bool = True) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmark the GUI paint paths under the offscreen platform.
+
+    Args:
+        messages: Messages to type, dealt onto full 80-column cards
+        resizes: Number of resizes in the resize storm
+        display: Also drive the full PunchCardDisplay window
+
+    Returns:
+        Summary per section
+    """
+    app = QApplication.instance() or QApplication([])
+    sections: Dict[str, Dict[str, List[tuple]]] = {}
+    with _scratch_directory():
+        # Imported here so the GUI's settings/log files resolve inside the scratch directory
+        from src.display.gui_display import NUM_COLS
+
+        cards = deal_cards(messages, NUM_COLS)
+        sections.update(_run_widget_workloads(cards, resizes))
+        if display:
+            sections.update(_run_display_workloads(cards))
+        app.processEvents()
+
+    return {name: summarize_paints(records["ticks"], records["paints"])
+            for name, records in sections.items() if records["ticks"]}
+
+def format_gui_report(results: Dict[str, Dict[str, float]]) -> str:
+    """Format GUI benchmark results as a text table."""
+    lines = [f"{'section':<15} {'ticks':>6} {'paints':>7} {'paints/tick':>12} {'p50 ms':>8} "
+             f"{'p99 ms':>8} {'paint ms/tick':>14} {'dirty':>7}"]
+    for name, summary in results.items():
+        lines.append(f"{name:<15} {summary['ticks']:>6} {summary['paints']:>7} "
+                     f"{summary['paints_per_tick']:>12.2f} {summary['p50_ms']:>8.3f} "
+                     f"{summary['p99_ms']:>8.3f} {summary['paint_ms_per_tick']:>14.3f} "
+                     f"{summary['dirty_ratio']:>7.1%}")
+    return "\n".join(lines)
@@ -0,0 +1,172 @@
+"""
+Headless Render Benchmark for the Punch Card Project.
+
+Drives the terminal frame paths of PunchCard (show_message typing, the
+slide transition and _animate_holes_filling) against an in-memory sink with
+sleeps replaced by a recorder, then reports frames/sec, bytes emitted per
+frame and p50/p99 frame build time.
+
+Every terminal frame path ends each frame with a call to PunchCard.sleep(),
+either directly or through its FrameScheduler. The recorder therefore treats
+each sleep as a frame boundary. A frame's build time is the time since the
+previous sleep returned, and its size is the output written in between.
+Sleeps with no output in between (pure delays) are not counted as frames.
+The recorder also provides the scheduler's clock, so a recorded sleep counts
+as elapsed time and deadlines work the same as they do live.
+
+Usage:
+    python run.py --bench-render
+    python run.py --bench-render --bench-messages 50
+"""
+
+import io
+import os
+import random
+import tempfile
+import time
+from contextlib import contextmanager, redirect_stdout
+from typing import Dict, Iterator, List, Optional, Sequence
+
+class RenderSink(io.StringIO):
+    """Text stream that discards output but counts the bytes written to it."""
+
+    def __init__(self):
+        super().__init__()
+        self.bytes = 0
+        self.writes = 0
+
+    def write(self, data: str) -> int:
+        self.bytes += len(data.encode("utf-8"))
+        self.writes += 1
+        return len(data)
+
+    def isatty(self) -> bool:
+        return False
+
+class FrameRecorder:
+    """Stands in for time.sleep and records one frame per call."""
+
+    def __init__(self, sink: RenderSink):
+        self.sink = sink
+        self.sections: Dict[str, List[tuple]] = {}
+        self.simulated_sleep = 0.0
+        self._section: Optional[str] = None
+        self._last_time = time.perf_counter()
+        self._last_bytes = sink.bytes
+
+    def section(self, name: str):
+        """Attribute the frames that follow to a named section."""
+        self._section = name
+        self.sections.setdefault(name, [])
+        self._mark()
+
+    def clock(self) -> float:
+        """Monotonic time as the animation sees it, with recorded sleeps counted as elapsed."""
+        return time.perf_counter() + self.simulated_sleep
+
+    def _mark(self):
+        self._last_time = time.perf_counter()
+        self._last_bytes = self.sink.bytes
+
+    def sleep(self, seconds: float):
+        """Record the frame that just finished instead of sleeping."""
+        build_time = time.perf_counter() - self._last_time
+        emitted = self.sink.bytes - self._last_bytes
+        self.simulated_sleep += seconds
+        if self._section is not None and emitted:
+            self.sections[self._section].append((build_time, emitted))
+        self._mark()
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Get a nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+def summarize(frames: Sequence[tuple]) -> Dict[str, float]:
+    """Summarize (build_time, bytes) frame records."""
+    times = [build_time for build_time, _ in frames]
+    total = sum(times)
+    return {
+        "frames": len(frames),
+        "fps": len(frames) / total if total else float("inf"),
+        "bytes_per_frame": sum(size for _, size in frames) / len(frames) if frames else 0.0,
+        "p50_ms": percentile(times, 0.50) * 1000,
+        "p99_ms": percentile(times, 0.99) * 1000,
+    }
+
+@contextmanager
+def _isolated_terminal(columns: int, lines: int) -> Iterator[str]:
+    """Run in a scratch directory with a fixed terminal size, restoring both after."""
+    previous_dir = os.getcwd()
+    previous_env = {key: os.environ.get(key) for key in ("COLUMNS", "LINES")}
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        os.environ["COLUMNS"] = str(columns)
+        os.environ["LINES"] = str(lines)
+        try:
+            yield scratch
+        finally:
+            os.chdir(previous_dir)
+            for key, value in previous_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+def random_messages(count: int, seed: int = 1890) -> List[str]:
+    """Generate benchmark messages of mixed length."""
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .,-+*/=()"
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(10, 80))) for _ in range(count)]
+
+def run_render_benchmark(messages: Sequence[str], columns: int = 120, lines: int = 40,
+                         animation: bool = True) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmark the terminal render paths headlessly.
+
+    Args:
+        messages: Messages to push through show_message
+        columns: Simulated terminal width
+        lines: Simulated terminal height
+        animation: Also run the hole-filling wave animation
+
+    Returns:
+        Summary per section ('show_message', 'animation', 'total')
+    """
+    # Imported here so the project's settings/history files resolve inside the scratch directory
+    from src.core.punch_card import PunchCard
+
+    sink = RenderSink()
+    recorder = FrameRecorder(sink)
+    with _isolated_terminal(columns, lines), redirect_stdout(sink):
+        card = PunchCard(sleep=recorder.sleep, clock=recorder.clock, skip_splash=True)
+        recorder.section("show_message")
+        for message in messages:
+            card.show_message(message, "Benchmark")
+        if animation:
+            recorder.section("animation")
+            card._animate_holes_filling()
+        recorder.section("done")
+
+    results = {name: summarize(frames) for name, frames in recorder.sections.items() if frames}
+    results["total"] = summarize([frame for frames in recorder.sections.values() for frame in frames])
+    results["total"]["simulated_sleep_s"] = recorder.simulated_sleep
+    results["total"]["skipped_frames"] = card.scheduler.skipped
+    return results
+
+def format_report(results: Dict[str, Dict[str, float]]) -> str:
+    """Format benchmark results as a text table."""
+    lines = [f"{'section':<14} {'frames':>7} {'frames/s':>10} {'bytes/frame':>12} {'p50 ms':>8} {'p99 ms':>8}"]
+    for name, summary in results.items():
+        lines.append(f"{name:<14} {summary['frames']:>7} {summary['fps']:>10,.0f} "
+                     f"{summary['bytes_per_frame']:>12,.0f} {summary['p50_ms']:>8.3f} {summary['p99_ms']:>8.3f}")
+    sleep = results.get("total", {}).get("simulated_sleep_s")
+    if sleep is not None:
+        lines.append(f"\nSkipped {sleep:,.1f}s of display delays")
+    skipped = results.get("total", {}).get("skipped_frames")
+    if skipped:
+        lines.append(f"Dropped {skipped:,} frames to stay on schedule")
+    return "\n".join(lines)
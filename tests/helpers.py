@@ -0,0 +1,54 @@
+"""Shared helpers for tests that build a terminal PunchCard."""
+
+import os
+import signal
+import tempfile
+from contextlib import contextmanager, redirect_stdout
+from typing import IO, Iterator, Optional
+
+from src.utils.render_benchmark import RenderSink
+
+@contextmanager
+def isolated_terminal(columns: int = 120, lines: int = 40, output: Optional[IO[str]] = None) -> Iterator[IO[str]]:
+    """
+    Run in a scratch directory with a fixed terminal size and stdout captured.
+
+    The working directory, COLUMNS/LINES and the SIGWINCH handler (which
+    PunchCard installs) are all restored afterwards.
+
+    Args:
+        columns: Simulated terminal width
+        lines: Simulated terminal height
+        output: Stream for stdout (default: a RenderSink that discards it)
+
+    Yields:
+        The stdout stream
+    """
+    output = RenderSink() if output is None else output
+    previous_dir = os.getcwd()
+    previous_env = {key: os.environ.get(key) for key in ("COLUMNS", "LINES")}
+    previous_sigwinch = signal.getsignal(signal.SIGWINCH) if hasattr(signal, "SIGWINCH") else None
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        os.environ["COLUMNS"] = str(columns)
+        os.environ["LINES"] = str(lines)
+        try:
+            with redirect_stdout(output):
+                yield output
+        finally:
+            os.chdir(previous_dir)
+            for key, value in previous_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+            if previous_sigwinch is not None:
+                signal.signal(signal.SIGWINCH, previous_sigwinch)
+
+def make_punch_card(**kwargs):
+    """Build a PunchCard that never sleeps and skips the splash (call inside isolated_terminal)."""
+    from src.core.punch_card import PunchCard
+
+    kwargs.setdefault("sleep", lambda seconds: None)
+    kwargs.setdefault("skip_splash", True)
+    return PunchCard(**kwargs)
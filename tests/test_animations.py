@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Test suite for the precompiled animation keyframes."""
+
+import unittest
+
+from src.core.animations import (apply_step, diagonal, hole_wave_text, slide_offsets,
+                                 splash_steps, WAVE_WIDTH)
+from src.core.card_grid import CardGrid
+
+ROWS, COLUMNS = 12, 80
+
+def naive_wave(rows, columns):
+    """The wave computed cell by cell: 0 hidden, 1 punched, 2 empty hole."""
+    grid = [[0] * columns for _ in range(rows)]
+    frames = []
+    for d in range(rows + columns - 1 + 2 * WAVE_WIDTH):
+        for index, value in ((d, 2), (d - WAVE_WIDTH, 1), (d - 2 * WAVE_WIDTH, 2)):
+            for row in range(rows):
+                col = index - row
+                if index >= 0 and 0 <= col < columns:
+                    grid[row][col] = value
+        frames.append(tuple("".join(" █□"[v] for v in line) for line in grid))
+    return frames
+
+class TestAnimations(unittest.TestCase):
+    def test_diagonal(self):
+        """Diagonals hold the cells with row + column == index, clipped to the card."""
+        self.assertEqual(diagonal(ROWS, COLUMNS, 0), ((0, 1),))
+        self.assertEqual(len(diagonal(ROWS, COLUMNS, 40)), ROWS)
+        self.assertEqual(diagonal(ROWS, COLUMNS, 90), ((79, 1 << 11),))
+        self.assertEqual(diagonal(ROWS, COLUMNS, 91), ())
+
+    def test_hole_wave_matches_cell_by_cell(self):
+        """The compiled wave matches the per-cell algorithm frame for frame."""
+        self.assertEqual(list(hole_wave_text(ROWS, COLUMNS)), naive_wave(ROWS, COLUMNS))
+        self.assertIs(hole_wave_text(ROWS, COLUMNS), hole_wave_text(ROWS, COLUMNS))
+
+    def test_splash_sweeps_a_band_and_ends_blank(self):
+        """The splash clears a used card, sweeps a 12-diagonal band and leaves it blank."""
+        grid = CardGrid.from_codes([0xFFF] * COLUMNS)
+        steps = splash_steps(ROWS, COLUMNS)
+        total = ROWS + COLUMNS - 1
+        for step in steps[:total]:
+            apply_step(grid, step)
+        self.assertTrue(grid.is_blank())
+        for step in steps[total:total + 30]:
+            apply_step(grid, step)
+        self.assertEqual(grid.hole_count(), sum(len(diagonal(ROWS, COLUMNS, d)) for d in range(18, 30)))
+        for step in steps[total + 30:]:
+            apply_step(grid, step)
+        self.assertTrue(grid.is_blank())
+
+    def test_slide_offsets(self):
+        """Slide offsets match the progress-based shift."""
+        self.assertEqual(slide_offsets(80, 5), (0, 16, 32, 48, 64))
+
+if __name__ == "__main__":
+    unittest.main()
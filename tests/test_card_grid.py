@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Test suite for the packed CardGrid."""
+
+import unittest
+
+from src.core.card_grid import CardGrid, FrozenCardGrid
+from src.core.hollerith import ROWS, COLUMNS, BLANK, encode_char, encode_text, decode_grid, grid_to_codes
+
+class TestCardGrid(unittest.TestCase):
+    def test_blank_grid(self):
+        """New grids are 12x80 with every hole unpunched."""
+        grid = CardGrid()
+        self.assertEqual((grid.rows, grid.columns), (ROWS, COLUMNS))
+        self.assertTrue(grid.is_blank())
+        self.assertEqual(len(grid.tobytes()), COLUMNS * 2)
+
+    def test_cell_access(self):
+        """Holes are read and written with (row, col) indexing."""
+        grid = CardGrid()
+        grid[0, 5] = True
+        self.assertTrue(grid[0, 5])
+        self.assertTrue(grid.get(0, 5))
+        self.assertFalse(grid.get(1, 5))
+        self.assertTrue(grid.set(2, 5, 1))
+        self.assertFalse(grid.set(2, 5, True))
+        self.assertEqual(grid.hole_count(), 2)
+        self.assertEqual(grid.get_column(5), 0b101)
+
+    def test_legacy_row_indexing_fails_loudly(self):
+        """grid[row][col] raises instead of silently misbehaving."""
+        grid = CardGrid()
+        with self.assertRaises(TypeError):
+            grid[0]
+        with self.assertRaises(IndexError):
+            grid.set(ROWS, 0, True)
+
+    def test_set_column(self):
+        """Whole columns take encoder codes directly."""
+        grid = CardGrid()
+        for col, code in enumerate(encode_text("HELLO")):
+            grid.set_column(col, code)
+        self.assertEqual(decode_grid(grid).rstrip(), "HELLO")
+        self.assertEqual(grid_to_codes(grid).tolist(), encode_text("HELLO", COLUMNS).tolist())
+        self.assertFalse(grid.set_column(0, encode_char("H")))
+
+    def test_snapshot_is_copy_on_write(self):
+        """Snapshots keep their contents when either side is written."""
+        grid = CardGrid()
+        grid.set_column(0, encode_char("A"))
+        previous = grid.snapshot()
+        grid.set_column(0, encode_char("B"))
+        previous.set(11, 1, True)
+        self.assertEqual(previous.get_column(0), encode_char("A"))
+        self.assertEqual(grid.get_column(0), encode_char("B"))
+        self.assertFalse(grid.get(11, 1))
+
+    def test_shifted_and_xor(self):
+        """Shifting slides content left; XOR reports changed bits."""
+        grid = CardGrid.from_codes(encode_text("ABC", COLUMNS))
+        shifted = grid.shifted(1)
+        self.assertEqual(decode_grid(shifted).rstrip(), "BC")
+        self.assertTrue(grid.shifted(COLUMNS).is_blank())
+        changes = grid.xor(shifted)
+        self.assertEqual(changes[0], encode_char("A") ^ encode_char("B"))
+        self.assertEqual(changes[3], 0)
+
+    def test_diff_is_minimal(self):
+        """Diffs list exactly the cells that change, with their new state."""
+        before = CardGrid.from_codes(encode_text("AB", COLUMNS))
+        after = CardGrid.from_codes(encode_text("AC", COLUMNS))
+        changes = before.diff(after)
+        self.assertEqual(len(changes), bin(encode_char("B") ^ encode_char("C")).count("1"))
+        self.assertTrue(all(col == 1 for _, col, _ in changes))
+        for row, col, state in changes:
+            before.set(row, col, state)
+        self.assertEqual(before, after)
+        self.assertEqual(after.diff(after.snapshot()), [])
+        self.assertEqual(after.diff_column(0, encode_char("A")), [])
+        self.assertEqual(after.diff_column(0, BLANK), [(0, False), (3, False)])
+
+    def test_freeze_is_read_only_and_cached(self):
+        """Frozen grids reject writes, are reused until the grid changes and never see later writes."""
+        grid = CardGrid()
+        grid.set_column(0, encode_char("A"))
+        frame = grid.freeze()
+        self.assertIsInstance(frame, FrozenCardGrid)
+        self.assertIs(grid.freeze(), frame)
+        self.assertIs(frame.freeze(), frame)
+        with self.assertRaises(TypeError):
+            frame[0, 1] = True
+        with self.assertRaises(TypeError):
+            frame.set_column(1, encode_char("B"))
+        grid.set_column(1, encode_char("B"))
+        self.assertEqual(decode_grid(frame).rstrip(), "A")
+        self.assertIsNot(grid.freeze(), frame)
+        self.assertEqual(hash(grid.freeze()), hash(grid.copy().freeze()))
+        editable = frame.copy()
+        editable[0, 1] = True
+        self.assertTrue(editable[0, 1])
+
+    def test_list_of_lists_round_trip(self):
+        """Legacy row-major grids convert both ways."""
+        grid = CardGrid.from_codes(encode_text("PUNCH", COLUMNS))
+        rows = grid.to_rows()
+        self.assertEqual(len(rows), ROWS)
+        self.assertEqual(CardGrid.from_rows(rows), grid)
+        grid.clear()
+        self.assertTrue(grid.is_blank())
+
+if __name__ == "__main__":
+    unittest.main()
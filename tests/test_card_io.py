@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Test suite for streaming deck import/export."""
+
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.core.hollerith import COLUMNS, encode_text, describe_code
+from src.core.card_io import (read_card_images, write_card_images, read_column_binary,
+                              write_column_binary, codes_to_column_binary, column_binary_to_codes,
+                              encode_cards, decode_cards, batched, import_to_message_database,
+                              import_to_database, RejectedCardsError)
+from src.core.message_database import MessageDatabase
+
+class TestCardImages(unittest.TestCase):
+    def test_read_normalizes_lines(self):
+        """Line endings are stripped and long lines cut to the card width."""
+        source = io.StringIO("HELLO\r\n" + "X" * 90 + "\n\nLAST")
+        cards = list(read_card_images(source))
+        self.assertEqual(cards, ["HELLO", "X" * COLUMNS, "", "LAST"])
+
+    def test_write_round_trip(self):
+        """Card-image files read back what was written."""
+        target = io.StringIO()
+        self.assertEqual(write_card_images(target, ["ONE", "TWO"], pad=True), 2)
+        self.assertEqual(target.getvalue().splitlines()[0], "ONE".ljust(COLUMNS))
+        target.seek(0)
+        self.assertEqual([card.rstrip() for card in read_card_images(target)], ["ONE", "TWO"])
+
+class TestColumnBinary(unittest.TestCase):
+    def test_byte_layout(self):
+        """Rows 12-3 go in the first byte and rows 4-9 in the second, high bit first."""
+        code = encode_text("A")[0]  # 12,1
+        self.assertEqual(describe_code(code), "12,1")
+        self.assertEqual(codes_to_column_binary([code], 1), bytes((0b100100, 0)))
+        nine = encode_text("9")[0]
+        self.assertEqual(codes_to_column_binary([nine], 1), bytes((0, 0b000001)))
+
+    def test_all_codes_round_trip(self):
+        """Every 12-bit code survives packing and unpacking."""
+        codes = list(range(4096))
+        data = codes_to_column_binary(codes, len(codes))
+        self.assertEqual(column_binary_to_codes(data).tolist(), codes)
+
+    def test_stream_round_trip(self):
+        """Column-binary files stream back card by card, card marks ignored."""
+        cards = list(encode_cards(["HELLO", "WORLD"]))
+        buffer = io.BytesIO()
+        self.assertEqual(write_column_binary(buffer, cards, card_marks=True), 2)
+        self.assertEqual(len(buffer.getvalue()), 2 * COLUMNS * 2)
+        buffer.seek(0)
+        decoded = [text.rstrip() for text in decode_cards(read_column_binary(buffer))]
+        self.assertEqual(decoded, ["HELLO", "WORLD"])
+
+    def test_truncated_card(self):
+        """A partial trailing card is an error, not silently dropped."""
+        with self.assertRaises(ValueError):
+            list(read_column_binary(io.BytesIO(b"\x00" * 10)))
+
+class TestBulkImport(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_batched(self):
+        """Streams are grouped into bounded batches."""
+        self.assertEqual(list(batched(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_message_database_bulk_insert(self):
+        """Imports add every card and save the history once."""
+        database = MessageDatabase(os.path.join(self.tmp.name, "history.json"))
+        count = import_to_message_database(database, read_card_images(io.StringIO("A  \nB\n")))
+        self.assertEqual(count, 2)
+        self.assertEqual([record.content for record in database.messages], ["A", "B"])
+        self.assertEqual(MessageDatabase(database.db_path).get_message_count(), 2)
+
+    def test_sqlite_bulk_insert(self):
+        """Imports stream into SQLite with executemany and batch commits."""
+        from src.core.database import Database
+        database = Database.__new__(Database)
+        database.conn = sqlite3.connect(":memory:")
+        database._create_tables()
+        count = import_to_database(database, ["HELLO", "WORLD", "AGAIN"], batch_size=2)
+        self.assertEqual(count, 3)
+        rows = database.conn.execute("SELECT serial_number, message, punch_pattern FROM messages").fetchall()
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0][0], "IMPORT-00000001")
+        self.assertEqual(len(rows[0][2]), COLUMNS * 3)
+        database.close()
+
+    def memory_database(self):
+        from src.core.database import Database
+        database = Database.__new__(Database)
+        database.conn = sqlite3.connect(":memory:")
+        database._create_tables()
+        self.addCleanup(database.close)
+        return database
+
+    def messages(self, database):
+        return database.conn.execute("SELECT serial_number, message FROM messages ORDER BY id").fetchall()
+
+    def test_sqlite_file_without_config(self):
+        """Database can open a plain SQLite file, as the import script's --db does."""
+        from src.core.database import Database
+        path = os.path.join(self.tmp.name, "cards", "punch_card.db")
+        database = Database(db_path=path)
+        self.assertEqual(import_to_database(database, ["ONE", "TWO"]), 2)
+        database.close()
+        reopened = Database(db_path=path)
+        self.addCleanup(reopened.close)
+        self.assertEqual(reopened.get_message("IMPORT-00000002"), "TWO")
+
+    def test_repeated_imports_continue_numbering(self):
+        """A second import numbers after the first instead of replacing its rows."""
+        database = self.memory_database()
+        import_to_database(database, ["FIRST A", "FIRST B"])
+        import_to_database(database, ["SECOND A"])
+        self.assertEqual(self.messages(database), [("IMPORT-00000001", "FIRST A"),
+                                                   ("IMPORT-00000002", "FIRST B"),
+                                                   ("IMPORT-00000003", "SECOND A")])
+
+    def test_rejected_cards_are_reported(self):
+        """Collisions skip only the bad rows, and the import raises with them."""
+        database = self.memory_database()
+        import_to_database(database, ["X" * 90, "KEEP"], batch_size=10)
+        with self.assertRaises(RejectedCardsError) as raised:
+            import_to_database(database, ["NEW", "CLASH", "ALSO NEW"], first_number=1, batch_size=2)
+        self.assertEqual(raised.exception.imported, 1)
+        self.assertEqual([row[0] for row in raised.exception.rejected],
+                         ["IMPORT-00000001", "IMPORT-00000002"])
+        self.assertEqual(self.messages(database), [("IMPORT-00000001", "X" * COLUMNS),
+                                                   ("IMPORT-00000002", "KEEP"),
+                                                   ("IMPORT-00000003", "ALSO NEW")])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Test suite for the cached terminal layout of PunchCard."""
+
+import os
+import shutil
+import signal
+import unittest
+from unittest import mock
+
+from tests.helpers import isolated_terminal, make_punch_card
+
+class TestCardLayout(unittest.TestCase):
+    def test_frames_reuse_cached_layout(self):
+        """Frames don't query the terminal size or rebuild the card chrome."""
+        with isolated_terminal():
+            card = make_punch_card()
+            layout = card._card_layout(header_height=4, footer_height=1)
+            with mock.patch.object(shutil, "get_terminal_size", side_effect=AssertionError):
+                card.show_message("HELLO", "Test")
+            self.assertIs(card._card_layout(header_height=4, footer_height=1), layout)
+        self.assertEqual(layout.x_offset, (120 - 84) // 2)
+        self.assertEqual(layout.top_border, " " * 18 + "   ┌" + "─" * 80 + "┐")
+        self.assertEqual(layout.row_prefixes[0], " " * 18 + "12 │")
+        self.assertEqual(layout.blank_prefixes[0], " " * 18 + "   │")
+
+    @unittest.skipUnless(hasattr(signal, "SIGWINCH"), "needs SIGWINCH")
+    def test_resize_signal_recenters_card(self):
+        """SIGWINCH makes the next frame re-read the size once and redraw in full."""
+        with isolated_terminal():
+            card = make_punch_card()
+            self.assertEqual(card._calculate_offsets(), (18, 10))
+            os.environ["COLUMNS"] = "160"
+            os.kill(os.getpid(), signal.SIGWINCH)
+            with mock.patch.object(card.renderer, "clear") as clear:
+                self.assertEqual(card._calculate_offsets(), (38, 10))
+                card._calculate_offsets()
+            clear.assert_called_once_with()
+            self.assertEqual(card.terminal_width, 160)
+
+    @unittest.skipUnless(hasattr(signal, "SIGWINCH"), "needs SIGWINCH")
+    def test_resize_handler_does_not_leak(self):
+        """The handler PunchCard installs is removed again after the test terminal closes."""
+        before = signal.getsignal(signal.SIGWINCH)
+        with isolated_terminal():
+            card = make_punch_card()
+            self.assertEqual(signal.getsignal(signal.SIGWINCH), card._on_terminal_resize)
+        self.assertEqual(signal.getsignal(signal.SIGWINCH), before)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Test suite for the compiled code page registry."""
+
+import io
+import json
+import unittest
+
+from src.core.hollerith import ENCODE_TABLE, DECODE_TABLE, BLANK, UNKNOWN_CHAR, describe_code
+from src.core.code_pages import (CodePage, DEFAULT_CODE_PAGE, get_code_page, register_code_page,
+                                 available_code_pages, parse_punches, CODE_PAGES)
+from tests.helpers import isolated_terminal, make_punch_card
+
+class TestCodePages(unittest.TestCase):
+    def test_builtin_pages(self):
+        """All the historical code pages are registered."""
+        for name in ("legacy", "026-commercial", "026-fortran", "029", "ebcdic"):
+            self.assertIn(name, available_code_pages())
+        self.assertEqual(get_code_page().name, DEFAULT_CODE_PAGE)
+        with self.assertRaises(ValueError):
+            get_code_page("no-such-page")
+
+    def test_legacy_matches_shared_tables(self):
+        """The default page compiles to exactly the encoder's own tables."""
+        legacy = get_code_page("legacy")
+        self.assertEqual(legacy.encode_table, ENCODE_TABLE)
+        self.assertEqual(legacy.decode_table, DECODE_TABLE)
+
+    def test_parse_punches(self):
+        """Punch notation maps row labels onto column code bits."""
+        self.assertEqual(parse_punches(""), BLANK)
+        self.assertEqual(describe_code(parse_punches("12-8-3")), "12,3,8")
+        with self.assertRaises(ValueError):
+            parse_punches("13")
+
+    def test_029_has_no_digit_collisions(self):
+        """Specials no longer share codes with digits on the 029."""
+        page = get_code_page("029")
+        self.assertNotEqual(page.encode_char("."), page.encode_char("0"))
+        self.assertNotEqual(page.encode_char(","), page.encode_char("1"))
+        text = "HELLO, WORLD. (1+2)*3=9"
+        self.assertEqual(page.decode_columns(page.encode_text(text)), text)
+        self.assertEqual(page.encode_char("a"), page.encode_char("A"))
+
+    def test_026_variants_differ(self):
+        """Commercial and FORTRAN 026 punch the same holes for different characters."""
+        commercial = get_code_page("026-commercial")
+        fortran = get_code_page("026-fortran")
+        self.assertEqual(commercial.encode_char("#"), fortran.encode_char("="))
+        self.assertEqual(commercial.decode_code(parse_punches("12")), "&")
+        self.assertEqual(fortran.decode_code(parse_punches("12")), "+")
+
+    def test_ebcdic_lowercase(self):
+        """The extended page gives lowercase letters codes of their own."""
+        page = get_code_page("ebcdic")
+        self.assertEqual(page.encode_char("a"), parse_punches("12-0-1"))
+        self.assertEqual(page.decode_columns(page.encode_text("Punch")), "Punch")
+        self.assertEqual(page.decode_code(0xFFF), UNKNOWN_CHAR)
+
+    def test_register_at_runtime(self):
+        """New pages can be registered and selected without re-importing."""
+        page = register_code_page(CodePage.from_punches("test-page", {"X": "12-11"}))
+        try:
+            self.assertIs(get_code_page("test-page"), page)
+            self.assertEqual(page.encode_text("xy").tolist(), [parse_punches("12-11"), BLANK])
+        finally:
+            del CODE_PAGES["test-page"]
+
+    def test_unknown_page_in_settings_falls_back(self):
+        """A stale code_page setting doesn't stop PunchCard from starting."""
+        with isolated_terminal(output=io.StringIO()) as output:
+            with open("punch_card_settings.json", "w") as f:
+                json.dump({"code_page": "no-such-page"}, f)
+            card = make_punch_card()
+        self.assertEqual(card.code_page.name, DEFAULT_CODE_PAGE)
+        self.assertIn("no-such-page", output.getvalue())
+
+    def test_punch_description_follows_code_page(self):
+        """The "Decrypting" description shows the holes the active page punches."""
+        with isolated_terminal():
+            card = make_punch_card()
+        legacy = card._get_character_description(".")
+        self.assertEqual(legacy, describe_code(get_code_page("legacy").encode_char(".")))
+        card.set_code_page("029")
+        self.assertEqual(card._get_character_description("."), "12,3,8")
+        self.assertNotEqual(card._get_character_description("."), legacy)
+
+if __name__ == "__main__":
+    unittest.main()
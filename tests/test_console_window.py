@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Test suite for the buffered GUI ConsoleWindow."""
+
+import os
+import threading
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtWidgets import QApplication
+    from src.display.gui_display import ConsoleWindow, CONSOLE_MAX_LINES, CONSOLE_FLUSH_INTERVAL
+    from src.display.tick_scheduler import TickScheduler
+    PYQT_AVAILABLE = True
+except ImportError:
+    PYQT_AVAILABLE = False
+
+@unittest.skipUnless(PYQT_AVAILABLE, "PyQt6 not installed")
+class TestConsoleWindow(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.console = ConsoleWindow()
+
+    def lines(self):
+        return self.console.console.toPlainText().splitlines()
+
+    def test_lines_are_batched_until_flush(self):
+        """log() only queues; flush() appends everything queued, one line per message."""
+        self.console.log("first")
+        self.console.log("<second>", "ERROR")
+        self.assertEqual(self.lines(), [])
+        self.console.flush()
+        self.assertEqual(len(self.lines()), 2)
+        self.assertTrue(self.lines()[0].endswith("[INFO] first"))
+        self.assertTrue(self.lines()[1].endswith("[ERROR] <second>"))
+
+    def test_history_is_bounded(self):
+        """Only the newest CONSOLE_MAX_LINES lines are kept."""
+        for batch in range(3):
+            for i in range(CONSOLE_MAX_LINES):
+                self.console.log(f"line {batch}-{i}", "LED")
+            self.console.flush()
+        lines = self.lines()
+        self.assertEqual(len(lines), CONSOLE_MAX_LINES)
+        self.assertTrue(lines[-1].endswith(f"line 2-{CONSOLE_MAX_LINES - 1}"))
+
+    def test_hidden_levels_are_dropped(self):
+        """Messages of a hidden level are never queued."""
+        self.console.set_level_enabled("LED", False)
+        self.assertFalse(self.console.is_enabled("LED"))
+        self.console.log("cleared row 3", "LED")
+        self.console.log("still shown", "WARNING")
+        self.console.flush()
+        self.assertEqual(len(self.lines()), 1)
+        self.console.set_level_enabled("LED", True)
+        self.assertTrue(self.console.is_enabled("LED"))
+
+    def test_log_from_worker_thread(self):
+        """Background threads can log; the lines appear on the next flush."""
+        worker = threading.Thread(target=self.console.log, args=("from worker", "SUCCESS"))
+        worker.start()
+        worker.join()
+        self.console.flush()
+        self.assertTrue(self.lines()[-1].endswith("[SUCCESS] from worker"))
+
+    def test_flush_job_only_runs_when_lines_are_queued(self):
+        """An idle console has no active job; a queued line arms one flush, even from a worker."""
+        now = [100.0]
+        ticks = TickScheduler(clock=lambda: now[0])
+        console = ConsoleWindow(ticks=ticks)
+        self.assertEqual(ticks.active_jobs(), {})
+
+        worker = threading.Thread(target=console.log, args=("from worker", "INFO"))
+        worker.start()
+        worker.join()
+        console.log("from GUI thread")
+        QApplication.processEvents()
+        self.assertEqual(ticks.active_jobs(), {"console_flush": CONSOLE_FLUSH_INTERVAL})
+
+        now[0] += CONSOLE_FLUSH_INTERVAL / 1000
+        ticks._run_due()
+        self.assertEqual(len(console.console.toPlainText().splitlines()), 2)
+        self.assertEqual(ticks.active_jobs(), {})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Test suite for column-binary deck files."""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from src.core.hollerith import COLUMNS, NUMPY_AVAILABLE, encode_text
+from src.core.code_pages import get_code_page
+from src.core.deck_file import (DeckWriter, DeckReader, DeckFormatError, HEADER, INDEX_ENTRY,
+                                card_size, index_path, export_message_history)
+from src.core.message_database import MessageDatabase
+from tests.helpers import isolated_terminal, make_punch_card
+
+class TestDeckFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "history.deck")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_fixed_card_size(self):
+        """Cards are 160 bytes after a fixed header."""
+        with DeckWriter(self.path) as deck:
+            deck.append_text("HELLO", 1)
+            deck.append_text("WORLD", 2)
+        self.assertEqual(os.path.getsize(self.path), HEADER.size + 2 * card_size())
+        self.assertEqual(card_size(), 160)
+
+    def test_random_access(self):
+        """Cards read back by position and by message number."""
+        with DeckWriter(self.path) as deck:
+            for number, text in enumerate(["ALPHA", "BRAVO", "CHARLIE"], start=10):
+                deck.append_text(text, number)
+        with DeckReader(self.path) as deck:
+            self.assertEqual(len(deck), 3)
+            card = deck.card(1)
+            self.assertEqual(len(card), COLUMNS)
+            self.assertEqual(card.tolist(), encode_text("BRAVO", COLUMNS).tolist())
+            del card
+            self.assertEqual(deck.text(-1).rstrip(), "CHARLIE")
+            self.assertEqual(deck.find(12), 2)
+            self.assertIsNone(deck.find(99))
+            self.assertEqual(deck.grid_for_message(10).tobytes(), encode_text("ALPHA", COLUMNS).tobytes())
+            with self.assertRaises(IndexError):
+                deck.card(3)
+
+    def test_append_mode(self):
+        """Reopening a deck appends after the existing cards."""
+        with DeckWriter(self.path) as deck:
+            deck.append_text("FIRST", 1)
+        with DeckWriter(self.path) as deck:
+            self.assertEqual(deck.append_text("SECOND", 2), 1)
+        with DeckReader(self.path) as deck:
+            self.assertEqual([deck.text(i).rstrip() for i in range(len(deck))], ["FIRST", "SECOND"])
+            self.assertEqual(deck.find(2), 1)
+
+    def test_last_message_number(self):
+        """Reopened decks report the last indexed message number."""
+        with DeckWriter(self.path) as deck:
+            self.assertIsNone(deck.last_message_number)
+            deck.append_text("FIRST", 41)
+            deck.append_text("SECOND", 42)
+        with DeckWriter(self.path) as deck:
+            self.assertEqual(deck.last_message_number, 42)
+
+    def test_message_numbers_must_increase(self):
+        """The writer keeps the index sorted by refusing numbers that don't increase."""
+        with DeckWriter(self.path) as deck:
+            deck.append_text("FIRST", 5)
+            with self.assertRaises(ValueError):
+                deck.append_text("AGAIN", 5)
+            deck.append_text("UNINDEXED")
+            self.assertEqual(deck.count, 2)
+
+    def test_find_in_unsorted_index(self):
+        """Indexes written out of order are still searchable, misses included."""
+        with DeckWriter(self.path, index=False) as deck:
+            for text in ("A", "B", "C"):
+                deck.append_text(text)
+        with open(index_path(self.path), "wb") as f:
+            for number, card in ((30, 0), (10, 1), (20, 2)):
+                f.write(INDEX_ENTRY.pack(number, HEADER.size + card * card_size()))
+        with DeckReader(self.path) as deck:
+            self.assertEqual([deck.find(n) for n in (10, 20, 30, 40)], [1, 2, 0, None])
+
+    def test_append_repairs_interrupted_write(self):
+        """A partial card and its index entry are dropped when the deck is reopened."""
+        with DeckWriter(self.path) as deck:
+            deck.append_text("FIRST", 1)
+            deck.append_text("TORN", 2)
+        with open(self.path, "r+b") as f:
+            f.truncate(HEADER.size + card_size() + 10)
+        with open(index_path(self.path), "ab") as f:
+            f.write(b"\x03\x00\x00")
+        with DeckWriter(self.path) as deck:
+            self.assertEqual(deck.count, 1)
+            deck.append_text("SECOND", 2)
+        with DeckReader(self.path) as deck:
+            self.assertEqual([deck.text(i).rstrip() for i in range(len(deck))], ["FIRST", "SECOND"])
+            self.assertEqual(deck.find(2), 1)
+        self.assertEqual(os.path.getsize(index_path(self.path)), 32)
+
+    def test_code_page(self):
+        """Cards can be written and read with a code page."""
+        page = get_code_page("ebcdic")
+        with DeckWriter(self.path, index=False) as deck:
+            deck.append_text("Punch", code_page=page)
+        self.assertFalse(os.path.exists(index_path(self.path)))
+        with DeckReader(self.path) as deck:
+            self.assertEqual(deck.text(0, page).rstrip(), "Punch")
+            self.assertIsNone(deck.find(1))
+
+    def test_rejects_other_files(self):
+        """Non-deck files raise DeckFormatError."""
+        with open(self.path, "wb") as f:
+            f.write(b"not a deck file at all")
+        with self.assertRaises(DeckFormatError):
+            DeckReader(self.path)
+        open(self.path, "wb").close()
+        with self.assertRaises(DeckFormatError):
+            DeckReader(self.path)
+
+    def test_reader_ignores_torn_index_entry(self):
+        """A partial entry at the end of the index is ignored."""
+        with DeckWriter(self.path) as deck:
+            deck.append_text("HELLO", 7)
+        with open(index_path(self.path), "ab") as f:
+            f.write(b"\x08\x00")
+        with DeckReader(self.path) as deck:
+            self.assertEqual(deck.find(7), 0)
+            self.assertIsNone(deck.find(8))
+
+    def test_punch_card_starts_with_unreadable_deck(self):
+        """PunchCard warns and skips the deck instead of failing to start."""
+        with isolated_terminal(output=io.StringIO()) as output:
+            with open("bad.deck", "wb") as f:
+                f.write(b"not a deck file at all")
+            with open("punch_card_settings.json", "w") as f:
+                json.dump({"deck_file": "bad.deck"}, f)
+            card = make_punch_card()
+            card._save_settings()
+            with open("punch_card_settings.json") as f:
+                self.assertEqual(json.load(f)["deck_file"], "bad.deck")
+        self.assertIsNone(card.deck_writer)
+        self.assertIn("not a deck file", output.getvalue())
+
+    def test_export_message_history(self):
+        """A JSON message history converts to an indexed deck."""
+        database = MessageDatabase(os.path.join(self.tmp.name, "history.json"))
+        for text in ["ONE", "TWO", "THREE"]:
+            database.add_message(text)
+        self.assertEqual(export_message_history(database, self.path), 3)
+        with DeckReader(self.path) as deck:
+            self.assertEqual(deck.text(deck.find(2)).rstrip(), "TWO")
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "NumPy is not installed")
+    def test_as_array(self):
+        """The whole deck maps to an (N, 80) array of column codes."""
+        with DeckWriter(self.path) as deck:
+            deck.append_text("A")
+            deck.append_text("B")
+        deck = DeckReader(self.path)
+        codes = deck.as_array()
+        self.assertEqual(codes.shape, (2, COLUMNS))
+        self.assertEqual(int(codes[1, 0]), encode_text("B")[0])
+        del codes
+        deck.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Test suite for the Rich mode of the unified PunchCardDisplay."""
+
+import io
+import unittest
+from unittest import mock
+
+from rich.console import Console
+
+from src.core.hollerith import decode_grid
+from src.display.display import PunchCardDisplay, RICH_ON_CHAR, RICH_OFF_CHAR
+
+class TestRichDisplay(unittest.TestCase):
+    def setUp(self):
+        with mock.patch.object(PunchCardDisplay, "_setup_terminal"):
+            self.display = PunchCardDisplay(led_delay=0, message_delay=0, skip_splash=True)
+        self.output = io.StringIO()
+        self.display.console = Console(file=self.output, force_terminal=True, width=100, height=35)
+
+    def row_cells(self, row):
+        """The LED characters of one persistent row Text."""
+        return self.display._rich_rows[row].plain[3:-1]
+
+    def test_rows_track_the_grid(self):
+        """Row Texts are edited in place as LEDs change."""
+        self.assertEqual(self.display.display_mode, "rich")
+        rows = list(self.display._rich_rows)
+        self.display.set_led(0, 5, True)
+        self.assertEqual(self.row_cells(0)[5], RICH_ON_CHAR)
+        self.display.clear_grid()
+        self.assertEqual(self.row_cells(0), RICH_OFF_CHAR * 80)
+        self.assertEqual(self.display._rich_rows, rows)
+
+    def test_show_message(self):
+        """A message renders through the persistent renderables."""
+        self.display.show_message("HELLO")
+        self.assertEqual(decode_grid(self.display.grid).rstrip(), "HELLO")
+        for row in range(12):
+            self.assertEqual(self.row_cells(row),
+                             "".join(RICH_ON_CHAR if bit else RICH_OFF_CHAR for bit in self.display.grid.row_bits(row)))
+        self.assertIn("Message display complete", self.output.getvalue())
+
+    def test_extra_rows_and_centering(self):
+        """Rows past the 12 Hollerith rows get numeric labels; the grid is centered."""
+        with mock.patch.object(PunchCardDisplay, "_setup_terminal"):
+            display = PunchCardDisplay(num_rows=14, num_cols=20, led_delay=0, message_delay=0, skip_splash=True)
+        self.assertEqual(display._rich_rows[13].plain[:3], "13│")
+        display.clear_grid()
+        self.assertEqual(display._rich_rows[12].plain[:3], "12│")
+        display.console = Console(file=self.output, force_terminal=False, width=100, height=40)
+        display.console.print(display.layout["grid"])
+        row = next(line for line in self.output.getvalue().splitlines() if "13│" in line)
+        self.assertGreater(row.index("13│"), 30)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Test suite for PunchCard fast-forward (no-animation) mode."""
+
+import json
+import os
+import unittest
+
+from src.core.hollerith import decode_grid
+from tests.helpers import isolated_terminal, make_punch_card
+
+class TestFastForward(unittest.TestCase):
+    def test_messages_skip_animations_and_batch_saves(self):
+        """Messages go through the pipeline without sleeping and are saved on flush()."""
+        def no_sleep(seconds):
+            self.fail(f"fast-forward slept for {seconds}s")
+
+        with isolated_terminal():
+            card = make_punch_card(sleep=no_sleep, fast_forward=True)
+            for i in range(50):
+                card.show_message(f"MESSAGE {i}", "Imported")
+            self.assertFalse(os.path.exists("message_history.json"))
+            self.assertEqual(decode_grid(card.grid).rstrip(), "MESSAGE 49")
+            card.flush()
+
+            with open("message_history.json") as f:
+                history = json.load(f)
+            with open("punch_card_stats.json") as f:
+                stats = json.load(f)
+        self.assertEqual(len(history["messages"]), 50)
+        self.assertEqual(history["messages"][-1]["display_count"], 1)
+        self.assertEqual(stats["cards_processed"], 50)
+
+if __name__ == "__main__":
+    unittest.main()
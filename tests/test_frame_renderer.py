@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Test suite for the ANSI dirty-region frame renderer."""
+
+import io
+import unittest
+
+from src.display.frame_renderer import (FrameRenderer, CLEAR_SCREEN, ERASE_TO_EOL,
+                                        changed_span, move_to)
+
+class CountingStream(io.StringIO):
+    """StringIO that counts write() calls."""
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+class TestFrameRenderer(unittest.TestCase):
+    def test_changed_span(self):
+        """Only the differing middle of a same-length line is rewritten."""
+        self.assertIsNone(changed_span("□□□□", "□□□□"))
+        self.assertEqual(changed_span("□□□□", "□█□□"), (1, 2))
+        self.assertEqual(changed_span("Status: IDLE", "Status: TYPING"), (8, None))
+
+    def test_first_frame_is_full(self):
+        """The first frame clears the screen and draws every line in one write."""
+        out = CountingStream()
+        renderer = FrameRenderer(out)
+        self.assertEqual(renderer.render(["", "HELLO", "WORLD"]), 2)
+        self.assertEqual(out.writes, 1)
+        self.assertTrue(out.getvalue().startswith(CLEAR_SCREEN))
+        self.assertIn(move_to(1) + "HELLO", out.getvalue())
+
+    def test_only_changes_are_written(self):
+        """Later frames position the cursor on changed cells only."""
+        out = CountingStream()
+        renderer = FrameRenderer(out)
+        grid = ["12 │" + "□" * 80 + "│"] * 12
+        renderer.render(grid)
+        out.seek(0)
+        out.truncate()
+        frame = list(grid)
+        frame[3] = "12 │" + "□" * 10 + "█" + "□" * 69 + "│"
+        self.assertEqual(renderer.render(frame), 1)
+        self.assertEqual(out.getvalue(), move_to(3, 14) + "█" + move_to(12))
+        self.assertEqual(renderer.render(frame), 0)
+
+    def test_shorter_frame_erases_leftovers(self):
+        """Lines from a taller previous frame are erased."""
+        out = io.StringIO()
+        renderer = FrameRenderer(out)
+        renderer.render(["ONE", "TWO"])
+        out.seek(0)
+        out.truncate()
+        renderer.render(["ONE"])
+        self.assertIn(move_to(1) + ERASE_TO_EOL, out.getvalue())
+
+    def test_clear_forces_full_redraw(self):
+        """After clear() the next frame is drawn in full."""
+        out = io.StringIO()
+        renderer = FrameRenderer(out)
+        renderer.render(["SAME"])
+        renderer.clear()
+        out.seek(0)
+        out.truncate()
+        renderer.render(["SAME"])
+        self.assertIn("SAME", out.getvalue())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Test suite for the monotonic-deadline frame scheduler."""
+
+import unittest
+
+from src.utils.frame_scheduler import FrameScheduler
+
+class FakeClock:
+    """A clock that only moves when told to, or when slept on."""
+    def __init__(self, oversleep=0.0):
+        self.now = 100.0
+        self.oversleep = oversleep
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds + self.oversleep
+
+class TestFrameScheduler(unittest.TestCase):
+    def test_render_time_does_not_add_up(self):
+        """80 frames take 80 * delay, however long each render takes."""
+        clock = FakeClock()
+        scheduler = FrameScheduler(clock.sleep, clock)
+        scheduler.start()
+        for _ in range(80):
+            clock.now += 0.004  # render
+            self.assertTrue(scheduler.wait(0.01))
+        self.assertAlmostEqual(clock.now - 100.0, 0.8)
+        self.assertAlmostEqual(clock.sleeps[0], 0.006)
+
+    def test_oversleep_is_absorbed(self):
+        """Late wakeups shorten the next sleep rather than drifting, and show up as jitter."""
+        clock = FakeClock(oversleep=0.002)
+        scheduler = FrameScheduler(clock.sleep, clock)
+        scheduler.start()
+        for _ in range(10):
+            scheduler.wait(0.01)
+        self.assertAlmostEqual(clock.now - 100.0, 0.1 + 0.002)
+        self.assertAlmostEqual(clock.sleeps[1], 0.008)
+        report = scheduler.report()
+        self.assertEqual(report["frames"], 10)
+        self.assertAlmostEqual(report["max_jitter_ms"], 2.0)
+
+    def test_skips_frames_when_behind(self):
+        """A stall longer than a frame asks the caller to skip drawing until caught up."""
+        clock = FakeClock()
+        scheduler = FrameScheduler(clock.sleep, clock)
+        scheduler.start()
+        clock.now += 0.035  # a stall of three and a half frames
+        results = [scheduler.wait(0.01) for _ in range(5)]
+        self.assertEqual(results, [False, False, True, True, True])
+        self.assertEqual(scheduler.skipped, 2)
+        self.assertAlmostEqual(clock.now - 100.0, 0.05)
+
+if __name__ == "__main__":
+    unittest.main()
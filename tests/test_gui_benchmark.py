@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Test suite for the offscreen GUI paint benchmark."""
+
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtWidgets import QApplication
+    from src.utils.gui_benchmark import (PaintProbe, deal_cards, run_gui_benchmark,
+                                         format_gui_report)
+    from src.display.gui_display import PunchCardWidget
+    PYQT_AVAILABLE = True
+except ImportError:
+    PYQT_AVAILABLE = False
+
+@unittest.skipUnless(PYQT_AVAILABLE, "PyQt6 not installed")
+class TestGuiBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_deal_cards(self):
+        """Messages run together onto full-width cards."""
+        self.assertEqual(deal_cards(["abc", "defg"], 4), ["ABC ", "DEFG"])
+
+    def test_probe_records_paints_per_section(self):
+        """Paints are timed and their dirty area measured against the widget."""
+        widget = PunchCardWidget()
+        widget.resize(900, 500)
+        widget.show()
+        QApplication.processEvents()
+        probe = PaintProbe(widget)
+        probe.tick(lambda: widget.set_led(0, 0, True))
+        probe.section("hole")
+        probe.tick(lambda: widget.set_led(1, 1, True))
+        probe.tick(lambda: None)
+        probe.section("full")
+        probe.tick(widget.update)
+        widget.close()
+
+        hole, full = probe.sections["hole"], probe.sections["full"]
+        self.assertEqual((len(hole["ticks"]), len(hole["paints"])), (2, 1))
+        self.assertLess(hole["paints"][0][1], 0.01)
+        self.assertEqual(full["paints"][0][1], 1.0)
+
+    def test_offscreen_run(self):
+        """Every workload paints; typing repaints only a sliver of the card."""
+        before = set(os.listdir("."))
+        results = run_gui_benchmark(["HELLO WORLD"], resizes=3, display=False)
+        self.assertEqual(set(os.listdir(".")), before)
+        for name in ("typing", "clear_grid", "splash", "resize"):
+            self.assertGreater(results[name]["paints"], 0, name)
+        self.assertLess(results["typing"]["dirty_ratio"], 0.05)
+        self.assertEqual(results["resize"]["dirty_ratio"], 1.0)
+        self.assertIn("typing", format_gui_report(results))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Test suite for the shared Hollerith encoder."""
+
+import unittest
+from array import array
+
+from src.core.hollerith import (CHAR_MAPPING, ROWS, BLANK, NUMPY_AVAILABLE, encode_char,
+                                encode_text, encode_many, pattern_to_code, code_to_pattern,
+                                punched_rows, describe_code, DECODE_TABLE, UNKNOWN_CHAR,
+                                decode_code, decode_columns, decode_grid, grid_to_codes,
+                                verify_round_trip, verify_displayed)
+
+class TestHollerith(unittest.TestCase):
+    def test_table_matches_char_mapping(self):
+        """Every mapped character encodes to its CHAR_MAPPING pattern."""
+        for char, pattern in CHAR_MAPPING.items():
+            self.assertEqual(code_to_pattern(encode_char(char)), pattern)
+
+    def test_case_folding(self):
+        """Lowercase letters share the uppercase codes."""
+        for char in "abcdefghijklmnopqrstuvwxyz":
+            self.assertEqual(encode_char(char), encode_char(char.upper()))
+
+    def test_unmapped_characters_are_blank(self):
+        """Unmapped and non-Latin-1 characters encode as blank columns."""
+        self.assertEqual(encode_char("\t"), BLANK)
+        self.assertEqual(encode_char("☃"), BLANK)
+        self.assertEqual(encode_text("A☃B").tolist(),
+                         [encode_char("A"), BLANK, encode_char("B")])
+
+    def test_encode_text(self):
+        """Messages encode to one uint16 code per character."""
+        codes = encode_text("HELLO WORLD")
+        self.assertIsInstance(codes, array)
+        self.assertEqual(codes.typecode, "H")
+        self.assertEqual(len(codes), 11)
+        self.assertEqual(codes[0], pattern_to_code(CHAR_MAPPING["H"]))
+        self.assertEqual(codes[5], BLANK)
+
+    def test_encode_text_width(self):
+        """A card width pads or truncates to exactly that many columns."""
+        self.assertEqual(len(encode_text("HI", 80)), 80)
+        self.assertEqual(encode_text("HI", 80)[2:].tolist(), [BLANK] * 78)
+        self.assertEqual(encode_text("X" * 100, 80).tolist(), [encode_char("X")] * 80)
+
+    def test_encode_many(self):
+        """Batches encode each message independently."""
+        batch = encode_many(["A", "BC"], width=3)
+        self.assertEqual([codes.tolist() for codes in batch],
+                         [encode_text("A", 3).tolist(), encode_text("BC", 3).tolist()])
+
+    def test_punched_rows(self):
+        """Codes unpack to grid row indices and labels."""
+        self.assertEqual(punched_rows(encode_char("A")), (0, 3))
+        self.assertEqual(describe_code(encode_char("Z")), "0,9")
+        self.assertEqual(describe_code(BLANK), "no punch")
+        self.assertTrue(all(row < ROWS for row in punched_rows(0xFFF)))
+
+class TestDecoding(unittest.TestCase):
+    def test_reverse_table(self):
+        """Every code in the reverse table encodes back to itself."""
+        self.assertEqual(len(DECODE_TABLE), 4096)
+        for code, char in enumerate(DECODE_TABLE):
+            if char != UNKNOWN_CHAR:
+                self.assertEqual(encode_char(char), code)
+        self.assertEqual(DECODE_TABLE[0xFFF], UNKNOWN_CHAR)
+
+    def test_decode_text(self):
+        """Letters and digits decode as themselves."""
+        text = "HELLO WORLD 1890"
+        self.assertEqual(decode_columns(encode_text(text)), text)
+        self.assertEqual(decode_columns(encode_text("hello")), "HELLO")
+
+    def test_decode_masks_high_bits(self):
+        """Bits beyond the 12 rows are ignored, as in decode_code."""
+        code = encode_char("A")
+        self.assertEqual(decode_code(code | 0xF000), "A")
+        self.assertEqual(decode_columns([code | 0x1000, code]), "AA")
+
+    def test_decode_grid(self):
+        """Row-major LED grids collapse to column codes."""
+        grid = [[0] * 80 for _ in range(ROWS)]
+        for col, code in enumerate(encode_text("PUNCH")):
+            for row in punched_rows(code):
+                grid[row][col] = True
+        self.assertEqual(grid_to_codes(grid).tolist(), encode_text("PUNCH", 80).tolist())
+        self.assertEqual(decode_grid(grid).rstrip(), "PUNCH")
+        self.assertEqual(verify_displayed(grid, "PUNCH"), [])
+        self.assertEqual(verify_displayed(grid, "PINCH"), [1])
+
+    def test_round_trip_report(self):
+        """Shared codes are reported as ambiguous, not as failures."""
+        report = verify_round_trip(["HELLO", "A.B"], keys=[7, 8])
+        self.assertTrue(report.ok)
+        self.assertEqual(report.checked, 2)
+        self.assertEqual(report.ambiguous, [(8, "A.B", "A0B")])
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy is not installed")
+class TestDeckEncoding(unittest.TestCase):
+    def test_deck_matches_column_codes(self):
+        """The vectorized deck agrees with the per-message encoder."""
+        from src.core.hollerith import encode_deck, encode_deck_codes
+        messages = ["HELLO WORLD", "punch card 1890", "", "A☃B"]
+        deck = encode_deck(messages)
+        codes = encode_deck_codes(messages)
+        self.assertEqual(deck.shape, (4, ROWS, 80))
+        self.assertEqual(deck.dtype.name, "uint8")
+        for index, message in enumerate(messages):
+            expected = encode_text(message, 80)
+            self.assertEqual(codes[index].tolist(), expected.tolist())
+            for col, code in enumerate(expected):
+                self.assertEqual(deck[index, :, col].tolist(), code_to_pattern(code))
+
+    def test_packed_deck(self):
+        """Packed decks store one bit per hole."""
+        from src.core.hollerith import encode_deck
+        packed = encode_deck(["A"], packed=True)
+        self.assertEqual(packed.shape, (1, ROWS, 10))
+        self.assertEqual(packed[0, 0, 0], 0b10000000)
+
+    def test_decode_deck(self):
+        """Tensors and code arrays decode back to card-width text."""
+        from src.core.hollerith import encode_deck, encode_deck_codes, decode_deck
+        messages = ["HELLO WORLD", "PUNCH CARD"]
+        self.assertEqual([text.rstrip() for text in decode_deck(encode_deck(messages))], messages)
+        self.assertEqual(decode_deck(encode_deck_codes(messages, 20)), [m.ljust(20) for m in messages])
+
+    def test_hole_heatmap(self):
+        """Heatmaps count punches per hole across the deck."""
+        from src.core.hollerith import hole_heatmap
+        heatmap = hole_heatmap(["A", "A", "B"])
+        self.assertEqual(heatmap[0, 0], 3)
+        self.assertEqual(heatmap[3, 0], 2)
+        self.assertEqual(heatmap.sum(), 6)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Test suite for the background network tasks used by the settings dialog."""
+
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtWidgets import QApplication
+    from src.display.network_tasks import NetworkTaskRunner
+    from src.display import gui_display
+    PYQT_AVAILABLE = True
+except ImportError:
+    PYQT_AVAILABLE = False
+
+def wait_for(condition, timeout=2.0):
+    """Process Qt events until condition() holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.005)
+    return condition()
+
+@unittest.skipUnless(PYQT_AVAILABLE, "PyQt6 not installed")
+class TestNetworkTaskRunner(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.runner = NetworkTaskRunner()
+        self.results = []
+        self.errors = []
+
+    def run_task(self, function, name="task", timeout=1.0):
+        return self.runner.run(name, function, self.results.append, self.errors.append, timeout=timeout)
+
+    def test_result_delivered_on_gui_thread(self):
+        """The call runs on a pool thread; its callback runs on the GUI thread."""
+        callback_threads = []
+        self.runner.run("task", lambda timeout: threading.get_ident(),
+                        lambda result: callback_threads.append((result, threading.get_ident())))
+        self.assertTrue(wait_for(lambda: callback_threads))
+        worker, callback = callback_threads[0]
+        self.assertNotEqual(worker, threading.get_ident())
+        self.assertEqual(callback, threading.get_ident())
+        self.assertFalse(self.runner.is_running("task"))
+
+    def test_timeout_is_passed_and_errors_reported(self):
+        """The function gets the task timeout; its exceptions go to on_error."""
+        def fail(timeout):
+            raise ValueError(f"failed within {timeout}")
+
+        self.run_task(fail, timeout=0.5)
+        self.assertTrue(wait_for(lambda: self.errors))
+        self.assertEqual(str(self.errors[0]), "failed within 0.5")
+        self.assertEqual(self.results, [])
+
+    def test_overrunning_call_times_out(self):
+        """A call that ignores its timeout is reported as a TimeoutError and its late result dropped."""
+        self.run_task(lambda timeout: time.sleep(0.3) or "late", timeout=0.05)
+        self.assertTrue(wait_for(lambda: self.errors))
+        self.assertIsInstance(self.errors[0], TimeoutError)
+        wait_for(lambda: False, timeout=0.4)
+        self.assertEqual(self.results, [])
+        self.assertEqual(len(self.errors), 1)
+
+    def test_cancel_and_replace(self):
+        """Cancelled tasks never call back; a task with the same name replaces the pending one."""
+        release = threading.Event()
+        self.run_task(lambda timeout: release.wait(1) and "first")
+        self.run_task(lambda timeout: "second")
+        self.assertTrue(wait_for(lambda: self.results))
+        release.set()
+        self.run_task(lambda timeout: "third", name="other")
+        self.runner.cancel_all()
+        wait_for(lambda: False, timeout=0.2)
+        self.assertEqual(self.results, ["second"])
+        self.assertEqual(self.errors, [])
+
+@unittest.skipUnless(PYQT_AVAILABLE, "PyQt6 not installed")
+class TestSettingsDialogNetworkCalls(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_service_check_does_not_block(self):
+        """check_openai_service returns at once and fills the label in when the page arrives."""
+        def slow_status(url, timeout):
+            time.sleep(0.2)
+            return "none", "All Systems Operational"
+
+        dialog = gui_display.SettingsDialog()
+        with mock.patch.object(gui_display, "fetch_status", slow_status):
+            started = time.monotonic()
+            dialog.check_openai_service()
+            self.assertLess(time.monotonic() - started, 0.1)
+            self.assertEqual(dialog.service_status_label.text(), "Status: Checking...")
+            self.assertTrue(wait_for(lambda: dialog.service_status_label.text() != "Status: Checking..."))
+        self.assertEqual(dialog.service_status_label.text(), "Status: All systems operational")
+        dialog.reject()
+
+if __name__ == "__main__":
+    unittest.main()
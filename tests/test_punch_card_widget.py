@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Test suite for PunchCardWidget painting."""
+
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtCore import QRect, QRectF
+    from PyQt6.QtWidgets import QApplication
+    from src.core.animations import apply_step, splash_steps
+    from src.core.hollerith import encode_char
+    from src.display.gui_display import PunchCardWidget, COLORS
+    PYQT_AVAILABLE = True
+except ImportError:
+    PYQT_AVAILABLE = False
+
+@unittest.skipUnless(PYQT_AVAILABLE, "PyQt6 not installed")
+class TestPunchCardWidgetPainting(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.widget = PunchCardWidget()
+        self.widget.resize(900, 500)
+        for row, col in [(0, 0), (3, 10), (11, 79), (5, 40), (6, 40)]:
+            self.widget.set_led(row, col, True)
+
+    def hole_center(self, row, col):
+        center = self.widget._hole_geometry().holes[col][row].center()
+        return int(center.x()), int(center.y())
+
+    def test_punched_and_empty_holes(self):
+        """Punched holes are filled over the cached empty card."""
+        image = self.widget.grab().toImage()
+        self.assertEqual(image.pixelColor(*self.hole_center(3, 10)), COLORS['hole_punched'])
+        self.assertEqual(image.pixelColor(*self.hole_center(3, 11)), COLORS['hole_fill'])
+
+    def test_dirty_region_matches_full_paint(self):
+        """Painting only a dirty rectangle gives the same pixels as a full repaint."""
+        full = self.widget.grab().toImage()
+        x, y = self.hole_center(5, 40)
+        dirty = QRect(x - 30, y - 30, 60, 60)
+        partial = self.widget.grab(dirty).toImage()
+        self.assertEqual(partial, full.copy(dirty))
+
+    def test_background_cached_until_resize(self):
+        """The card background is rendered once per size."""
+        self.widget.grab()
+        background = self.widget._background
+        self.widget.set_led(1, 1, True)
+        self.widget.grab()
+        self.assertIs(self.widget._background, background)
+        self.widget.resize(1000, 600)
+        self.widget.grab()
+        self.assertIsNot(self.widget._background, background)
+        self.assertEqual(self.widget._background.deviceIndependentSize().toSize(), self.widget.size())
+        self.widget.update_dimensions()
+        self.assertIsNone(self.widget._background)
+
+    def test_geometry_table(self):
+        """Hole positions are computed once and cover every hole with its update rect."""
+        geometry = self.widget._hole_geometry()
+        self.widget.set_led(2, 2, True)
+        self.assertIs(self.widget._hole_geometry(), geometry)
+        self.assertEqual((len(geometry.holes), len(geometry.holes[0])), (80, 12))
+        for col, row in [(0, 0), (40, 6), (79, 11)]:
+            self.assertTrue(QRectF(geometry.update_rects[col][row]).contains(geometry.holes[col][row]))
+        self.assertLess(geometry.holes[0][0].right(), geometry.holes[1][0].left())
+        self.widget.update_dimensions({'scale_factor': 2, 'top_margin': 4, 'side_margin': 5, 'row_spacing': 2,
+                                       'column_spacing': 1, 'hole_width': 1, 'hole_height': 3})
+        self.assertEqual(self.widget._hole_geometry().holes[0][0].width(), 2)
+
+@unittest.skipUnless(PYQT_AVAILABLE, "PyQt6 not installed")
+class TestPunchCardWidgetBatchedUpdates(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.widget = PunchCardWidget()
+        self.widget.resize(900, 500)
+        self.geometry = self.widget._hole_geometry()
+
+    def test_set_column_requests_one_repaint(self):
+        """A whole character costs one merged update rectangle."""
+        self.widget.set_led(5, 7, True)
+        code = encode_char("A")
+        with mock.patch.object(self.widget, "update") as update:
+            self.assertEqual(self.widget.set_column(7, code), 3)
+            self.assertEqual(self.widget.set_column(7, code), 0)
+        self.assertEqual(self.widget.grid.get_column(7), code)
+        update.assert_called_once()
+        dirty = update.call_args.args[0]
+        for row in range(12):
+            if (code ^ 1 << 5) >> row & 1:
+                self.assertTrue(dirty.contains(self.geometry.update_rects[7][row]))
+
+    def test_set_region_applies_mask_step(self):
+        """A splash step matches apply_step on a CardGrid."""
+        steps = splash_steps(12, 80)
+        expected = self.widget.grid.copy()
+        with mock.patch.object(self.widget, "update") as update:
+            for step in steps[:100]:
+                apply_step(expected, step)
+                self.widget.set_region(step)
+        self.assertEqual(self.widget.grid.diff(expected), [])
+        self.assertLessEqual(update.call_count, 100)
+
+    def test_clear_grid_repaints_punched_columns(self):
+        """Clearing repaints only the area around punched holes."""
+        self.widget.set_column(3, encode_char("Z"))
+        with mock.patch.object(self.widget, "update") as update:
+            self.widget.clear_grid()
+            self.widget.clear_grid()
+        self.assertTrue(self.widget.grid.is_blank())
+        update.assert_called_once()
+        self.assertLess(update.call_args.args[0].width(), 2 * self.geometry.col_pitch + 10)
+
+if __name__ == "__main__":
+    unittest.main()
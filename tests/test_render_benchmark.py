@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Test suite for the headless render benchmark."""
+
+import os
+import unittest
+
+from src.utils.render_benchmark import (RenderSink, FrameRecorder, percentile,
+                                        run_render_benchmark, format_report)
+
+class TestRenderBenchmark(unittest.TestCase):
+    def test_recorder_counts_frames_with_output(self):
+        """Sleeps end frames; sleeps without output are plain delays."""
+        sink = RenderSink()
+        recorder = FrameRecorder(sink)
+        recorder.section("test")
+        sink.write("frame one")
+        recorder.sleep(0.5)
+        recorder.sleep(1.0)
+        sink.write("é")
+        recorder.sleep(0.5)
+        frames = recorder.sections["test"]
+        self.assertEqual([size for _, size in frames], [9, 2])
+        self.assertEqual(recorder.simulated_sleep, 2.0)
+
+    def test_percentile(self):
+        """Nearest-rank percentiles."""
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+    def test_headless_run(self):
+        """show_message runs without sleeping, touching the tty or the working directory."""
+        before = set(os.listdir("."))
+        results = run_render_benchmark(["HELLO WORLD"], animation=False)
+        self.assertEqual(set(os.listdir(".")), before)
+        self.assertGreater(results["show_message"]["frames"], 80)
+        self.assertGreater(results["total"]["simulated_sleep_s"], 0)
+        self.assertIn("show_message", format_report(results))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Test suite for the incremental curses rendering in TerminalDisplay."""
+
+import unittest
+from unittest import mock
+
+from src.core.card_grid import CardGrid
+from src.display import terminal_display
+from src.display.terminal_display import TerminalDisplay, coalesce_messages
+
+class FakeWindow:
+    """Records the curses calls made on a window."""
+    def __init__(self, lines, cols):
+        self.lines, self.cols = lines, cols
+        self.calls = []
+
+    def getmaxyx(self):
+        return self.lines, self.cols
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name,) + args)
+
+    def drawn(self, name="addstr"):
+        return [call for call in self.calls if call[0] == name]
+
+class TestIncrementalCursesRendering(unittest.TestCase):
+    def run_frames(self, frames):
+        """Run _curses_main, feeding one list of queue messages per loop iteration."""
+        display = TerminalDisplay()
+        display.running = True
+        windows = []
+        updates = []
+        pending = list(frames)
+        wait_for_messages = display._wait_for_messages
+
+        def newwin(lines, cols, y, x):
+            windows.append(FakeWindow(lines, cols))
+            return windows[-1]
+
+        def next_frame(timeout=None):
+            # Each wait starts a new frame; an empty frame stands in for an idle wakeup
+            if not pending:
+                display.stop()
+                return wait_for_messages(timeout)
+            for window in windows:
+                window.calls.clear()
+            updates.append(False)
+            messages = pending.pop(0)
+            for message in messages:
+                display.message_queue.put(message)
+            return wait_for_messages(timeout) if messages else []
+
+        fake_curses = mock.patch.multiple(
+            terminal_display.curses, newwin=newwin, curs_set=mock.DEFAULT, use_default_colors=mock.DEFAULT,
+            has_colors=mock.Mock(return_value=False), doupdate=lambda: updates.__setitem__(-1, True))
+        with fake_curses, mock.patch.object(display, "_wait_for_messages", next_frame):
+            updates.append(False)
+            display._curses_main(FakeWindow(40, 120))
+        return display, windows, updates
+
+    def test_idle_frames_write_nothing(self):
+        """Frames with no new messages touch no window and skip doupdate()."""
+        _, windows, updates = self.run_frames([[], []])
+        self.assertEqual(updates, [True, False, False])
+        self.assertTrue(all(not window.calls for window in windows))
+
+    def test_only_changed_cells_are_drawn(self):
+        """A grid update redraws only the LEDs that changed."""
+        grid = CardGrid(12, 80)
+        first = grid.snapshot()
+        grid.set(3, 10, True)
+        display, windows, updates = self.run_frames([[("grid", first)], [("grid", grid.snapshot())]])
+        status_win, debug_win, grid_win = windows
+        self.assertEqual(updates, [True, True, True])
+        # 33-line grid window centers 12 rows at y=10; 80 columns don't fit 120 wide, so x starts at 1
+        self.assertEqual(grid_win.drawn(), [("addstr", 10 + 3, 1 + 10 * 2, display.on_char)])
+        self.assertEqual(grid_win.drawn("clear") + grid_win.drawn("erase"), [])
+        self.assertEqual(status_win.calls + debug_win.calls, [])
+
+    def test_status_change_redraws_status_only(self):
+        """A new status overwrites its line without clearing the other windows."""
+        _, windows, _ = self.run_frames([[("status", "TYPING", "info")]])
+        status_win, debug_win, grid_win = windows
+        self.assertEqual(status_win.drawn(), [("addstr", 1, 2, "Status: TYPING".ljust(116))])
+        self.assertEqual(debug_win.calls + grid_win.calls, [])
+
+class TestMessageCoalescing(unittest.TestCase):
+    def test_newest_grid_wins(self):
+        """Only the last queued grid survives; status and debug keep their order."""
+        messages = [("grid", 1), ("status", "A", "info"), ("grid", 2),
+                    ("debug", "B", "debug"), ("grid", 3), ("status", "C", "info")]
+        self.assertEqual(coalesce_messages(messages),
+                         [("status", "A", "info"), ("debug", "B", "debug"),
+                          ("grid", 3), ("status", "C", "info")])
+
+    def test_wait_drains_queue(self):
+        """A wait returns everything queued, and times out empty when idle."""
+        display = TerminalDisplay()
+        grid = CardGrid(12, 80)
+        for col in range(5):
+            grid.set(0, col, True)
+            display.update_led_grid(grid)
+        display.set_status("DONE")
+        messages = display._wait_for_messages(timeout=0)
+        self.assertEqual([message[0] for message in messages], ["grid", "status"])
+        self.assertEqual(messages[0][1].diff(grid), [])
+        self.assertEqual(display._wait_for_messages(timeout=0), [])
+
+    def test_stop_wakes_idle_fallback_thread(self):
+        """stop() returns promptly even though the fallback thread is blocked waiting."""
+        display = TerminalDisplay()
+        display.use_curses = False
+        with mock.patch("builtins.print"):
+            display.start()
+            thread = display.thread
+            display.stop()
+        self.assertFalse(thread.is_alive())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Test suite for the shared GUI tick scheduler."""
+
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtWidgets import QApplication
+    from src.display.tick_scheduler import TickScheduler
+    PYQT_AVAILABLE = True
+except ImportError:
+    PYQT_AVAILABLE = False
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+@unittest.skipUnless(PYQT_AVAILABLE, "PyQt6 not installed")
+class TestTickScheduler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.ticks = TickScheduler(clock=self.clock)
+        self.calls = []
+
+    def advance(self, ms):
+        """Move the fake clock forward and fire the timer as Qt would."""
+        self.clock.now += ms / 1000
+        self.ticks._run_due()
+
+    def job(self, name, interval, result=None, **kwargs):
+        return self.ticks.add(name, lambda: self.calls.append(name) or result, interval, **kwargs)
+
+    def test_jobs_share_one_timer(self):
+        """Jobs run at their own intervals, and the timer is armed for the next one due."""
+        self.job("fast", 100).start()
+        self.job("slow", 250).start()
+        self.assertEqual(self.ticks._timer.interval(), 100)
+        for _ in range(5):
+            self.advance(100)
+        self.assertEqual(self.calls.count("fast"), 5)
+        self.assertEqual(self.calls.count("slow"), 2)
+        self.assertEqual(self.ticks.wakeups, 5)
+
+    def test_idle_job_suspends_itself(self):
+        """Returning False stops a job, and with nothing active the timer stops too."""
+        poll = self.job("poll", 500, result=False)
+        poll.start()
+        self.advance(500)
+        self.assertFalse(poll.isActive())
+        self.assertFalse(self.ticks._timer.isActive())
+        self.advance(500)
+        self.assertEqual(self.calls, ["poll"])
+
+    def test_single_shot_and_qtimer_methods(self):
+        """Single-shot jobs run once per start(); setInterval restarts an active job."""
+        once = self.job("once", 300, single_shot=True)
+        once.start()
+        self.advance(300)
+        self.advance(300)
+        self.assertEqual(self.calls, ["once"])
+        once.start(50)
+        self.advance(50)
+        self.assertEqual(self.calls, ["once", "once"])
+
+        repeat = self.job("repeat", 1000)
+        repeat.start()
+        self.advance(900)
+        repeat.setInterval(200)
+        self.advance(200)
+        self.assertEqual(self.calls.count("repeat"), 1)
+        self.assertEqual(repeat.interval(), 200)
+        self.assertEqual(self.ticks.active_jobs(), {"repeat": 200})
+
+    def test_no_burst_after_stall(self):
+        """A job that fell far behind runs once, then keeps its interval from now."""
+        self.job("tick", 100).start()
+        self.advance(1000)
+        self.assertEqual(self.calls, ["tick"])
+        self.advance(50)
+        self.assertEqual(self.calls, ["tick"])
+        self.advance(50)
+        self.assertEqual(self.calls, ["tick", "tick"])
+
+    def test_duplicate_names_rejected(self):
+        self.job("clock", 1000)
+        with self.assertRaises(ValueError):
+            self.job("clock", 1000)
+
+if __name__ == "__main__":
+    unittest.main()